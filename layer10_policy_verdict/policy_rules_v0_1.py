@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Mapping, Optional, Protocol, Sequence, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Protocol, Sequence, Tuple
 
 from layer10_policy_verdict.verdict_types_v0_1 import (
     PolicyVerdict,
@@ -70,7 +72,7 @@ def _verdict(
     rule_hit: RuleHit,
     reason_codes: Tuple[str, ...] = (),
     tags: Tuple[str, ...] = (),
-    metadata: Optional[Dict[str, Any]] = None,
+    metadata: Optional[Mapping[str, Any]] = None,
 ) -> PolicyVerdict:
     return PolicyVerdict(
         code=code,
@@ -83,6 +85,71 @@ def _verdict(
     )
 
 
+# ---------------------------------------------------------------------------
+# Flyweights: constant rule outcomes are built once per (rule_id, rule_version)
+# and shared. Metadata is a read-only mapping so shared instances stay immutable.
+# ---------------------------------------------------------------------------
+
+def _frozen_meta(meta: Mapping[str, Any]) -> Mapping[str, Any]:
+    return MappingProxyType(dict(meta))
+
+
+@lru_cache(maxsize=None)
+def _deny_explicit_verdict(rule_id: str, rule_version: str) -> PolicyVerdict:
+    rh = _hit(
+        rule_id=rule_id,
+        rule_version=rule_version,
+        outcome=VerdictCode.DENY,
+        severity=Severity.HIGH,
+        reason="Explicit deny flag present in inputs.",
+        tags=("explicit",),
+    )
+    return _verdict(
+        code=VerdictCode.DENY,
+        severity=Severity.HIGH,
+        summary="Denied by explicit input flag.",
+        rule_hit=rh,
+        reason_codes=("DENY_EXPLICIT",),
+        tags=("policy",),
+        metadata=_frozen_meta({"deny_flag": True}),
+    )
+
+
+@lru_cache(maxsize=None)
+def _abstain_empty_verdict(rule_id: str, rule_version: str) -> PolicyVerdict:
+    rh = _hit(
+        rule_id=rule_id,
+        rule_version=rule_version,
+        outcome=VerdictCode.ABSTAIN,
+        severity=Severity.MED,
+        reason="Empty inputs; cannot evaluate policy.",
+        tags=("empty",),
+    )
+    return _verdict(
+        code=VerdictCode.ABSTAIN,
+        severity=Severity.MED,
+        summary="Abstained due to empty inputs.",
+        rule_hit=rh,
+        reason_codes=("EMPTY_INPUTS",),
+        tags=("policy",),
+        metadata=_frozen_meta({"empty": True}),
+    )
+
+
+@lru_cache(maxsize=256)
+def _missing_keys_hit(rule_id: str, rule_version: str, missing: Tuple[str, ...]) -> RuleHit:
+    # RuleHit is immutable; the verdict itself is not cached because its
+    # metadata carries a (mutable) list of missing keys.
+    return _hit(
+        rule_id=rule_id,
+        rule_version=rule_version,
+        outcome=VerdictCode.WARN,
+        severity=Severity.MED,
+        reason=f"Missing required keys: {', '.join(missing)}",
+        tags=("schema",),
+    )
+
+
 @dataclass(frozen=True, slots=True)
 class RuleDenyExplicitFlag(BaseRule):
     """
@@ -96,23 +163,7 @@ class RuleDenyExplicitFlag(BaseRule):
         if not deny_flag:
             return None
 
-        rh = _hit(
-            rule_id=self.rule_id,
-            rule_version=self.rule_version,
-            outcome=VerdictCode.DENY,
-            severity=Severity.HIGH,
-            reason="Explicit deny flag present in inputs.",
-            tags=("explicit",),
-        )
-        return _verdict(
-            code=VerdictCode.DENY,
-            severity=Severity.HIGH,
-            summary="Denied by explicit input flag.",
-            rule_hit=rh,
-            reason_codes=("DENY_EXPLICIT",),
-            tags=("policy",),
-            metadata={"deny_flag": True},
-        )
+        return _deny_explicit_verdict(self.rule_id, self.rule_version)
 
 
 @dataclass(frozen=True, slots=True)
@@ -133,14 +184,7 @@ class RuleWarnMissingRequiredKeys(BaseRule):
         if not missing:
             return None
 
-        rh = _hit(
-            rule_id=self.rule_id,
-            rule_version=self.rule_version,
-            outcome=VerdictCode.WARN,
-            severity=Severity.MED,
-            reason=f"Missing required keys: {', '.join(missing)}",
-            tags=("schema",),
-        )
+        rh = _missing_keys_hit(self.rule_id, self.rule_version, missing)
         return _verdict(
             code=VerdictCode.WARN,
             severity=Severity.MED,
@@ -163,23 +207,7 @@ class RuleAbstainOnEmptyInputs(BaseRule):
         if ctx.inputs:
             return None
 
-        rh = _hit(
-            rule_id=self.rule_id,
-            rule_version=self.rule_version,
-            outcome=VerdictCode.ABSTAIN,
-            severity=Severity.MED,
-            reason="Empty inputs; cannot evaluate policy.",
-            tags=("empty",),
-        )
-        return _verdict(
-            code=VerdictCode.ABSTAIN,
-            severity=Severity.MED,
-            summary="Abstained due to empty inputs.",
-            rule_hit=rh,
-            reason_codes=("EMPTY_INPUTS",),
-            tags=("policy",),
-            metadata={"empty": True},
-        )
+        return _abstain_empty_verdict(self.rule_id, self.rule_version)
 
 
 def default_rules_v0_1() -> Tuple[PolicyRule, ...]:
@@ -1,11 +1,17 @@
 # layer10_policy_verdict/policy_verdict_engine_v0_1.py
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional, Sequence, Tuple
+from dataclasses import dataclass, replace
+from time import perf_counter_ns
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from layer10_policy_verdict.policy_rules_v0_1 import PolicyRule, RuleContext, default_rules_v0_1
-from layer10_policy_verdict.verdict_types_v0_1 import PolicyVerdict, Severity, VerdictCode, combine_verdicts
+from layer10_policy_verdict.verdict_types_v0_1 import PolicyVerdict, RuleHit, Severity, VerdictCode, combine_verdicts
+from utils.canonical_json import canonical_dumps
+from utils.rule_profiler import RuleProfiler
+
+
+PROFILE_SCOPE = "L10"
 
 
 @dataclass(frozen=True, slots=True)
@@ -15,28 +21,131 @@ class PolicyVerdictEngine:
       - evaluates rules in declared order
       - collects applicable (non-None) verdicts
       - combines verdicts deterministically
+
+    Optional profiler: when set, per-rule calls/hits/wall time are recorded
+    (observational only; verdicts are unchanged).
     """
     rules: Tuple[PolicyRule, ...] = default_rules_v0_1()
+    profiler: Optional[RuleProfiler] = None
 
     def evaluate(self, ctx: RuleContext) -> PolicyVerdict:
         verdicts = []
-        for r in self.rules:
-            v = r.evaluate(ctx)
-            if v is not None:
-                verdicts.append(v)
+        if self.profiler is None:
+            for r in self.rules:
+                v = r.evaluate(ctx)
+                if v is not None:
+                    verdicts.append(v)
+        else:
+            for r in self.rules:
+                t0 = perf_counter_ns()
+                v = r.evaluate(ctx)
+                self.profiler.record(
+                    scope=PROFILE_SCOPE,
+                    rule_id=r.rule_id,
+                    hit=v is not None,
+                    elapsed_ns=perf_counter_ns() - t0,
+                )
+                if v is not None:
+                    verdicts.append(v)
 
         if not verdicts:
-            # If no rule applies, we allow but warn lightly:
-            # v0.1 posture: "not prohibited" ≠ "perfectly safe"
-            return PolicyVerdict(
-                code=VerdictCode.ALLOW,
-                severity=Severity.LOW,
-                summary="No applicable policy rules; default ALLOW.",
-                reason_codes=("DEFAULT_ALLOW",),
-                rule_hits=(),
-                tags=("policy", "default"),
-                metadata={},
-            )
+            return _default_allow()
+        if len(verdicts) == 1:
+            # combine_verdicts([v]) is content-equal to v; keep shared rule verdicts shared
+            return verdicts[0]
 
         return combine_verdicts(verdicts)
 
+    def evaluate_many(self, contexts: Sequence[RuleContext]) -> List[PolicyVerdict]:
+        """
+        Batched evaluate(): one verdict per context, in input order.
+
+        Rules are iterated rule-major (each rule runs over every context before
+        the next rule), and verdicts with identical content are shared:
+          - identical RuleHit / per-rule PolicyVerdict objects are interned
+          - contexts with the same sequence of rule verdicts share one combined verdict
+
+        Each returned verdict is content-equal to evaluate(ctx). Shared instances
+        MUST be treated as immutable (including metadata).
+        """
+        ctxs = tuple(contexts)
+        per_ctx: List[List[PolicyVerdict]] = [[] for _ in ctxs]
+        interner = _VerdictInterner()
+        profiler = self.profiler
+
+        for r in self.rules:
+            rule_eval = r.evaluate
+            if profiler is None:
+                for i, ctx in enumerate(ctxs):
+                    v = rule_eval(ctx)
+                    if v is not None:
+                        per_ctx[i].append(interner.verdict(v))
+            else:
+                rule_id = r.rule_id
+                for i, ctx in enumerate(ctxs):
+                    t0 = perf_counter_ns()
+                    v = rule_eval(ctx)
+                    profiler.record(
+                        scope=PROFILE_SCOPE,
+                        rule_id=rule_id,
+                        hit=v is not None,
+                        elapsed_ns=perf_counter_ns() - t0,
+                    )
+                    if v is not None:
+                        per_ctx[i].append(interner.verdict(v))
+
+        combined: Dict[Tuple[int, ...], PolicyVerdict] = {}
+        out: List[PolicyVerdict] = []
+        for verdicts in per_ctx:
+            # interned verdicts are kept alive by the interner, so id() is a stable key here
+            key = tuple(id(v) for v in verdicts)
+            res = combined.get(key)
+            if res is None:
+                if not verdicts:
+                    res = _default_allow()
+                elif len(verdicts) == 1:
+                    res = verdicts[0]
+                else:
+                    res = combine_verdicts(verdicts)
+                combined[key] = res
+            out.append(res)
+        return out
+
+
+def _default_allow() -> PolicyVerdict:
+    # If no rule applies, we allow but warn lightly:
+    # v0.1 posture: "not prohibited" ≠ "perfectly safe"
+    return PolicyVerdict(
+        code=VerdictCode.ALLOW,
+        severity=Severity.LOW,
+        summary="No applicable policy rules; default ALLOW.",
+        reason_codes=("DEFAULT_ALLOW",),
+        rule_hits=(),
+        tags=("policy", "default"),
+        metadata={},
+    )
+
+
+class _VerdictInterner:
+    """Per-batch content-keyed cache of RuleHit / PolicyVerdict instances."""
+
+    __slots__ = ("_hits", "_verdicts")
+
+    def __init__(self) -> None:
+        self._hits: Dict[RuleHit, RuleHit] = {}
+        self._verdicts: Dict[Tuple[Any, ...], PolicyVerdict] = {}
+
+    def hit(self, rh: RuleHit) -> RuleHit:
+        return self._hits.setdefault(rh, rh)
+
+    def verdict(self, v: PolicyVerdict) -> PolicyVerdict:
+        hits = tuple(self.hit(rh) for rh in v.rule_hits)
+        # metadata MUST be JSON-serializable, so its canonical form is a content key
+        key = (v.code, v.severity, v.summary, v.reason_codes, hits, v.tags, canonical_dumps(dict(v.metadata)))
+        cached = self._verdicts.get(key)
+        if cached is not None:
+            return cached
+        if any(a is not b for a, b in zip(hits, v.rule_hits)):
+            v = replace(v, rule_hits=hits)
+        self._verdicts[key] = v
+        return v
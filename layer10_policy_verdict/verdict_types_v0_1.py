@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 
 class VerdictCode(str, Enum):
@@ -73,8 +73,9 @@ class PolicyVerdict:
     rule_hits: Tuple[RuleHit, ...] = ()
     tags: Tuple[str, ...] = ()
 
-    # Optional metadata (MUST remain JSON-serializable)
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    # Optional metadata (MUST remain JSON-serializable).
+    # Shared (flyweight) verdicts carry a read-only mapping; to_dict() always copies.
+    metadata: Mapping[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         # deterministic output ordering (python preserves insertion order)
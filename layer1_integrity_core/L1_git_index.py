@@ -0,0 +1,112 @@
+# layer1_integrity_core/L1_git_index.py
+"""
+Layer 1 – git index fast path.
+
+Reports which manifest files are tracked and clean, meaning the worktree
+matches the index and the index matches HEAD, together with their index blob
+ids. A clean file's content is fixed by its blob id, so a digest recorded for
+that blob can be reused without reading the file.
+
+Files flagged assume-unchanged or skip-worktree are never reported clean:
+git status does not compare them against the worktree, so their index blob
+says nothing about the bytes on disk.
+
+Purely an optimization: when git is missing, the directory is not a work tree,
+or any git command fails, no files are reported clean and every file is hashed.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+GIT_TIMEOUT_S: float = 30.0
+
+# Regular files only (symlinks / gitlinks are hashed the normal way).
+_REGULAR_MODES = {"100644", "100755"}
+
+# `ls-files -v` tag of a plain cached entry. Lowercase tags mark
+# assume-unchanged, "S" marks skip-worktree; neither is trusted.
+_TRUSTED_TAG = "H"
+
+
+def _git(args: List[str], cwd: Path) -> Optional[bytes]:
+    try:
+        cp = subprocess.run(
+            ["git", "--literal-pathspecs", *args],
+            cwd=str(cwd),
+            capture_output=True,
+            timeout=GIT_TIMEOUT_S,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return cp.stdout if cp.returncode == 0 else None
+
+
+def _index_entries(top: Path) -> Dict[str, str]:
+    """`git ls-files -v -s`: repo-relative path -> blob id (stage 0 regular files, unflagged)."""
+    out = _git(["ls-files", "-v", "-s", "-z", "--full-name"], top)
+    if out is None:
+        return {}
+    entries: Dict[str, str] = {}
+    for rec in out.split(b"\0"):
+        if not rec:
+            continue
+        meta, _, path = rec.partition(b"\t")
+        tag, mode, oid, stage = meta.decode("ascii").split(" ")
+        if tag == _TRUSTED_TAG and mode in _REGULAR_MODES and stage == "0":
+            entries[os.fsdecode(path)] = oid
+    return entries
+
+
+def _dirty_paths(top: Path) -> Optional[Set[str]]:
+    """`git status --porcelain`: repo-relative paths changed vs index or HEAD."""
+    out = _git(["status", "--porcelain=v1", "-z", "--untracked-files=no"], top)
+    if out is None:
+        return None
+    dirty: Set[str] = set()
+    recs = out.split(b"\0")
+    i = 0
+    while i < len(recs):
+        rec = recs[i]
+        i += 1
+        if not rec:
+            continue
+        dirty.add(os.fsdecode(rec[3:]))
+        if rec[:1] in (b"R", b"C"):
+            # rename/copy: the next record is the original path
+            dirty.add(os.fsdecode(recs[i]))
+            i += 1
+    return dirty
+
+
+def clean_tracked_blobs(paths: Iterable[str], *, cwd: Optional[Path] = None) -> Dict[str, str]:
+    """
+    Map each of paths (as given, relative to cwd) that is a tracked, clean
+    regular file to its index blob id. Paths that are dirty, untracked,
+    outside the work tree or unknown to git are omitted.
+    """
+    base = Path(cwd) if cwd is not None else Path.cwd()
+    top_out = _git(["rev-parse", "--show-toplevel"], base)
+    if top_out is None:
+        return {}
+    top = Path(os.fsdecode(top_out.strip()))
+
+    entries = _index_entries(top)
+    dirty = _dirty_paths(top) if entries else None
+    if dirty is None:
+        return {}
+
+    real_top = os.path.realpath(top)
+    clean: Dict[str, str] = {}
+    for p in paths:
+        rel = os.path.relpath(os.path.realpath(base / p), real_top)
+        if rel.startswith(os.pardir):
+            continue
+        rel = Path(rel).as_posix()
+        oid = entries.get(rel)
+        if oid is not None and rel not in dirty:
+            clean[p] = oid
+    return clean
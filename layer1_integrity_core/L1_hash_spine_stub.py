@@ -1,46 +1,460 @@
-# Placeholder for integrity checks
 """
-GUS v4 – Layer 1 Hash Spine stub.
+GUS v4 – Layer 1 Hash Spine.
 
-Skeleton behavior:
-- Provide stable access to the chain log path used by the integrity layer.
-- Reserve function names for future hash-chain operations.
+Append path and indexed reader for the L1 chain log:
+- The chain log is JSONL; each entry carries payload_hash and a chain_hash
+  that links it to the previous entry (see chain.gus_chain_v4_stub).
+- ChainAppender batches appends and fsyncs every `fsync_every` entries (and
+  on flush/close), so it can serve as a high-rate event spine.
+- A sparse offset index (<log>.idx.jsonl) records the byte offset and
+  timestamp of every `index_stride`-th entry. ChainReader uses it to seek to
+  entry K or to a timestamp while scanning at most one stride of lines.
 
-No real chain logic is implemented here yet.
+The index is derived data: it is only written after the log lines it points
+at are durable, and it is rebuilt from the log when missing or short. The
+log is git-tracked but the index is not, so an index record is checked
+against the log before use (line start, same timestamp). On a mismatch the
+appender rebuilds the index and the reader scans from the start.
+
+event_id: entries written here use GUSv4-L{layer}-{entry number}. The
+original genesis entries used GUSv4-L1-{unix seconds}, which is not unique
+at more than one event per second. Verification never reads event_id, so
+both forms coexist in one log.
+
+Single writer: an appender holds an exclusive lock on <log>.lock from open
+until close(). A second appender on the same log, in this process or
+another, fails fast with ChainLogLockedError instead of forking the chain
+from the same prev_hash.
 """
 
 from __future__ import annotations
 
+import bisect
+import json
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
 
 from utils import get_guardian_logger
 
+from .chain.gus_chain_v4_stub import GENESIS_PREV_HASH, compute_chain_hash, compute_payload_hash
+
 logger = get_guardian_logger("GUSv4.Layer1.HashSpine")
 
 BASE_DIR = Path(__file__).resolve().parent
 CHAIN_DIR = BASE_DIR / "chain"
 CHAIN_LOG_FILE = CHAIN_DIR / "gus_chain_log_placeholder.txt"
 
+CHAIN_INDEX_SUFFIX = ".idx.jsonl"
+CHAIN_LOCK_SUFFIX = ".lock"
+CHAIN_INDEX_STRIDE = 256
+CHAIN_FSYNC_EVERY = 64
+
 
 def get_chain_log_path() -> Path:
     """
-    Return the path to the chain log placeholder.
+    Return the path to the chain log.
 
-    Higher layers can rely on this path being stable, even before
-    real chain logic is implemented.
+    Higher layers can rely on this path being stable.
     """
     return CHAIN_LOG_FILE
 
 
+def get_chain_index_path(log_path: Union[str, Path, None] = None) -> Path:
+    p = Path(log_path) if log_path is not None else CHAIN_LOG_FILE
+    return p.with_name(p.name + CHAIN_INDEX_SUFFIX)
+
+
+class ChainLogLockedError(RuntimeError):
+    """Another appender already holds the chain log's writer lock."""
+
+
+class ChainLogTornTailError(RuntimeError):
+    """The chain log ends in an incomplete line; reopen with repair=True to drop it."""
+
+
+class ChainLogCorruptError(RuntimeError):
+    """A complete line of the chain log is not a chain entry; never repaired automatically."""
+
+
+def _acquire_writer_lock(lock_path: Path) -> BinaryIO:
+    fh = lock_path.open("a+b")
+    try:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:  # pragma: no cover - Windows
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError as exc:
+        fh.close()
+        raise ChainLogLockedError(f"chain log is already open for appending: {lock_path}") from exc
+    return fh
+
+
+def _release_writer_lock(fh: BinaryIO) -> None:
+    try:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+        else:  # pragma: no cover - Windows
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+    finally:
+        fh.close()
+
+
+def _utc_now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds")
+
+
+def _encode_entry(entry: Dict[str, Any]) -> bytes:
+    # Same serialization as the existing log lines (sorted keys, UTF-8 kept as-is).
+    return (json.dumps(entry, sort_keys=True, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+@dataclass(frozen=True)
+class ChainIndexRecord:
+    entry: int  # 1-based entry number
+    offset: int  # byte offset where the entry's line starts
+    timestamp: str
+
+
+def _load_index(index_path: Path) -> List[ChainIndexRecord]:
+    records: List[ChainIndexRecord] = []
+    try:
+        with index_path.open("rb") as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    d = json.loads(line)
+                    rec = ChainIndexRecord(int(d["entry"]), int(d["offset"]), str(d["timestamp"]))
+                except (ValueError, KeyError, TypeError):
+                    break
+                if records and rec.entry <= records[-1].entry:
+                    break
+                records.append(rec)
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def _write_index(index_path: Path, records: List[ChainIndexRecord], *, mode: str) -> None:
+    if not records and mode == "ab":
+        return
+    data = b"".join(
+        (json.dumps({"entry": r.entry, "offset": r.offset, "timestamp": r.timestamp}, sort_keys=True) + "\n").encode(
+            "utf-8"
+        )
+        for r in records
+    )
+    with index_path.open(mode) as f:
+        f.write(data)
+
+
+def _decode_entry(line: bytes, offset: int, path: Any) -> Dict[str, Any]:
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        entry = None
+    if not isinstance(entry, dict) or not isinstance(entry.get("chain_hash"), str):
+        raise ChainLogCorruptError(f"chain log {path}: line at offset {offset} is not a chain entry")
+    return entry
+
+
+def _index_record_matches(f: BinaryIO, record: ChainIndexRecord) -> bool:
+    """True if record.offset starts a complete entry line carrying record.timestamp."""
+    if record.offset > 0:
+        f.seek(record.offset - 1)
+        if f.read(1) != b"\n":
+            return False
+    f.seek(record.offset)
+    line = f.readline()
+    try:
+        entry = json.loads(line) if line.endswith(b"\n") else None
+    except ValueError:
+        return False
+    return isinstance(entry, dict) and entry.get("timestamp") == record.timestamp
+
+
+def _iter_lines(f: BinaryIO, offset: int) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield (line offset, entry) for complete, non-blank lines from offset; stops at a torn tail."""
+    f.seek(offset)
+    pos = offset
+    for line in f:
+        if not line.endswith(b"\n"):
+            return
+        start, pos = pos, pos + len(line)
+        if line.strip():
+            yield start, _decode_entry(line, start, getattr(f, "name", "?"))
+
+
+class ChainAppender:
+    """
+    Batched, fsync'd appender for the L1 chain log.
+
+    On open the tail of the log is recovered from the sparse index (at most
+    one stride is scanned) and missing or stale index records are rebuilt.
+    A torn final line left by a crash fails closed (ChainLogTornTailError);
+    it is truncated only when the caller opts in with repair=True. A
+    malformed complete line raises ChainLogCorruptError.
+
+    Durability: an entry is durable once flush() returns (called
+    automatically every `fsync_every` appends and on close()). Appended
+    timestamps never go backwards, so the log stays sorted by timestamp.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        *,
+        fsync_every: int = CHAIN_FSYNC_EVERY,
+        index_stride: int = CHAIN_INDEX_STRIDE,
+        clock_utc: Optional[Callable[[], str]] = None,
+        repair: bool = False,
+    ) -> None:
+        if fsync_every < 1 or index_stride < 1:
+            raise ValueError("fsync_every and index_stride must be >= 1")
+        self.path = Path(path) if path is not None else CHAIN_LOG_FILE
+        self.index_path = get_chain_index_path(self.path)
+        self._fsync_every = fsync_every
+        self._stride = index_stride
+        self._clock = clock_utc or _utc_now_iso
+        self._repair = repair
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer_lock = _acquire_writer_lock(self.path.with_name(self.path.name + CHAIN_LOCK_SUFFIX))
+        try:
+            self.entries, self.last_hash, self._last_ts, self._size = self._recover()
+            self._fh: Optional[BinaryIO] = self.path.open("ab")
+        except BaseException:
+            _release_writer_lock(self._writer_lock)
+            raise
+        self._pending = 0
+        self._pending_index: List[ChainIndexRecord] = []
+
+    # -- recovery -----------------------------------------------------------
+
+    def _recover(self) -> Tuple[int, str, str, int]:
+        self.path.touch(exist_ok=True)
+        size = self.path.stat().st_size
+        loaded = _load_index(self.index_path)
+        index = [r for r in loaded if r.offset < size]
+        if index:
+            with self.path.open("rb") as f:
+                if not _index_record_matches(f, index[-1]):
+                    logger.warning("Chain index %s does not match the log; rebuilding it", self.index_path)
+                    index = []
+        state = self._scan_tail(index)
+        if state is None:  # index points at nothing usable: rebuild from the start
+            index = []
+            state = self._scan_tail(index)
+        entries, last_hash, last_ts, end, new_records = state
+
+        if end < size:
+            if not self._repair:
+                raise ChainLogTornTailError(
+                    f"chain log {self.path} ends in an incomplete line ({size - end} bytes after offset {end})"
+                )
+            logger.warning("Chain log %s: repair=True, truncating torn tail (%d bytes)", self.path, size - end)
+            with self.path.open("r+b") as f:
+                f.truncate(end)
+                os.fsync(f.fileno())
+
+        if new_records or len(index) != len(loaded):
+            _write_index(self.index_path, index + new_records, mode="wb")
+        return entries, last_hash, last_ts, end
+
+    def _scan_tail(self, index: List[ChainIndexRecord]) -> Optional[Tuple[int, str, str, int, List[ChainIndexRecord]]]:
+        """Scan from the last index record to the end of the last complete line."""
+        base = index[-1] if index else ChainIndexRecord(1, 0, "")
+        entries, last_hash, last_ts, end = base.entry - 1, GENESIS_PREV_HASH, "", base.offset
+        new_records: List[ChainIndexRecord] = []
+        with self.path.open("rb") as f:
+            f.seek(base.offset)
+            while True:
+                line = f.readline()
+                if not line.endswith(b"\n"):
+                    break
+                start, end = end, end + len(line)
+                if not line.strip():
+                    continue
+                entry = _decode_entry(line, start, self.path)
+                entries += 1
+                last_hash, last_ts = entry["chain_hash"], entry.get("timestamp", last_ts)
+                if (entries - 1) % self._stride == 0 and (not index or entries > base.entry):
+                    new_records.append(ChainIndexRecord(entries, start, last_ts))
+        if index and entries < base.entry:
+            return None
+        return entries, last_hash, last_ts, end, new_records
+
+    # -- appending ----------------------------------------------------------
+
+    def append(
+        self,
+        event_type: str,
+        payload: Any,
+        *,
+        note: Optional[str] = None,
+        layer: int = 1,
+    ) -> Dict[str, Any]:
+        """Append one event and return the written entry (durable after the next flush)."""
+        with self._lock:
+            if self._fh is None:
+                raise ValueError("chain appender is closed")
+            timestamp = max(self._clock(), self._last_ts)
+            payload_hash = compute_payload_hash(payload)
+            entry: Dict[str, Any] = {
+                "chain_hash": compute_chain_hash(self.last_hash, timestamp, event_type, payload_hash),
+                "event_id": f"GUSv4-L{layer}-{self.entries + 1}",
+                "event_type": event_type,
+                "layer": layer,
+                "note": note,
+                "payload": payload,
+                "payload_hash": payload_hash,
+                "prev_hash": self.last_hash,
+                "timestamp": timestamp,
+            }
+            line = _encode_entry(entry)
+            self._fh.write(line)
+
+            self.entries += 1
+            if (self.entries - 1) % self._stride == 0:
+                self._pending_index.append(ChainIndexRecord(self.entries, self._size, timestamp))
+            self._size += len(line)
+            self.last_hash, self._last_ts = entry["chain_hash"], timestamp
+            self._pending += 1
+            if self._pending >= self._fsync_every:
+                self._flush_locked()
+            return entry
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if self._fh is None or (not self._pending and not self._pending_index):
+            return
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        # Index records only ever point at durable log lines.
+        _write_index(self.index_path, self._pending_index, mode="ab")
+        self._pending = 0
+        self._pending_index = []
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is None:
+                return
+            try:
+                self._flush_locked()
+                self._fh.close()
+            finally:
+                self._fh = None
+                _release_writer_lock(self._writer_lock)
+
+    def __enter__(self) -> "ChainAppender":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+class ChainReader:
+    """
+    Random access into the chain log via the sparse index.
+
+    The index is reloaded when its file changes, so a reader can follow a
+    live appender. Only durable, newline-terminated lines are returned. An
+    index record that does not match the log is ignored (with the rest of
+    the index, until the index file changes) and the log is read from the
+    start instead.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None) -> None:
+        self.path = Path(path) if path is not None else CHAIN_LOG_FILE
+        self.index_path = get_chain_index_path(self.path)
+        self._index: List[ChainIndexRecord] = []
+        self._index_sig: Optional[Tuple[int, int]] = None
+
+    def _records(self) -> List[ChainIndexRecord]:
+        try:
+            st = self.index_path.stat()
+            sig: Optional[Tuple[int, int]] = (st.st_size, st.st_mtime_ns)
+        except FileNotFoundError:
+            sig = None
+        if sig != self._index_sig:
+            self._index = _load_index(self.index_path) if sig is not None else []
+            self._index_sig = sig
+        return self._index
+
+    def _start_at(self, pos: int) -> ChainIndexRecord:
+        index = self._records()
+        return index[pos] if pos >= 0 and index else ChainIndexRecord(1, 0, "")
+
+    def iter_from(self, record: ChainIndexRecord) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield (entry number, entry) starting at an index record."""
+        if not self.path.exists():
+            return
+        with self.path.open("rb") as f:
+            if (record.entry, record.offset) != (1, 0) and not _index_record_matches(f, record):
+                logger.warning("Chain index %s does not match the log; reading from the start", self.index_path)
+                self._index = []
+                record = ChainIndexRecord(1, 0, "")
+            for k, (_, entry) in enumerate(_iter_lines(f, record.offset), start=record.entry):
+                yield k, entry
+
+    def get(self, k: int) -> Optional[Dict[str, Any]]:
+        """Entry number k (1-based), or None if the log has fewer entries."""
+        if k < 1:
+            raise ValueError("chain entries are numbered from 1")
+        pos = bisect.bisect_right([r.entry for r in self._records()], k) - 1
+        for n, entry in self.iter_from(self._start_at(pos)):
+            if n == k:
+                return entry
+        return None
+
+    def iter_since(self, timestamp: str) -> Iterator[Dict[str, Any]]:
+        """Entries with entry["timestamp"] >= timestamp (ISO-8601 UTC, as written by ChainAppender)."""
+        pos = bisect.bisect_left([r.timestamp for r in self._records()], timestamp) - 1
+        for _, entry in self.iter_from(self._start_at(pos)):
+            if entry.get("timestamp", "") >= timestamp:
+                yield entry
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for _, entry in self.iter_from(ChainIndexRecord(1, 0, "")):
+            yield entry
+
+
+def append_chain_event(
+    event_type: str,
+    payload: Any,
+    *,
+    note: Optional[str] = None,
+    layer: int = 1,
+    path: Union[str, Path, None] = None,
+) -> Dict[str, Any]:
+    """Append a single event durably. For sustained rates keep a ChainAppender open instead."""
+    with ChainAppender(path, fsync_every=1) as appender:
+        return appender.append(event_type, payload, note=note, layer=layer)
+
+
 def append_chain_event_stub(event: str) -> Optional[Path]:
     """
-    Placeholder for future hash-chain append function.
+    Placeholder kept for existing callers; side-effect free.
 
-    In skeleton mode:
-    - It logs that an event would be written.
-    - It does NOT write anything to disk.
-    - It returns the log path for informational purposes.
+    It only logs the event and returns the log path. It does NOT write to
+    the git-tracked chain log. Use append_chain_event() or a ChainAppender
+    to persist events.
     """
     logger.info("Hash spine stub received event (not persisted): %s", event)
     return CHAIN_LOG_FILE
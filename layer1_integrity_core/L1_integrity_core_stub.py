@@ -3,16 +3,39 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Callable, Optional, Tuple
+import codecs
 import hashlib
 import json
+import os
+import tempfile
+import threading
+import time
+
+from .L1_git_index import clean_tracked_blobs
 
 # Location of the Layer-1 manifest. PAS Phase 3 populates this file.
 L1_MANIFEST_PATH: Path = Path("layer1_integrity_core/L1_manifest_baseline.json")
 L1_STATUS_PATH: Path = Path("logs/integrity/L1_integrity_status.json")
 
+# Upper bound for concurrent file hashing (hashlib releases the GIL on large buffers).
+L1_MAX_HASH_WORKERS: int = min(32, (os.cpu_count() or 1) + 4)
+
+# Persistent (path, size, mtime_ns, inode) -> normalized sha256 cache.
+# Purely an optimization: unreadable or mismatched caches are ignored.
+L1_HASH_CACHE_PATH: Path = Path("logs/integrity/L1_hash_cache.json")
+L1_HASH_CACHE_VERSION: str = "L1_hash_cache_v0.1"
+
+# Files modified this recently are not cached: a same-size rewrite within the
+# filesystem's timestamp granularity would otherwise keep an identical signature.
+_RACY_WINDOW_NS: int = 2_000_000_000
+
+# Read size for streaming file hashing (bounded memory per file).
+_HASH_CHUNK_SIZE: int = 1 << 20
+
 
 @dataclass
 class IntegrityIssue:
@@ -61,7 +84,7 @@ def _load_manifest() -> Dict[str, Any]:
         }
 
 
-def _hash_file(path: Path) -> str:
+def _hash_file(path: Path, tee: Any = None) -> str:
     """
     Deterministic file hashing across OS / checkout policies.
 
@@ -69,122 +92,272 @@ def _hash_file(path: Path) -> str:
       - decode as UTF-8 (strict). If that works, normalize CRLF -> LF and hash bytes.
     Binary files:
       - hash raw bytes.
+
+    Streaming: the file is read in _HASH_CHUNK_SIZE chunks; UTF-8 validity is
+    checked incrementally and CRLF is normalized on the bytes (CR/LF never occur
+    inside a UTF-8 multi-byte sequence). A trailing CR is held back until the
+    next chunk so a CRLF split across chunks is still normalized.
+
+    tee (optional hashlib object) is fed the raw bytes as they are read.
     """
-    data = path.read_bytes()
+    raw = hashlib.sha256()
+    norm = hashlib.sha256()
+    decoder = codecs.getincrementaldecoder("utf-8")("strict")
+    is_text = True
+    pending_cr = b""
+
+    with path.open("rb") as f:
+        while True:
+            chunk = f.read(_HASH_CHUNK_SIZE)
+            if not chunk:
+                break
+            raw.update(chunk)
+            if tee is not None:
+                tee.update(chunk)
+            if not is_text:
+                continue
+            try:
+                decoder.decode(chunk)
+            except UnicodeDecodeError:
+                # Binary: raw bytes hash
+                is_text = False
+                continue
+            chunk = pending_cr + chunk
+            pending_cr = b"\r" if chunk.endswith(b"\r") else b""
+            if pending_cr:
+                chunk = chunk[:-1]
+            norm.update(chunk.replace(b"\r\n", b"\n"))
+
+    if is_text:
+        try:
+            decoder.decode(b"", final=True)  # truncated multi-byte sequence at EOF
+        except UnicodeDecodeError:
+            is_text = False
+    if not is_text:
+        return raw.hexdigest()
 
-    # Text-normalization path (UTF-8 strict)
-    try:
-        txt = data.decode("utf-8")  # strict
-    except UnicodeDecodeError:
-        # Binary: raw bytes hash
-        return hashlib.sha256(data).hexdigest()
+    norm.update(pending_cr)
+    return norm.hexdigest()
 
-    # Normalize line endings for cross-platform stability
-    norm = txt.replace("\r\n", "\n").encode("utf-8")
-    return hashlib.sha256(norm).hexdigest()
 
+def _stat_signature(st: os.stat_result) -> Dict[str, int]:
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "ino": st.st_ino}
 
 
-def verify_integrity() -> Tuple[bool, List[IntegrityIssue]]:
+class _HashCache:
     """
-    Core verification primitive used by higher-level health checks.
+    On-disk stat-keyed cache of _hash_file() digests (thread-safe).
 
-    Returns:
-        (ok, issues)
-        ok      – True if all required files match the manifest hashes.
-        issues  – List of IntegrityIssue entries describing any problems.
+    An entry is reused only if the file's (size, mtime_ns, inode) signature is
+    unchanged. Saved caches hold only the files seen in the current run,
+    unless save(merge=True) keeps the unseen ones too (partial runs).
+
+    blobs maps git blob id -> digest. A blob digest is recorded only after the
+    bytes read hash to that blob id, so it is exact for clean git files.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._lock = threading.Lock()
+        self._old: Dict[str, Dict[str, Any]] = {}
+        self._new: Dict[str, Dict[str, Any]] = {}
+        self._old_blobs: Dict[str, str] = {}
+        self._new_blobs: Dict[str, str] = {}
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            if raw.get("version") == L1_HASH_CACHE_VERSION and isinstance(raw.get("entries"), dict):
+                self._old = raw["entries"]
+                if isinstance(raw.get("blobs"), dict):
+                    self._old_blobs = raw["blobs"]
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def hash_file(self, p: Path, blob_oid: Optional[str] = None) -> str:
+        if blob_oid is not None:
+            with self._lock:
+                digest = self._old_blobs.get(blob_oid)
+            if isinstance(digest, str):
+                with self._lock:
+                    self._new_blobs[blob_oid] = digest
+                return digest
+
+        key = os.path.abspath(p)
+        st = p.stat()
+        sig = _stat_signature(st)
+        with self._lock:
+            cached = self._old.get(key)
+        if isinstance(cached, dict) and all(cached.get(k) == v for k, v in sig.items()):
+            digest = cached.get("sha256")
+            if isinstance(digest, str):
+                with self._lock:
+                    self._new[key] = cached
+                return digest
+
+        if blob_oid is None:
+            digest = _hash_file(p)
+        else:
+            # git object id: sha1 (40 hex) or sha256 (64 hex) over "blob <size>\0" + content
+            tee = hashlib.new("sha1" if len(blob_oid) == 40 else "sha256", b"blob %d\0" % st.st_size)
+            digest = _hash_file(p, tee)
+            if tee.hexdigest() == blob_oid:
+                with self._lock:
+                    self._new_blobs[blob_oid] = digest
+
+        # Only cache if the file did not change while we read it and is not racy.
+        if _stat_signature(p.stat()) == sig and time.time_ns() - st.st_mtime_ns > _RACY_WINDOW_NS:
+            with self._lock:
+                self._new[key] = {**sig, "sha256": digest}
+        return digest
+
+    def save(self, *, merge: bool = False) -> None:
+        entries = {**self._old, **self._new} if merge else self._new
+        blobs = {**self._old_blobs, **self._new_blobs} if merge else self._new_blobs
+        if entries == self._old and blobs == self._old_blobs:
+            return
+        tmp_name = None
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(prefix=self._path.name + ".", dir=str(self._path.parent))
+            with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+                json.dump(
+                    {"version": L1_HASH_CACHE_VERSION, "entries": entries, "blobs": blobs},
+                    f,
+                    sort_keys=True,
+                )
+            os.replace(tmp_name, self._path)
+        except OSError:
+            pass  # cache is best-effort; verification result is unaffected
+        finally:
+            if tmp_name is not None and os.path.exists(tmp_name):
+                os.remove(tmp_name)
+
+
+def _check_entry(
+    entry: Dict[str, Any],
+    cache: Optional[_HashCache] = None,
+    blobs: Optional[Dict[str, str]] = None,
+) -> FileIntegrityResult:
+    """Verify one manifest entry, hashing its file at most once."""
+    path_str = entry.get("path")
+    expected = entry.get("sha256")
+    p = Path(path_str) if path_str else None
+    actual = None
+    if p is not None and p.exists():
+        if cache is None:
+            actual = _hash_file(p)
+        else:
+            actual = cache.hash_file(p, (blobs or {}).get(path_str))
+
+    reason: Optional[str] = None
+    if not path_str or not expected:
+        reason = "manifest entry missing path or sha256"
+    elif actual is None:
+        reason = "missing"
+    elif actual != expected:
+        reason = f"hash mismatch (expected={expected}, actual={actual})"
+
+    return FileIntegrityResult(
+        path=str(p) if p is not None else str(path_str),
+        expected_hash=expected,
+        actual_hash=actual,
+        ok=reason is None,
+        reason=reason,
+    )
+
+
+def _check_entries(
+    files: List[Dict[str, Any]],
+    *,
+    max_workers: Optional[int] = None,
+    strict: bool = False,
+    use_git_index: bool = False,
+    merge_cache: bool = False,
+) -> List[FileIntegrityResult]:
+    """
+    Check manifest entries (see _check_manifest for the options); results in entry order.
+
+    merge_cache=True keeps cache entries for files not in this call; use it when
+    files is only a subset of what shares L1_HASH_CACHE_PATH.
+    """
+    if not files:
+        return []
+
+    cache = None if strict else _HashCache(L1_HASH_CACHE_PATH)
+    blobs: Dict[str, str] = {}
+    if use_git_index and cache is not None:
+        blobs = clean_tracked_blobs([e["path"] for e in files if isinstance(e.get("path"), str) and e["path"]])
+
+    workers = min(max_workers or L1_MAX_HASH_WORKERS, len(files))
+    if workers <= 1:
+        results = [_check_entry(entry, cache, blobs) for entry in files]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # map() yields in submission (manifest) order regardless of completion order
+            results = list(pool.map(lambda entry: _check_entry(entry, cache, blobs), files))
+    if cache is not None:
+        cache.save(merge=merge_cache)
+    return results
+
+
+def _check_manifest(
+    *, max_workers: Optional[int] = None, strict: bool = False, use_git_index: bool = False
+) -> Tuple[bool, List[FileIntegrityResult], List[IntegrityIssue]]:
+    """
+    Single-pass L1 engine: hashes every manifest file exactly once and returns
+    (ok, per-file results, issues), both lists in manifest order.
+
+    Files are hashed concurrently on a bounded thread pool (max_workers,
+    default L1_MAX_HASH_WORKERS). Unless strict, digests of files whose stat
+    signature is unchanged come from L1_HASH_CACHE_PATH; strict re-reads
+    every file and neither reads nor writes the cache.
+
+    use_git_index (ignored when strict): files that git reports tracked and
+    clean reuse the digest recorded for their index blob id without being read.
     """
     manifest = _load_manifest()
     files = manifest.get("files", [])
 
     if not files:
         # No files registered yet – this is an explicit red flag at this stage.
-        return False, [
+        return False, [], [
             IntegrityIssue(
                 path=str(L1_MANIFEST_PATH),
                 reason="Layer 1 integrity manifest has no files registered",
             )
         ]
 
-    issues: List[IntegrityIssue] = []
+    results = _check_entries(files, max_workers=max_workers, strict=strict, use_git_index=use_git_index)
+    issues = [IntegrityIssue(path=r.path, reason=r.reason or "") for r in results if not r.ok]
+    return not issues, results, issues
 
-    for entry in files:
-        path_str = entry.get("path")
-        expected = entry.get("sha256")
-        if not path_str or not expected:
-            issues.append(
-                IntegrityIssue(
-                    path=str(path_str),
-                    reason="manifest entry missing path or sha256",
-                )
-            )
-            continue
-
-        p = Path(path_str)
-        if not p.exists():
-            issues.append(
-                IntegrityIssue(
-                    path=str(p),
-                    reason="missing",
-                )
-            )
-            continue
-
-        actual = _hash_file(p)
-        if actual != expected:
-            issues.append(
-                IntegrityIssue(
-                    path=str(p),
-                    reason=f"hash mismatch (expected={expected}, actual={actual})",
-                )
-            )
 
-    ok = not issues
-    return ok, issues
+def verify_integrity(
+    *, max_workers: Optional[int] = None, strict: bool = False, use_git_index: bool = False
+) -> Tuple[bool, List[IntegrityIssue]]:
+    """
+    Core verification primitive used by higher-level health checks.
 
+    Issues are always reported in manifest order. strict=True bypasses the
+    persistent hash cache (full re-read for audits). use_git_index=True lets
+    clean tracked files skip reading entirely (see _check_manifest).
 
-def run_integrity_check() -> IntegrityStatus:
-    """
-    Higher-level helper that expands verify_integrity() into a structured object.
+    Returns:
+        (ok, issues)
+        ok      – True if all required files match the manifest hashes.
+        issues  – List of IntegrityIssue entries describing any problems.
     """
-    manifest = _load_manifest()
-    files = manifest.get("files", [])
+    ok, _, issues = _check_manifest(max_workers=max_workers, strict=strict, use_git_index=use_git_index)
+    return ok, issues
 
-    ok, issues = verify_integrity()
-    issues_by_path = {iss.path: iss for iss in issues}
-
-    results: List[FileIntegrityResult] = []
-    for entry in files:
-        path_str = entry.get("path")
-        expected = entry.get("sha256")
-        p = Path(path_str)
-        issue = issues_by_path.get(str(p)) or issues_by_path.get(path_str)
-
-        if issue is None:
-            # File exists and hash matched.
-            actual = _hash_file(p) if p.exists() else None
-            results.append(
-                FileIntegrityResult(
-                    path=str(p),
-                    expected_hash=expected,
-                    actual_hash=actual,
-                    ok=True,
-                    reason=None,
-                )
-            )
-        else:
-            # Something went wrong for this file.
-            actual = _hash_file(p) if p.exists() else None
-            results.append(
-                FileIntegrityResult(
-                    path=str(p),
-                    expected_hash=expected,
-                    actual_hash=actual,
-                    ok=False,
-                    reason=issue.reason,
-                )
-            )
 
+def run_integrity_check(
+    *, max_workers: Optional[int] = None, strict: bool = False, use_git_index: bool = False
+) -> IntegrityStatus:
+    """
+    Higher-level helper that expands the check into a structured object
+    (same single pass as verify_integrity(); no file is hashed twice).
+    """
+    ok, results, _ = _check_manifest(max_workers=max_workers, strict=strict, use_git_index=use_git_index)
     return IntegrityStatus(overall_ok=ok, files=results)
 
 
@@ -201,13 +374,53 @@ def summarize_integrity_status(status: IntegrityStatus) -> IntegritySummary:
     )
 
 
+# Set by a running integrity watcher (L1_integrity_watcher): returns its live status.
+_LIVE_STATUS_PROVIDER: Optional[Callable[[], IntegrityStatus]] = None
+
+
+def set_live_status_provider(provider: Optional[Callable[[], IntegrityStatus]]) -> None:
+    global _LIVE_STATUS_PROVIDER
+    _LIVE_STATUS_PROVIDER = provider
+
+
+def write_integrity_status(status: IntegrityStatus) -> None:
+    """Persist a simple snapshot for inspection / later PAS use."""
+    L1_STATUS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    L1_STATUS_PATH.write_text(
+        json.dumps(
+            {
+                "overall_ok": status.overall_ok,
+                "files": [
+                    {
+                        "path": f.path,
+                        "expected_hash": f.expected_hash,
+                        "actual_hash": f.actual_hash,
+                        "ok": f.ok,
+                        "reason": f.reason,
+                    }
+                    for f in status.files
+                ],
+            },
+            indent=2,
+            sort_keys=False,
+        ),
+        encoding="utf-8",
+    )
+
+
 def load_integrity_status() -> IntegrityStatus:
     """
-    Load the last persisted status if available, otherwise run a fresh check.
+    Return the live status of a running integrity watcher if there is one;
+    otherwise load the last persisted status if available, otherwise run a
+    fresh check.
 
     For now this is a thin convenience wrapper; PAS can later evolve this
     into a richer time-series log.
     """
+    provider = _LIVE_STATUS_PROVIDER
+    if provider is not None:
+        return provider()
+
     if L1_STATUS_PATH.exists():
         try:
             raw = json.loads(L1_STATUS_PATH.read_text(encoding="utf-8"))
@@ -231,26 +444,5 @@ def load_integrity_status() -> IntegrityStatus:
             pass  # pragma: no cover
 
     status = run_integrity_check()
-    # Persist a simple snapshot for inspection / later PAS use.
-    L1_STATUS_PATH.parent.mkdir(parents=True, exist_ok=True)
-    L1_STATUS_PATH.write_text(
-        json.dumps(
-            {
-                "overall_ok": status.overall_ok,
-                "files": [
-                    {
-                        "path": f.path,
-                        "expected_hash": f.expected_hash,
-                        "actual_hash": f.actual_hash,
-                        "ok": f.ok,
-                        "reason": f.reason,
-                    }
-                    for f in status.files
-                ],
-            },
-            indent=2,
-            sort_keys=False,
-        ),
-        encoding="utf-8",
-    )
+    write_integrity_status(status)
     return status
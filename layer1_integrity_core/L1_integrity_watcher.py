@@ -0,0 +1,309 @@
+# layer1_integrity_core/L1_integrity_watcher.py
+"""
+Layer 1 – continuous integrity watcher.
+
+Keeps the L1 integrity status current without repeated full checks:
+  - one full check at start (run_integrity_check, strict: no cache),
+  - then only files reported changed are re-hashed (strict, no cache),
+  - the status file (L1_STATUS_PATH) is rewritten only when the status changes,
+  - on_change(IntegrityChangeEvent) is called for every status change.
+
+While started, load_integrity_status() returns the watcher's live status.
+
+Change detection backends:
+  - inotify (Linux, via ctypes): watches the parent directory of every manifest
+    file, so atomic replace/rename is seen too; IN_MODIFY covers truncate()
+    and writes through a descriptor or mmap that is never closed.
+  - polling fallback: compares (size, mtime_ns, inode) every poll interval.
+
+A change to the manifest itself triggers a full re-check.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from . import L1_integrity_core_stub as core
+from .L1_integrity_core_stub import FileIntegrityResult, IntegrityStatus
+
+# inotify(7) event masks
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+# Sentinel "path" meaning: everything may have changed (overflow, watch lost).
+RESCAN_ALL = "*"
+
+
+@dataclass(frozen=True)
+class IntegrityChangeEvent:
+    overall_ok_before: bool
+    overall_ok: bool
+    changed: Tuple[FileIntegrityResult, ...]
+
+
+class _PollingBackend:
+    """Detects changes by comparing stat signatures every poll."""
+
+    def __init__(self, paths: List[str], interval: float) -> None:
+        self._interval = interval
+        self._sigs = {p: self._sig(p) for p in paths}
+        self._stop = threading.Event()
+
+    @staticmethod
+    def _sig(path: str) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime_ns, st.st_ino)
+
+    def wait(self, timeout: Optional[float]) -> Set[str]:
+        self._stop.wait(self._interval if timeout is None else min(self._interval, timeout))
+        changed: Set[str] = set()
+        for p, old in self._sigs.items():
+            new = self._sig(p)
+            if new != old:
+                self._sigs[p] = new
+                changed.add(p)
+        return changed
+
+    def wake(self) -> None:
+        self._stop.set()
+
+    def close(self) -> None:
+        self._stop.set()
+
+
+class _InotifyBackend:
+    """Linux inotify via ctypes; watches parent directories of the given paths."""
+
+    def __init__(self, paths: List[str]) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify requires Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._libc = libc
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._wake_r, self._wake_w = os.pipe()
+
+        self._by_dir: Dict[str, Dict[str, str]] = {}
+        for p in paths:
+            d, name = os.path.split(os.path.abspath(p))
+            self._by_dir.setdefault(d, {})[name] = p
+
+        self._wds: Dict[int, str] = {}
+        try:
+            for d in self._by_dir:
+                wd = libc.inotify_add_watch(self._fd, os.fsencode(d), _WATCH_MASK)
+                if wd < 0:
+                    raise OSError(ctypes.get_errno(), f"inotify_add_watch failed: {d}")
+                self._wds[wd] = d
+        except OSError:
+            self.close()
+            raise
+
+    def wait(self, timeout: Optional[float]) -> Set[str]:
+        ready, _, _ = select.select([self._fd, self._wake_r], [], [], timeout)
+        if self._wake_r in ready:
+            os.read(self._wake_r, 4096)
+        if self._fd not in ready:
+            return set()
+
+        changed: Set[str] = set()
+        try:
+            buf = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return changed
+        off = 0
+        while off + _EVENT_HEADER.size <= len(buf):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, off)
+            off += _EVENT_HEADER.size
+            name = os.fsdecode(buf[off:off + length].rstrip(b"\0"))
+            off += length
+            if mask & (_IN_Q_OVERFLOW | _IN_IGNORED | _IN_DELETE_SELF | _IN_MOVE_SELF):
+                changed.add(RESCAN_ALL)
+                continue
+            target = self._by_dir.get(self._wds.get(wd, ""), {}).get(name)
+            if target is not None:
+                changed.add(target)
+        return changed
+
+    def wake(self) -> None:
+        try:
+            os.write(self._wake_w, b"\0")
+        except OSError:
+            pass
+
+    def close(self) -> None:
+        for fd in (self._fd, self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+
+
+@dataclass
+class _State:
+    manifest_entries: List[Dict[str, object]] = field(default_factory=list)
+    results: List[FileIntegrityResult] = field(default_factory=list)
+    overall_ok: bool = False
+
+
+class IntegrityWatcher:
+    """
+    Long-running L1 watcher.
+
+    Use step() to process one batch of changes (tests / custom loops), or
+    start()/stop() to run it on a daemon thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        on_change: Optional[Callable[[IntegrityChangeEvent], None]] = None,
+        poll_interval: float = 1.0,
+        use_inotify: bool = True,
+    ) -> None:
+        self._on_change = on_change
+        self._poll_interval = poll_interval
+        self._use_inotify = use_inotify
+        self._lock = threading.Lock()
+        self._state = _State()
+        self._backend: Optional[object] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._rescan(emit=False)
+        core.write_integrity_status(self.status())
+
+    @property
+    def backend_name(self) -> str:
+        return "inotify" if isinstance(self._backend, _InotifyBackend) else "polling"
+
+    def status(self) -> IntegrityStatus:
+        with self._lock:
+            return IntegrityStatus(overall_ok=self._state.overall_ok, files=list(self._state.results))
+
+    def _watched_paths(self) -> List[str]:
+        paths = [str(core.L1_MANIFEST_PATH)]
+        for e in self._state.manifest_entries:
+            p = e.get("path")
+            if isinstance(p, str) and p and p not in paths:
+                paths.append(p)
+        return paths
+
+    def _open_backend(self) -> None:
+        if self._backend is not None:
+            self._backend.close()
+        paths = self._watched_paths()
+        if self._use_inotify:
+            try:
+                self._backend = _InotifyBackend(paths)
+                return
+            except (OSError, AttributeError):
+                pass  # no inotify (platform, libc, missing directory): fall back to polling
+        self._backend = _PollingBackend(paths, self._poll_interval)
+
+    def _rescan(self, *, emit: bool) -> None:
+        # Watch first, then check: nothing changed in between can be missed.
+        entries = list(core._load_manifest().get("files", []))
+        with self._lock:
+            self._state.manifest_entries = entries
+        self._open_backend()
+        status = core.run_integrity_check(strict=True)
+        self._apply(entries, status.files, status.overall_ok, emit=emit)
+
+    def _apply(
+        self,
+        entries: List[Dict[str, object]],
+        results: List[FileIntegrityResult],
+        overall_ok: bool,
+        *,
+        emit: bool,
+    ) -> None:
+        with self._lock:
+            before_ok = self._state.overall_ok
+            before = self._state.results
+            self._state = _State(manifest_entries=entries, results=results, overall_ok=overall_ok)
+        if not emit:
+            return
+        changed = tuple(r for i, r in enumerate(results) if i >= len(before) or before[i] != r)
+        if changed or before_ok != overall_ok or len(before) != len(results):
+            core.write_integrity_status(self.status())
+            if self._on_change is not None:
+                self._on_change(IntegrityChangeEvent(before_ok, overall_ok, changed))
+
+    def step(self, timeout: Optional[float] = None) -> bool:
+        """Wait up to timeout for changes and re-verify them; True if the status changed."""
+        changed = {RESCAN_ALL} if self._backend is None else self._backend.wait(timeout)
+        if not changed:
+            return False
+        before = self.status()
+
+        if RESCAN_ALL in changed or str(core.L1_MANIFEST_PATH) in changed:
+            self._rescan(emit=True)
+        else:
+            with self._lock:
+                entries = self._state.manifest_entries
+                results = list(self._state.results)
+            for i, entry in enumerate(entries):
+                if entry.get("path") in changed:
+                    results[i] = core._check_entry(entry)  # fresh hash; bypasses the cache
+            issues = [r for r in results if not r.ok]
+            self._apply(entries, results, bool(results) and not issues, emit=True)
+
+        return self.status() != before
+
+    def start(self) -> "IntegrityWatcher":
+        if self._thread is not None:
+            return self
+        self._stopping.clear()
+        core.set_live_status_provider(self.status)
+        self._thread = threading.Thread(target=self._run, name="L1-integrity-watcher", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self.step(timeout=self._poll_interval)
+
+    def stop(self) -> None:
+        self._stopping.set()
+        if self._backend is not None:
+            self._backend.wake()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if core._LIVE_STATUS_PROVIDER == self.status:
+            core.set_live_status_provider(None)
+        if self._backend is not None:
+            self._backend.close()
+            self._backend = None
+
+    def __enter__(self) -> "IntegrityWatcher":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
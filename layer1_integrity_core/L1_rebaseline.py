@@ -0,0 +1,101 @@
+# layer1_integrity_core/L1_rebaseline.py
+"""
+Layer 1 – manifest rebaseline.
+
+Recomputes the L1 baseline after a deliberate change:
+  - file set = current manifest entries (in order) + add - remove,
+  - files are hashed in parallel with _hash_file (same normalization as
+    verification; never served from the hash cache),
+  - the manifest is written through utils.canonical_json.write_canonical_json_file,
+  - a diff of changed / added / removed entries is returned for review.
+
+Fail-closed: a rebaseline never records a missing file.
+"""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from utils.canonical_json import write_canonical_json_file
+
+from . import L1_integrity_core_stub as core
+
+
+@dataclass
+class ManifestDiff:
+    changed: List[Tuple[str, str, str]] = field(default_factory=list)  # (path, old, new)
+    added: List[Tuple[str, str]] = field(default_factory=list)  # (path, sha256)
+    removed: List[Tuple[str, str]] = field(default_factory=list)  # (path, old sha256)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.changed or self.added or self.removed)
+
+    def lines(self) -> List[str]:
+        out = [f"~ {p} {old} -> {new}" for p, old, new in self.changed]
+        out += [f"+ {p} {h}" for p, h in self.added]
+        out += [f"- {p} {h}" for p, h in self.removed]
+        return out
+
+
+def hash_paths(paths: Sequence[str], *, max_workers: Optional[int] = None) -> Dict[str, str]:
+    """Hash paths in parallel; raises FileNotFoundError listing every missing path."""
+    missing = [p for p in paths if not Path(p).is_file()]
+    if missing:
+        raise FileNotFoundError(f"cannot baseline missing files: {missing}")
+    workers = max(1, min(max_workers or core.L1_MAX_HASH_WORKERS, len(paths)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        digests = list(pool.map(lambda p: core._hash_file(Path(p)), paths))
+    return dict(zip(paths, digests))
+
+
+def rebaseline_manifest(
+    manifest: Mapping[str, Any],
+    *,
+    add: Iterable[str] = (),
+    remove: Iterable[str] = (),
+    max_workers: Optional[int] = None,
+) -> Tuple[Dict[str, Any], ManifestDiff]:
+    """Return (new manifest, diff). Keys other than "files" are carried over unchanged."""
+    old = {e["path"]: e.get("sha256") for e in manifest.get("files", []) if e.get("path")}
+    drop = set(remove)
+    unknown = sorted(drop - set(old))
+    if unknown:
+        raise ValueError(f"cannot remove paths not in the manifest: {unknown}")
+
+    paths = [p for p in old if p not in drop]
+    paths += [p for p in dict.fromkeys(add) if p not in old]
+    digests = hash_paths(paths, max_workers=max_workers)
+
+    diff = ManifestDiff()
+    for p in paths:
+        if p not in old:
+            diff.added.append((p, digests[p]))
+        elif old[p] != digests[p]:
+            diff.changed.append((p, str(old[p]), digests[p]))
+    diff.removed = [(p, str(old[p])) for p in old if p in drop]
+
+    new_manifest = dict(manifest)
+    new_manifest["files"] = [{"path": p, "sha256": digests[p]} for p in paths]
+    return new_manifest, diff
+
+
+def rebaseline(
+    manifest_path: Union[str, Path, None] = None,
+    *,
+    add: Iterable[str] = (),
+    remove: Iterable[str] = (),
+    max_workers: Optional[int] = None,
+    dry_run: bool = False,
+) -> ManifestDiff:
+    """Rebaseline the manifest on disk (default L1_MANIFEST_PATH); returns the diff."""
+    path = Path(manifest_path) if manifest_path is not None else core.L1_MANIFEST_PATH
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    new_manifest, diff = rebaseline_manifest(manifest, add=add, remove=remove, max_workers=max_workers)
+    if not dry_run and not diff.empty:
+        write_canonical_json_file(path, new_manifest)
+    return diff
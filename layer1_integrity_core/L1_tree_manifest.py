@@ -0,0 +1,300 @@
+# layer1_integrity_core/L1_tree_manifest.py
+"""
+Layer 1 – Merkle directory-tree manifest.
+
+Same file set and file digests as the flat L1 manifest (_hash_file), arranged
+as a tree over the repo layout with one hash per directory:
+
+    dir_hash = hash_payload({"kind": TREE_NODE_KIND,
+                             "dirs":  {name: child dir_hash, ...},
+                             "files": {name: file sha256, ...}})
+
+root_hash commits to every path and digest. It can be fed to the genesis
+spine in place of the flat manifest hash (see tree_root_hash_for_spine()).
+
+Verification walks the expected tree against the working tree. Each
+directory gets a stat signature (size, mtime_ns, inode of its files, plus its
+subdirectories' signatures). A subtree whose signature and expected hash
+match the last successful run (L1_TREE_STAT_CACHE_PATH) is skipped without
+reading any file. Otherwise the walk descends into it, and only files in
+directories whose own files changed are hashed, using the L1 hashing engine.
+strict=True ignores the stat cache and hashes every file.
+
+On-disk format:
+    {"version": TREE_MANIFEST_VERSION, "root_hash": H, "root": node}
+    node = {"hash": H, "dirs": {name: node}, "files": {name: sha256}}
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from utils.canonical_json import write_canonical_json_file
+from utils.hash_tools_stub import hash_payload
+
+from . import L1_integrity_core_stub as core
+from .L1_integrity_core_stub import IntegrityIssue
+
+TREE_MANIFEST_VERSION = "L1_tree_manifest_v0.1"
+TREE_NODE_KIND = "L1_dir_v1"
+
+# Local, machine-specific record of directories verified by the last run.
+L1_TREE_STAT_CACHE_PATH: Path = Path("logs/integrity/L1_tree_stat_cache.json")
+TREE_STAT_CACHE_VERSION = "L1_tree_stat_cache_v0.1"
+
+
+def _split(path: str) -> Tuple[str, ...]:
+    pp = PurePosixPath(Path(path).as_posix())
+    if pp.is_absolute() or not pp.parts or any(part in ("", ".", "..") for part in pp.parts):
+        raise ValueError(f"tree manifest paths must be relative and inside the tree: {path!r}")
+    return pp.parts
+
+
+def _node_hash(dirs: Mapping[str, Mapping[str, Any]], files: Mapping[str, str]) -> str:
+    return hash_payload(
+        {
+            "kind": TREE_NODE_KIND,
+            "dirs": {name: child["hash"] for name, child in dirs.items()},
+            "files": dict(files),
+        }
+    )
+
+
+def build_tree(entries: Iterable[Tuple[str, str]]) -> Dict[str, Any]:
+    """Build the hashed tree from (relative path, sha256) pairs."""
+    root: Dict[str, Any] = {"dirs": {}, "files": {}}
+    for path, digest in entries:
+        *dirs, name = _split(path)
+        node = root
+        for d in dirs:
+            if d in node["files"]:
+                raise ValueError(f"path is both a file and a directory: {path!r}")
+            node = node["dirs"].setdefault(d, {"dirs": {}, "files": {}})
+        if name in node["dirs"] or name in node["files"]:
+            raise ValueError(f"duplicate or conflicting tree manifest path: {path!r}")
+        node["files"][name] = digest
+    return _seal(root)
+
+
+def _seal(node: Dict[str, Any]) -> Dict[str, Any]:
+    dirs = {name: _seal(child) for name, child in sorted(node["dirs"].items())}
+    files = dict(sorted(node["files"].items()))
+    return {"hash": _node_hash(dirs, files), "dirs": dirs, "files": files}
+
+
+def tree_manifest_from_flat(flat_manifest: Mapping[str, Any]) -> Dict[str, Any]:
+    """Convert a flat L1 manifest ({"files": [{"path", "sha256"}]}) into a tree manifest."""
+    entries = [(e["path"], e["sha256"]) for e in flat_manifest.get("files", [])]
+    root = build_tree(entries)
+    return {"version": TREE_MANIFEST_VERSION, "root_hash": root["hash"], "root": root}
+
+
+def write_tree_manifest(path: Union[str, Path], tree_manifest: Mapping[str, Any]) -> None:
+    write_canonical_json_file(path, tree_manifest)
+
+
+def iter_tree_files(node: Mapping[str, Any], prefix: str = "") -> Iterator[Tuple[str, str]]:
+    """All (path, sha256) leaves: a directory's files (sorted) before its subdirectories (sorted)."""
+    for name, digest in node["files"].items():
+        yield prefix + name, digest
+    for name, child in node["dirs"].items():
+        yield from iter_tree_files(child, f"{prefix}{name}/")
+
+
+def check_tree_hashes(tree_manifest: Mapping[str, Any]) -> List[str]:
+    """Re-derive every directory hash; returns the directories whose stored hash is wrong."""
+    bad: List[str] = []
+
+    def walk(node: Mapping[str, Any], prefix: str) -> str:
+        dirs = {}
+        for name, child in node["dirs"].items():
+            walk(child, f"{prefix}{name}/")
+            dirs[name] = child
+        expected = _node_hash(dirs, node["files"])
+        if expected != node.get("hash"):
+            bad.append(prefix or "/")
+        return expected
+
+    root_hash = walk(tree_manifest["root"], "")
+    if root_hash != tree_manifest.get("root_hash") and "/" not in bad:
+        bad.append("/")
+    return bad
+
+
+@dataclass
+class TreeDiff:
+    # (path, expected sha256 or None, actual sha256 or None), sorted by path
+    changes: List[Tuple[str, Optional[str], Optional[str]]] = field(default_factory=list)
+    dirs_visited: int = 0
+
+
+def diff_trees(expected: Mapping[str, Any], actual: Mapping[str, Any]) -> TreeDiff:
+    """Top-down comparison: subtrees with equal hashes are skipped entirely."""
+    out = TreeDiff()
+
+    def walk(e: Optional[Mapping[str, Any]], a: Optional[Mapping[str, Any]], prefix: str) -> None:
+        if e is not None and a is not None and e["hash"] == a["hash"]:
+            return
+        out.dirs_visited += 1
+        e_files = e["files"] if e is not None else {}
+        a_files = a["files"] if a is not None else {}
+        for name in sorted(set(e_files) | set(a_files)):
+            if e_files.get(name) != a_files.get(name):
+                out.changes.append((prefix + name, e_files.get(name), a_files.get(name)))
+        e_dirs = e["dirs"] if e is not None else {}
+        a_dirs = a["dirs"] if a is not None else {}
+        for name in sorted(set(e_dirs) | set(a_dirs)):
+            walk(e_dirs.get(name), a_dirs.get(name), f"{prefix}{name}/")
+
+    walk(expected, actual, "")
+    out.changes.sort(key=lambda c: c[0])
+    return out
+
+
+# (subtree signature, direct-files signature); None when a member is missing
+# or was modified within the racy window, so the directory cannot be trusted.
+_DirSig = Tuple[Optional[str], Optional[str]]
+
+
+def _dir_signatures(
+    node: Mapping[str, Any], base: Path, prefix: str, now_ns: int, out: Dict[str, _DirSig]
+) -> Optional[str]:
+    """Stat every file once, bottom-up; fills out[prefix] and returns the subtree signature."""
+    members: Dict[str, Dict[str, int]] = {}
+    files_ok = True
+    for name in node["files"]:
+        try:
+            st = (base / (prefix + name)).stat()
+        except OSError:
+            files_ok = False
+            continue
+        if now_ns - st.st_mtime_ns <= core._RACY_WINDOW_NS:
+            files_ok = False
+        members[name] = core._stat_signature(st)
+
+    tree_ok = files_ok
+    children: Dict[str, Optional[str]] = {}
+    for name, child in node["dirs"].items():
+        children[name] = _dir_signatures(child, base, f"{prefix}{name}/", now_ns, out)
+        tree_ok = tree_ok and children[name] is not None
+
+    files_sig = hash_payload({"files": members}) if files_ok else None
+    tree_sig = hash_payload({"files": members, "dirs": children}) if tree_ok else None
+    out[prefix] = (tree_sig, files_sig)
+    return tree_sig
+
+
+def _load_stat_cache(base: Path) -> Dict[str, Dict[str, str]]:
+    try:
+        data = json.loads(L1_TREE_STAT_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != TREE_STAT_CACHE_VERSION:
+        return {}
+    if data.get("base") != str(base.resolve()) or not isinstance(data.get("dirs"), dict):
+        return {}
+    return data["dirs"]
+
+
+def _save_stat_cache(base: Path, dirs: Mapping[str, Mapping[str, str]]) -> None:
+    try:
+        write_canonical_json_file(
+            L1_TREE_STAT_CACHE_PATH,
+            {"version": TREE_STAT_CACHE_VERSION, "base": str(base.resolve()), "dirs": dict(dirs)},
+        )
+    except OSError:
+        pass  # best-effort: a missing cache only costs re-hashing
+
+
+def _issue_for(path: str, result: core.FileIntegrityResult) -> IntegrityIssue:
+    if result.actual_hash is None:
+        return IntegrityIssue(path=path, reason="missing")
+    reason = f"hash mismatch (expected={result.expected_hash}, actual={result.actual_hash})"
+    return IntegrityIssue(path=path, reason=reason)
+
+
+def verify_tree_manifest(
+    tree_manifest: Mapping[str, Any],
+    *,
+    base: Union[str, Path] = ".",
+    max_workers: Optional[int] = None,
+    strict: bool = False,
+    use_git_index: bool = False,
+) -> Tuple[bool, List[IntegrityIssue]]:
+    """
+    Verify the working tree under base against a tree manifest.
+
+    Subtrees whose stat signature and expected hash are unchanged since the
+    last successful run are skipped. Only files in directories whose own
+    files changed are hashed. Issues are sorted by path.
+    """
+    issues: List[IntegrityIssue] = [
+        IntegrityIssue(path=d, reason="tree manifest directory hash mismatch") for d in check_tree_hashes(tree_manifest)
+    ]
+    if issues:
+        return False, issues
+
+    base = Path(base)
+    sigs: Dict[str, _DirSig] = {}
+    cached: Dict[str, Dict[str, str]] = {}
+    if not strict:
+        _dir_signatures(tree_manifest["root"], base, "", time.time_ns(), sigs)
+        cached = _load_stat_cache(base)
+
+    to_check: List[Tuple[str, str]] = []
+    walked: List[Tuple[str, Mapping[str, Any]]] = []
+
+    def walk(node: Mapping[str, Any], prefix: str) -> None:
+        tree_sig, files_sig = sigs.get(prefix, (None, None))
+        prev = cached.get(prefix, {})
+        if tree_sig is not None and prev.get("tree") == tree_sig and prev.get("hash") == node["hash"]:
+            return
+        walked.append((prefix, node))
+        files_hash = hash_payload(node["files"])
+        if not (files_sig is not None and prev.get("files") == files_sig and prev.get("files_hash") == files_hash):
+            to_check.extend((prefix + name, digest) for name, digest in node["files"].items())
+        for name, child in node["dirs"].items():
+            walk(child, f"{prefix}{name}/")
+
+    walk(tree_manifest["root"], "")
+
+    results = core._check_entries(
+        [{"path": str(base / p), "sha256": h} for p, h in to_check],
+        max_workers=max_workers,
+        strict=strict,
+        use_git_index=use_git_index,
+        merge_cache=True,  # only a subset is checked; keep the rest of the shared cache
+    )
+    issues = sorted(
+        (_issue_for(p, r) for (p, _), r in zip(to_check, results) if not r.ok),
+        key=lambda i: i.path,
+    )
+
+    if not strict:
+        bad = [i.path for i in issues]
+        dirs = {k: v for k, v in cached.items() if k in sigs}
+        for prefix, node in walked:
+            tree_sig, files_sig = sigs[prefix]
+            if tree_sig is None or any(p.startswith(prefix) for p in bad):
+                dirs.pop(prefix, None)
+                continue
+            dirs[prefix] = {
+                "tree": tree_sig,
+                "files": files_sig,
+                "files_hash": hash_payload(node["files"]),
+                "hash": node["hash"],
+            }
+        if dirs != cached:
+            _save_stat_cache(base, dirs)
+    return not issues, issues
+
+
+def tree_root_hash_for_spine(flat_manifest_path: Optional[Path] = None) -> str:
+    """Root hash of the L1 baseline (as a tree), for use as the L1 genesis spine input."""
+    path = Path(flat_manifest_path) if flat_manifest_path is not None else core.L1_MANIFEST_PATH
+    flat = json.loads(path.read_text(encoding="utf-8"))
+    return tree_manifest_from_flat(flat)["root_hash"]
@@ -12,13 +12,25 @@ Design:
 
 The final L2 chain_hash is used as the global genesis_hash embedded into
 PAS seals and other lineage-critical artifacts.
+
+manifest_hashes can override a layer's manifest_hash, e.g. to anchor L1 on
+the Merkle tree root of its baseline (L1_tree_manifest.tree_root_hash_for_spine)
+instead of the hash of the flat manifest JSON.
+
+Manifest hashes are memoized per layer, keyed on the manifest's
+(size, mtime_ns, inode); a call with unchanged manifests costs three stat()
+calls and no reads. When one layer's manifest changes only that layer is
+re-hashed, and only the spine entries from that layer onward are re-chained.
 """
 
 from __future__ import annotations
 
+import threading
+import time
 from pathlib import Path
-from typing import Dict, List, Optional, TypedDict
+from typing import Dict, List, Mapping, Optional, Tuple, TypedDict
 
+from layer1_integrity_core.L1_integrity_core_stub import _RACY_WINDOW_NS, _stat_signature
 from utils.hash_tools_stub import hash_payload
 
 
@@ -49,6 +61,22 @@ LAYER_MANIFESTS: Dict[str, Path] = {
 }
 
 
+_SPINE_LAYERS = ("L0", "L1", "L2")
+
+# A manifest modified within _RACY_WINDOW_NS may still change within the same
+# mtime tick, so its hash is not memoized. The window and the stat signature
+# are shared with the L1 hash cache (L1_integrity_core_stub).
+_cache_lock = threading.Lock()
+_manifest_hash_cache: Dict[str, Tuple[Path, Dict[str, int], str]] = {}
+_last_spine: List[LayerSpineEntry] = []
+
+
+def clear_genesis_spine_cache() -> None:
+    with _cache_lock:
+        _manifest_hash_cache.clear()
+        _last_spine.clear()
+
+
 def _load_manifest(layer_id: str) -> Dict:
     import json  # local import to keep module import light
 
@@ -93,41 +121,84 @@ def _compute_chain_hash(
     return hash_payload(payload)
 
 
-def compute_l0_l1_l2_spine() -> List[LayerSpineEntry]:
+def _manifest_signature(path: Path) -> Optional[Dict[str, int]]:
+    try:
+        return _stat_signature(path.stat())
+    except OSError:
+        return None
+
+
+def _cached_manifest_hash(layer_id: str) -> str:
+    """manifest_hash for a layer, re-read only when the manifest's stat signature changed."""
+    path = LAYER_MANIFESTS.get(layer_id)
+    sig = _manifest_signature(path) if path is not None else None
+    if sig is not None:
+        with _cache_lock:
+            hit = _manifest_hash_cache.get(layer_id)
+        if hit is not None and hit[0] == path and hit[1] == sig:
+            return hit[2]
+
+    manifest_hash = _compute_manifest_hash(_load_manifest(layer_id))
+    if sig is not None and time.time_ns() - sig["mtime_ns"] > _RACY_WINDOW_NS and _manifest_signature(path) == sig:
+        with _cache_lock:
+            _manifest_hash_cache[layer_id] = (path, sig, manifest_hash)
+    return manifest_hash
+
+
+def compute_l0_l1_l2_spine(manifest_hashes: Optional[Mapping[str, str]] = None) -> List[LayerSpineEntry]:
     """
     Build the ordered L0→L1→L2 spine.
 
     Returns a list of LayerSpineEntry dicts. The final entry's chain_hash
     is the canonical genesis_hash for the current repo state.
+
+    manifest_hashes: optional per-layer manifest_hash overrides (layer_id -> hash).
     """
+    overrides = dict(manifest_hashes or {})
+    manifest_hashes_by_layer = [
+        overrides[layer_id] if layer_id in overrides else _cached_manifest_hash(layer_id)
+        for layer_id in _SPINE_LAYERS
+    ]
+    manifest_paths = [str(LAYER_MANIFESTS[layer_id].relative_to(PROJECT_ROOT)) for layer_id in _SPINE_LAYERS]
+
+    with _cache_lock:
+        previous = list(_last_spine)
+
     spine: List[LayerSpineEntry] = []
     parent_hash: Optional[str] = None
-
-    for layer_id in ("L0", "L1", "L2"):
-        manifest_payload = _load_manifest(layer_id)
-        manifest_hash = _compute_manifest_hash(manifest_payload)
-        chain_hash = _compute_chain_hash(layer_id, manifest_hash, parent_hash)
-
-        entry: LayerSpineEntry = {
-            "layer_id": layer_id,
-            "manifest_path": str(LAYER_MANIFESTS[layer_id].relative_to(PROJECT_ROOT)),
-            "manifest_hash": manifest_hash,
-            "parent_hash": parent_hash,
-            "chain_hash": chain_hash,
-        }
+    for i, layer_id in enumerate(_SPINE_LAYERS):
+        manifest_hash = manifest_hashes_by_layer[i]
+        prev = previous[i] if i < len(previous) else None
+        if (
+            prev is not None
+            and prev["manifest_hash"] == manifest_hash
+            and prev["parent_hash"] == parent_hash
+            and prev["manifest_path"] == manifest_paths[i]
+        ):
+            entry: LayerSpineEntry = dict(prev)  # type: ignore[assignment]
+        else:
+            entry = {
+                "layer_id": layer_id,
+                "manifest_path": manifest_paths[i],
+                "manifest_hash": manifest_hash,
+                "parent_hash": parent_hash,
+                "chain_hash": _compute_chain_hash(layer_id, manifest_hash, parent_hash),
+            }
         spine.append(entry)
-        parent_hash = chain_hash
+        parent_hash = entry["chain_hash"]
 
+    with _cache_lock:
+        _last_spine[:] = [dict(e) for e in spine]  # type: ignore[misc]
     return spine
 
 
-def get_genesis_hash() -> str:
+def get_genesis_hash(manifest_hashes: Optional[Mapping[str, str]] = None) -> str:
     """
     Return the canonical genesis hash derived from the current L0→L2 spine.
 
     This is simply the chain_hash of the final L2 spine entry.
     """
-    spine = compute_l0_l1_l2_spine()
+    spine = compute_l0_l1_l2_spine(manifest_hashes)
     if not spine:
         raise RuntimeError("Genesis spine is empty; expected at least L0, L1, L2")
     return spine[-1]["chain_hash"]
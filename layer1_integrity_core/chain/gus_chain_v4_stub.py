@@ -1,5 +1,7 @@
+from dataclasses import dataclass, field
+from hashlib import sha256
 from pathlib import Path
-from typing import Tuple, List
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 import logging
 import json
 
@@ -8,6 +10,12 @@ logger = logging.getLogger("GUSv4.Chain")
 # Single source of truth for the L1 chain log path
 CHAIN_LOG_PATH = Path(__file__).parent / "gus_chain_log_placeholder.txt"
 
+# Where verify_chain_incremental() records how far the log has been verified
+CHAIN_CHECKPOINT_PATH = Path("logs/integrity/L1_chain_checkpoint.json")
+
+# prev_hash of the first entry in a chain
+GENESIS_PREV_HASH = "GENESIS-0"
+
 
 def get_default_chain_log_path() -> Path:
     """
@@ -17,90 +25,225 @@ def get_default_chain_log_path() -> Path:
     to hard-code or guess the location of the chain log file.
     """
     return CHAIN_LOG_PATH
-# ... your existing imports / logger / CHAIN_LOG_PATH / get_default_chain_log_path ...
 
-def _parse_chain(path: Path):
+
+def append_chain_event(
+    event_type: str,
+    payload: Any,
+    *,
+    note: Optional[str] = None,
+    layer: int = 1,
+    path: Path | str | None = None,
+) -> Dict[str, Any]:
+    """Append one durable entry to the chain log (see L1_hash_spine_stub.ChainAppender)."""
+    from layer1_integrity_core.L1_hash_spine_stub import append_chain_event as _append
+
+    return _append(event_type, payload, note=note, layer=layer, path=path if path is not None else CHAIN_LOG_PATH)
+
+
+def compute_payload_hash(payload: Any) -> str:
+    """sha256 of the payload as stored in the chain log (sorted keys, UTF-8)."""
+    return sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def compute_chain_hash(prev_hash: str, timestamp: str, event_type: str, payload_hash: str) -> str:
+    """chain_hash = sha256("prev_hash|timestamp|event_type|payload_hash")."""
+    return sha256("|".join((prev_hash, timestamp, event_type, payload_hash)).encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class ChainCheckpoint:
     """
-    Very simple chain parser for skeleton mode.
+    Position up to which a chain log has been verified.
 
-    Reads the chain log as newline-delimited JSON objects and returns
-    a list of dict entries.
+    offset:          byte offset just past the last verified entry (a line boundary)
+    entries:         number of verified entries before offset
+    last_hash:       chain_hash of the last verified entry (GENESIS_PREV_HASH if none)
+    last_line_start: byte offset where the last verified entry starts; used to
+                     confirm on resume that the log was not rewritten under us
     """
-    entries: list[dict] = []
 
+    offset: int = 0
+    entries: int = 0
+    last_hash: str = GENESIS_PREV_HASH
+    last_line_start: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "offset": self.offset,
+            "entries": self.entries,
+            "last_hash": self.last_hash,
+            "last_line_start": self.last_line_start,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ChainCheckpoint":
+        return cls(
+            offset=int(data["offset"]),
+            entries=int(data["entries"]),
+            last_hash=str(data["last_hash"]),
+            last_line_start=int(data["last_line_start"]),
+        )
+
+
+@dataclass
+class ChainVerification:
+    ok: bool
+    errors: List[str] = field(default_factory=list)
+    # Resume point after this run; never advances past the first bad entry.
+    checkpoint: ChainCheckpoint = field(default_factory=ChainCheckpoint)
+
+
+def _check_entry(raw: bytes, prev_hash: str, index: int) -> Tuple[Optional[str], Optional[str]]:
+    """Return (chain_hash, None) if the line links onto prev_hash, else (None, error)."""
     try:
-        with path.open("r", encoding="utf-8") as f:
-            for lineno, line in enumerate(f, start=1):
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    obj = json.loads(line)
-                    entries.append(obj)
-                except Exception as e:
-                    logger.error(
-                        "Error parsing chain line %d in %s: %s",
-                        lineno,
-                        path,
-                        e,
-                    )
-    except FileNotFoundError:
-        # Should normally be handled by verify_chain before calling us,
-        # but we defensively return an empty list here.
-        logger.warning("Chain file %s not found in _parse_chain()", path)
-        return []
-
-    return entries
-
-def verify_chain(chain_log_path: Path | str) -> Tuple[bool, List[str]]:
-    """
-    Verify the integrity chain at the given path.
+        obj = json.loads(raw)
+    except ValueError as e:
+        logger.error("Error parsing chain entry %d: %s", index, e)
+        return None, f"chain_parse_error:entry={index}"
+    if not isinstance(obj, dict):
+        return None, f"chain_parse_error:entry={index}"
+
+    fields = [obj.get(k) for k in ("prev_hash", "timestamp", "event_type", "payload_hash", "chain_hash")]
+    if not all(isinstance(v, str) for v in fields) or "payload" not in obj:
+        return None, f"chain_entry_incomplete:entry={index}"
+    entry_prev, timestamp, event_type, payload_hash, chain_hash = fields
+
+    if entry_prev != prev_hash:
+        return None, f"chain_prev_hash_mismatch:entry={index}"
+    if compute_payload_hash(obj["payload"]) != payload_hash:
+        return None, f"chain_payload_hash_mismatch:entry={index}"
+    if compute_chain_hash(entry_prev, timestamp, event_type, payload_hash) != chain_hash:
+        return None, f"chain_hash_mismatch:entry={index}"
+    return chain_hash, None
+
+
+def _checkpoint_still_valid(f, checkpoint: ChainCheckpoint) -> bool:
+    """Re-read the last verified line and confirm it still ends at offset with last_hash."""
+    if checkpoint.entries == 0:
+        return checkpoint.offset == 0 or not f.read(checkpoint.offset).strip()
+    f.seek(checkpoint.last_line_start)
+    line = f.readline()
+    if checkpoint.last_line_start + len(line) != checkpoint.offset or not line.endswith(b"\n"):
+        return False
+    try:
+        return json.loads(line).get("chain_hash") == checkpoint.last_hash
+    except (ValueError, AttributeError):
+        return False
 
-    Returns:
-        (ok, errors): ok=True if chain is acceptable in skeleton mode,
-        errors contains any non-fatal warnings or issues.
+
+def verify_chain_stream(
+    chain_log_path: Path | str,
+    *,
+    checkpoint: Optional[ChainCheckpoint] = None,
+) -> ChainVerification:
     """
-    errors: list[str] = []
+    Recompute every chain link while reading the log line by line.
+
+    Only the previous chain_hash is held in memory. With a checkpoint, the
+    bytes before checkpoint.offset are trusted (after re-checking the last
+    verified line) and only the tail is read, so large logs can be verified
+    incrementally.
 
+    A final line without a trailing newline is treated as an append in
+    progress: reported as "chain_tail_incomplete" and left for the next run.
+    """
     path = Path(chain_log_path)
+    start = checkpoint or ChainCheckpoint()
+    result = ChainVerification(ok=True, checkpoint=start)
 
     if not path.exists():
-        msg = f"Chain verification: log not found at {path} (treating as OK in skeleton mode)"
-        logger.warning(msg)
-        errors.append("chain_log_missing")
-        # In skeleton mode we still treat this as OK, but report the warning.
-        return True, errors
-
-    status = _parse_chain(path)
-
-    # Support both raw-list and ChainStatus return types
-    if isinstance(status, list):
-        entries = status
-    else:
-        # Assume a dataclass-like object with .entries and optional .errors
-        entries = getattr(status, "entries", [])
-        status_errors = getattr(status, "errors", [])
-        if status_errors:
-            errors.extend(status_errors)
-
-    if not entries:
-        msg = f"Chain verification: no entries found in {path} (treating as OK in skeleton mode)"
-        logger.info(msg)
-        errors.append("chain_empty")
-        return True, errors
-
-    last = entries[-1]
-    if isinstance(last, dict):
-        last_hash = last.get("chain_hash")
-    else:
-        last_hash = getattr(last, "chain_hash", None)
-
-    logger.info(
-        "Chain verification: OK for %s (entries=%d, last_hash=%s)",
-        path,
-        len(entries),
-        last_hash,
+        logger.warning("Chain verification: log not found at %s (treating as OK in skeleton mode)", path)
+        result.errors.append("chain_log_missing")
+        return result
+
+    with path.open("rb") as f:
+        if start.offset > path.stat().st_size or not _checkpoint_still_valid(f, start):
+            logger.error("Chain verification: checkpoint does not match %s", path)
+            return ChainVerification(ok=False, errors=["chain_checkpoint_mismatch"], checkpoint=start)
+
+        f.seek(start.offset)
+        pos, offset, entries = start.offset, start.offset, start.entries
+        prev_hash, last_line_start = start.last_hash, start.last_line_start
+        while True:
+            line = f.readline()
+            if not line:
+                break
+            if not line.endswith(b"\n"):
+                result.errors.append("chain_tail_incomplete")
+                break
+            line_start, pos = pos, pos + len(line)
+            if not line.strip():
+                continue
+
+            chain_hash, error = _check_entry(line, prev_hash, entries + 1)
+            if error is not None:
+                result.ok = False
+                result.errors.append(error)
+                break
+            entries += 1
+            prev_hash, last_line_start, offset = chain_hash, line_start, pos
+
+    result.checkpoint = ChainCheckpoint(
+        offset=offset, entries=entries, last_hash=prev_hash, last_line_start=last_line_start
     )
+    if result.checkpoint.entries == 0 and result.ok:
+        logger.info("Chain verification: no entries found in %s (treating as OK in skeleton mode)", path)
+        result.errors.append("chain_empty")
+    elif result.ok:
+        logger.info(
+            "Chain verification: OK for %s (entries=%d, last_hash=%s)",
+            path,
+            result.checkpoint.entries,
+            result.checkpoint.last_hash,
+        )
+    return result
+
+
+def verify_chain(
+    chain_log_path: Path | str,
+    *,
+    checkpoint: Optional[ChainCheckpoint] = None,
+) -> Tuple[bool, List[str]]:
+    """
+    Verify the integrity chain at the given path.
+
+    Returns:
+        (ok, errors): ok=False if any entry fails to link onto its parent;
+        errors also carries non-fatal warnings (missing/empty log, torn tail).
+    """
+    result = verify_chain_stream(chain_log_path, checkpoint=checkpoint)
+    return result.ok, result.errors
 
-    # No structural errors detected
-    return True, errors
+
+def load_chain_checkpoint(path: Path | str | None = None) -> Optional[ChainCheckpoint]:
+    """Load a recorded checkpoint; None if absent or unreadable."""
+    p = Path(path) if path is not None else CHAIN_CHECKPOINT_PATH
+    try:
+        return ChainCheckpoint.from_dict(json.loads(p.read_text(encoding="utf-8")))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_chain_checkpoint(checkpoint: ChainCheckpoint, path: Path | str | None = None) -> None:
+    from utils.canonical_json import write_canonical_json_file
+
+    write_canonical_json_file(path if path is not None else CHAIN_CHECKPOINT_PATH, checkpoint.to_dict())
+
+
+def verify_chain_incremental(
+    chain_log_path: Path | str,
+    checkpoint_path: Path | str | None = None,
+) -> ChainVerification:
+    """
+    Verify only what was appended since the recorded checkpoint, then record
+    the new one. A checkpoint that no longer matches the log falls back to a
+    full verification from offset 0.
+    """
+    checkpoint = load_chain_checkpoint(checkpoint_path)
+    result = verify_chain_stream(chain_log_path, checkpoint=checkpoint)
+    if checkpoint is not None and "chain_checkpoint_mismatch" in result.errors:
+        result = verify_chain_stream(chain_log_path)
+    if "chain_log_missing" not in result.errors:
+        save_chain_checkpoint(result.checkpoint, checkpoint_path)
+    return result
@@ -10,41 +10,58 @@ Guardian constraints:
 - No side effects in L8-2 (non-IO NOOP only).
 - Deterministic constants only.
 - L8-5: Declared IOO contract (channels must be declared and validated).
+
+Compiled registry:
+- ACTION_REGISTRY is validated once into an immutable CompiledActionRegistry
+  (O(1) allowed-ness and channel lookups; no per-execution re-validation).
+- Fail-closed at load: the shipped registry must compile cleanly (import fails
+  otherwise). A registry swapped in at runtime is recompiled on first use; its
+  invalid entries stay allowed-listed but raise ValueError on channel lookup.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Final, Mapping, Any, Tuple
 
 
 # Minimal deterministic registry (v0.1)
 # Expand later under controlled milestones.
-ACTION_REGISTRY: Final[Mapping[str, Mapping[str, Any]]] = {
-    "NOOP": {
+# Read-only proxies: the compiled view is keyed on this object's identity.
+ACTION_REGISTRY: Final[Mapping[str, Mapping[str, Any]]] = MappingProxyType({
+    "NOOP": MappingProxyType({
         "description": "No operation. Deterministic placeholder action.",
         "declared_channels": (),
         "side_effects": False,
         "version": "0.1",
-    },
-}
+    }),
+})
 
 
-def is_action_allowed(action: str) -> bool:
-    """Return True iff action exists in the deterministic allow-list."""
-    return isinstance(action, str) and action in ACTION_REGISTRY
+@dataclass(frozen=True, slots=True)
+class CompiledActionRegistry:
+    """Immutable, pre-validated view of an action registry."""
 
+    source: Mapping[str, Mapping[str, Any]]
+    allowed: frozenset[str]
+    channels: Mapping[str, Tuple[str, ...]]
+    errors: Mapping[str, str]
 
+    def is_allowed(self, action: str) -> bool:
+        return isinstance(action, str) and action in self.allowed
 
-def get_declared_side_effect_channels(action: str) -> Tuple[str, ...]:
-    """
-    Return validated declared side-effect channels for an action.
+    def declared_channels(self, action: str) -> Tuple[str, ...]:
+        """Fail-close: raises ValueError if not allowed or if its metadata is invalid."""
+        channels = self.channels.get(action) if isinstance(action, str) else None
+        if channels is not None:
+            return channels
+        if not self.is_allowed(action):
+            raise ValueError(f"Action not allowed: {action}")
+        raise ValueError(self.errors[action])
 
-    Fail-close: raises ValueError if the registry metadata is invalid.
-    """
-    if not is_action_allowed(action):
-        raise ValueError(f"Action not allowed: {action}")
 
-    meta = ACTION_REGISTRY[action]
+def _validate_action_meta(action: str, meta: Mapping[str, Any]) -> Tuple[str, ...]:
     channels = meta.get("declared_channels")
     if not isinstance(channels, tuple):
         raise ValueError(f"Action {action} declared_channels must be a tuple")
@@ -61,3 +78,58 @@ def get_declared_side_effect_channels(action: str) -> Tuple[str, ...]:
         raise ValueError(f"Action {action} side_effects must match declared_channels emptiness")
 
     return channels
+
+
+def compile_action_registry(
+    registry: Mapping[str, Mapping[str, Any]],
+    *,
+    strict: bool = False,
+) -> CompiledActionRegistry:
+    """
+    Validate every registry entry once.
+
+    strict=True raises ValueError on the first invalid entry; otherwise invalid
+    entries are recorded and re-raised by CompiledActionRegistry.declared_channels().
+    """
+    channels: dict[str, Tuple[str, ...]] = {}
+    errors: dict[str, str] = {}
+    for action in sorted(registry):
+        try:
+            channels[action] = _validate_action_meta(action, registry[action])
+        except (ValueError, AttributeError) as exc:
+            msg = str(exc) if isinstance(exc, ValueError) else f"Action {action} metadata must be a mapping"
+            if strict:
+                raise ValueError(msg) from exc
+            errors[action] = msg
+    return CompiledActionRegistry(
+        source=registry,
+        allowed=frozenset(registry),
+        channels=MappingProxyType(channels),
+        errors=MappingProxyType(errors),
+    )
+
+
+_COMPILED: CompiledActionRegistry = compile_action_registry(ACTION_REGISTRY, strict=True)
+
+
+def compiled_action_registry() -> CompiledActionRegistry:
+    """Return the compiled view of the current ACTION_REGISTRY (recompiled only if it was replaced)."""
+    global _COMPILED
+    compiled = _COMPILED
+    if compiled.source is not ACTION_REGISTRY:
+        compiled = _COMPILED = compile_action_registry(ACTION_REGISTRY)
+    return compiled
+
+
+def is_action_allowed(action: str) -> bool:
+    """Return True iff action exists in the deterministic allow-list."""
+    return compiled_action_registry().is_allowed(action)
+
+
+def get_declared_side_effect_channels(action: str) -> Tuple[str, ...]:
+    """
+    Return validated declared side-effect channels for an action.
+
+    Fail-close: raises ValueError if the registry metadata is invalid.
+    """
+    return compiled_action_registry().declared_channels(action)
@@ -11,44 +11,127 @@ Contract v0.1:
   dict/list/str/int/float/bool/None
 - Tuples are converted to lists (stable order preserved).
 - Mappings are exported with lexicographically sorted string keys (deterministic).
+- side_effect_stream is exported only when present (spill-mode records).
 """
 
 from __future__ import annotations
 
-from dataclasses import asdict, is_dataclass
-from typing import Any, Dict, Mapping
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Dict, List, Mapping, Set, Tuple
 
 from .execution_record_v0_1 import ExecutionRecord
 
 
 _JSON_PRIMITIVE = (str, int, float, bool, type(None))
 
+# Exact-type fast path; subclasses (e.g. str Enums) fall through to isinstance checks.
+_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
 
-def _to_json_safe(obj: Any) -> Any:
-    # primitives
-    if isinstance(obj, _JSON_PRIMITIVE):
-        return obj
+_PRIM, _MAP, _SEQ = 0, 1, 2
+_EXIT = object()  # stack marker: the container with id() == slot is complete
+
+
+def _mapping_items(obj: Mapping[Any, Any]) -> List[Tuple[str, Any]]:
+    keys = sorted(obj.keys())
+    for k in keys:
+        if not isinstance(k, str):
+            raise TypeError(f"Non-string key not allowed in export: {k!r}")
+    return [(k, obj[k]) for k in keys]
 
-    # dataclasses -> dict
-    if is_dataclass(obj):
-        return _to_json_safe(asdict(obj))
 
-    # mappings (deterministic key order)
+def _dataclass_items(obj: Any) -> List[Tuple[str, Any]]:
+    # Shallow field walk (no dataclasses.asdict deep copy); keys sorted like mappings.
+    if isinstance(obj, type):
+        raise TypeError("asdict() should be called on dataclass instances")
+    return sorted(((f.name, getattr(obj, f.name)) for f in fields(obj)), key=lambda kv: kv[0])
+
+
+_DISPATCH: Dict[type, Tuple[int, Callable[[Any], Any] | None]] = {
+    dict: (_MAP, _mapping_items),
+    list: (_SEQ, None),
+    tuple: (_SEQ, None),
+}
+
+
+def _classify(obj: Any) -> Tuple[int, Callable[[Any], Any] | None]:
+    hit = _DISPATCH.get(type(obj))
+    if hit is not None:
+        return hit
+    if isinstance(obj, _JSON_PRIMITIVE):
+        return _PRIM, None
+    if is_dataclass(obj):
+        return _MAP, _dataclass_items
     if isinstance(obj, Mapping):
-        out: Dict[str, Any] = {}
-        for k in sorted(obj.keys()):
-            if not isinstance(k, str):
-                raise TypeError(f"Non-string key not allowed in export: {k!r}")
-            out[k] = _to_json_safe(obj[k])
-        return out
-
-    # tuples/lists -> lists
+        return _MAP, _mapping_items
     if isinstance(obj, (list, tuple)):
-        return [_to_json_safe(x) for x in obj]
-
+        return _SEQ, None
     raise TypeError(f"Non-JSON-safe type in export: {type(obj).__name__}")
 
 
+def _to_json_safe(obj: Any) -> Any:
+    """
+    Iterative JSON-safe conversion (no recursion limit on nesting depth).
+
+    Each container is allocated once and filled in place from an explicit
+    stack of (source, parent, slot) jobs; children are pushed in reverse so
+    they are visited in document order.
+
+    Containers on the current path are tracked by id(): a cycle raises
+    TypeError (shared, acyclic references are still allowed). An _EXIT job
+    is pushed under each container's children to pop it off the path.
+    """
+    if type(obj) in _PRIMITIVE_TYPES:
+        return obj
+
+    root: List[Any] = [None]
+    stack: List[Tuple[Any, Any, Any]] = [(obj, root, 0)]
+    pop = stack.pop
+    push = stack.append
+    on_path: Set[int] = set()
+
+    while stack:
+        src, parent, slot = pop()
+        if src is _EXIT:
+            on_path.discard(slot)
+            continue
+        kind, items_of = _classify(src)
+        if kind != _PRIM:
+            key = id(src)
+            if key in on_path:
+                raise TypeError(f"Non-JSON-safe cyclic reference in export: {type(src).__name__}")
+            on_path.add(key)
+            push((_EXIT, None, key))
+
+        if kind == _PRIM:
+            parent[slot] = src
+            continue
+
+        if kind == _MAP:
+            items = items_of(src)  # type: ignore[misc]
+            out: Any = {}
+            pending = []
+            for k, v in items:
+                if type(v) in _PRIMITIVE_TYPES:
+                    out[k] = v
+                else:
+                    out[k] = None  # reserve key order; filled by the pending job
+                    pending.append((v, out, k))
+        else:
+            out = [None] * len(src)
+            pending = []
+            for i, v in enumerate(src):
+                if type(v) in _PRIMITIVE_TYPES:
+                    out[i] = v
+                else:
+                    pending.append((v, out, i))
+
+        parent[slot] = out
+        for job in reversed(pending):
+            push(job)
+
+    return root[0]
+
+
 def export_execution_record(record: ExecutionRecord) -> Dict[str, Any]:
     """
     Deterministic JSON-safe export of ExecutionRecord.
@@ -59,13 +142,16 @@ def export_execution_record(record: ExecutionRecord) -> Dict[str, Any]:
     if not isinstance(record, ExecutionRecord):
         raise TypeError("record must be an ExecutionRecord")
 
+    # Single walk: the payload is converted once (nested fields are not pre-converted).
     payload: Dict[str, Any] = {
         "execution_id": record.execution_id,
         "decision_hash": record.decision_hash,
-        "result": _to_json_safe(record.result),
-        "audit_trace": _to_json_safe(record.audit_trace),
-        "side_effect_events": _to_json_safe(record.side_effect_events),
-        "policy_verdict": _to_json_safe(record.policy_verdict),
+        "result": record.result,
+        "audit_trace": record.audit_trace,
+        "side_effect_events": record.side_effect_events,
+        "policy_verdict": record.policy_verdict,
         "record_hash": record.record_hash,
     }
+    if record.side_effect_stream is not None:
+        payload["side_effect_stream"] = record.side_effect_stream
     return _to_json_safe(payload)
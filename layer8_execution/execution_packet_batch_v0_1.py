@@ -0,0 +1,193 @@
+"""
+GUS v4.0 — L8 Execution Layer
+Execution Packet Batch (Merkle-sealed Export) v0.1
+
+Purpose:
+- Seal N exported ExecutionRecords into ONE packet, committed by a Merkle root
+  over their record_hash values (in batch order).
+- Each record line carries its inclusion proof, so a single record can be
+  verified against the batch root without the rest of the batch.
+- Output is streamed as canonical JSONL (header line + one line per record).
+
+Merkle scheme (domain-separated, RFC 6962 style):
+- leaf = sha256(0x00 || bytes.fromhex(record_hash))
+- node = sha256(0x01 || left || right)
+- an odd node at the end of a level is promoted unchanged to the next level
+- proof = ordered list of {"side": "L"|"R", "hash": hex} from leaf to root
+
+Guardian constraints:
+- Deterministic ordering only (batch order is caller order).
+- No non-deterministic timestamps.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Sequence, Union
+
+from utils.canonical_json import write_canonical_jsonl_file
+
+from .execution_export_v0_1 import export_execution_record
+from .execution_record_v0_1 import ExecutionRecord
+from .execution_runtime_v0_1 import _hash_str, _stable_json
+
+
+BATCH_PACKET_VERSION = "0.1-batch"
+MERKLE_SCHEME = "sha256-rfc6962-promote-odd"
+
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+def _record_hash_bytes(record_hash: str) -> bytes:
+    if not isinstance(record_hash, str) or len(record_hash) != 64:
+        raise ValueError(f"record_hash must be a 64-char hex sha256: {record_hash!r}")
+    try:
+        return bytes.fromhex(record_hash)
+    except ValueError as exc:
+        raise ValueError(f"record_hash must be a 64-char hex sha256: {record_hash!r}") from exc
+
+
+def merkle_leaf(record_hash: str) -> bytes:
+    return hashlib.sha256(_LEAF_PREFIX + _record_hash_bytes(record_hash)).digest()
+
+
+def _merkle_node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(_NODE_PREFIX + left + right).digest()
+
+
+def merkle_levels(record_hashes: Sequence[str]) -> List[List[bytes]]:
+    """All tree levels, leaves first, root level last."""
+    if not record_hashes:
+        raise ValueError("Merkle tree requires at least one record_hash")
+    level = [merkle_leaf(h) for h in record_hashes]
+    levels = [level]
+    while len(level) > 1:
+        nxt = [_merkle_node(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            nxt.append(level[-1])
+        levels.append(nxt)
+        level = nxt
+    return levels
+
+
+def merkle_root(record_hashes: Sequence[str]) -> str:
+    return merkle_levels(record_hashes)[-1][0].hex()
+
+
+def merkle_proof(levels: Sequence[Sequence[bytes]], index: int) -> List[Dict[str, str]]:
+    proof: List[Dict[str, str]] = []
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append({"side": "L" if sibling < index else "R", "hash": level[sibling].hex()})
+        index //= 2
+    return proof
+
+
+def verify_inclusion(record_hash: str, proof: Sequence[Mapping[str, str]], root: str) -> bool:
+    """Recompute the root from record_hash + proof; True iff it equals root."""
+    try:
+        node = merkle_leaf(record_hash)
+        for step in proof:
+            sib = bytes.fromhex(step["hash"])
+            if step["side"] == "L":
+                node = _merkle_node(sib, node)
+            elif step["side"] == "R":
+                node = _merkle_node(node, sib)
+            else:
+                return False
+    except (KeyError, TypeError, ValueError):
+        return False
+    return node.hex() == root
+
+
+def compute_batch_packet_hash(
+    *,
+    packet_version: str,
+    merkle_scheme: str,
+    record_count: int,
+    merkle_root: str,
+) -> str:
+    """packet_hash over the batch header core (shared with offline verifiers)."""
+    core = {
+        "packet_version": packet_version,
+        "merkle_scheme": merkle_scheme,
+        "record_count": record_count,
+        "merkle_root": merkle_root,
+    }
+    return _hash_str(_stable_json(core))
+
+
+def _batch_header(record_hashes: Sequence[str], packet_version: str) -> Dict[str, Any]:
+    core = {
+        "packet_version": packet_version,
+        "merkle_scheme": MERKLE_SCHEME,
+        "record_count": len(record_hashes),
+        "merkle_root": merkle_root(record_hashes),
+    }
+    return {**core, "kind": "batch_header", "packet_hash": compute_batch_packet_hash(**core)}
+
+
+def iter_execution_packet_batch_v0_1(
+    records: Sequence[ExecutionRecord],
+    *,
+    packet_version: str = BATCH_PACKET_VERSION,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the batch packet as JSON-safe lines: header first, then one entry per
+    record (index, record_hash, proof, execution_record). Records are exported
+    one at a time, so only the Merkle levels are held for the whole batch.
+
+    packet_hash covers packet_version, merkle_scheme, record_count and merkle_root;
+    the root in turn commits to every record_hash in order.
+    """
+    record_hashes: List[str] = []
+    for rec in records:
+        if not isinstance(rec, ExecutionRecord):
+            raise TypeError("records must be ExecutionRecord instances")
+        record_hashes.append(rec.record_hash)
+
+    levels = merkle_levels(record_hashes)
+    yield _batch_header(record_hashes, packet_version)
+
+    for i, rec in enumerate(records):
+        yield {
+            "kind": "record",
+            "index": i,
+            "record_hash": rec.record_hash,
+            "proof": merkle_proof(levels, i),
+            "execution_record": export_execution_record(rec),
+        }
+
+
+def write_execution_packet_batch_v0_1(
+    path: Union[str, Path],
+    records: Sequence[ExecutionRecord],
+    *,
+    packet_version: str = BATCH_PACKET_VERSION,
+) -> Dict[str, Any]:
+    """
+    Stream the batch packet to path as canonical JSONL (atomic replace).
+    Returns the header line.
+    """
+    header: Dict[str, Any] = {}
+
+    def lines() -> Iterator[Dict[str, Any]]:
+        for line in iter_execution_packet_batch_v0_1(records, packet_version=packet_version):
+            if not header:
+                header.update(line)
+            yield line
+
+    write_canonical_jsonl_file(path, lines())
+    return header
+
+
+def read_execution_packet_batch_v0_1(path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Read a batch packet JSONL back line by line (header first)."""
+    with Path(path).open("r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
@@ -21,6 +21,16 @@ from .execution_export_v0_1 import export_execution_record
 from .execution_runtime_v0_1 import _hash_str, _stable_json
 
 
+def compute_packet_hash(*, packet_version: str, record_hash: str, execution_record: Mapping[str, Any]) -> str:
+    """packet_hash over the pre-hash packet core (shared with offline verifiers)."""
+    core = {
+        "packet_version": packet_version,
+        "record_hash": record_hash,
+        "execution_record": execution_record,
+    }
+    return _hash_str(_stable_json(core))
+
+
 def build_execution_packet_v0_1(
     record: ExecutionRecord,
     *,
@@ -42,13 +52,11 @@ def build_execution_packet_v0_1(
     if not isinstance(record_hash, str) or not record_hash.strip():
         raise ValueError("ExecutionRecord must include non-empty record_hash")
 
-    core = {
-        "packet_version": packet_version,
-        "record_hash": record_hash,
-        "execution_record": exported,
-    }
-
-    packet_hash = _hash_str(_stable_json(core))
+    packet_hash = compute_packet_hash(
+        packet_version=packet_version,
+        record_hash=record_hash,
+        execution_record=exported,
+    )
 
     # Final packet: hash included (hash commits to the pre-hash core)
     return {
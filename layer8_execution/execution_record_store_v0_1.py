@@ -0,0 +1,98 @@
+"""
+GUS v4.0 — L8 Execution Layer
+Content-Addressed Execution Record Store v0.1
+
+Purpose:
+- Persist exported ExecutionRecords keyed by record_hash (content address).
+- Identical records (e.g. repeated BLOCKED outcomes for the same decision)
+  are stored exactly once.
+- O(1) existence checks and retrieval via a fan-out directory layout:
+    <root>/objects/<hash[0:2]>/<hash[2:4]>/<record_hash>.json
+
+Guardian constraints:
+- Fail-closed: a record is only stored if its record_hash re-derives from its
+  content (same derivation as ExecutionRuntimeV0_1._record).
+- Canonical on-disk bytes (utils.canonical_json), atomic writes.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Tuple, Union
+
+from utils.canonical_json import write_canonical_json_file
+
+from .execution_export_v0_1 import export_execution_record
+from .execution_record_v0_1 import ExecutionRecord
+from .execution_verify_v0_1 import verify_exported_record
+
+
+_HASH_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def _require_hash(record_hash: str) -> str:
+    # Strict hex also guarantees the key can never escape the store root.
+    if not isinstance(record_hash, str) or not _HASH_RE.match(record_hash):
+        raise ValueError(f"record_hash must be 64 lowercase hex chars: {record_hash!r}")
+    return record_hash
+
+
+class ExecutionRecordStore:
+    """Content-addressed store of exported ExecutionRecords (dedup by record_hash)."""
+
+    def __init__(self, root: Union[str, Path]) -> None:
+        self._root = Path(root)
+        self._objects = self._root / "objects"
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def path_for(self, record_hash: str) -> Path:
+        h = _require_hash(record_hash)
+        return self._objects / h[:2] / h[2:4] / f"{h}.json"
+
+    def exists(self, record_hash: str) -> bool:
+        return self.path_for(record_hash).is_file()
+
+    def put(self, record: Union[ExecutionRecord, Mapping[str, Any]]) -> Tuple[str, bool]:
+        """
+        Store a record (ExecutionRecord or its export). Returns (record_hash, created);
+        created is False when an identical record was already stored.
+
+        Raises ValueError if the record's hashes do not re-derive from its content.
+        """
+        exported = export_execution_record(record) if isinstance(record, ExecutionRecord) else dict(record)
+        record_hash = _require_hash(exported.get("record_hash"))
+
+        path = self.path_for(record_hash)
+        if path.is_file():
+            return record_hash, False
+
+        issues = verify_exported_record(exported)
+        if issues:
+            raise ValueError(f"Refusing to store record {record_hash}: {issues[0].field} ({issues[0].reason})")
+
+        write_canonical_json_file(path, exported)
+        return record_hash, True
+
+    def get(self, record_hash: str) -> Dict[str, Any]:
+        """Return the stored export for record_hash; KeyError if absent."""
+        path = self.path_for(record_hash)
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            raise KeyError(record_hash) from None
+
+    def __contains__(self, record_hash: object) -> bool:
+        return isinstance(record_hash, str) and bool(_HASH_RE.match(record_hash)) and self.exists(record_hash)
+
+    def iter_hashes(self) -> Iterator[str]:
+        """All stored record hashes in sorted (deterministic) order."""
+        if not self._objects.is_dir():
+            return
+        for p in sorted(self._objects.glob("*/*/*.json")):
+            if _HASH_RE.match(p.stem):
+                yield p.stem
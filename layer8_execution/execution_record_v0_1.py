@@ -10,6 +10,13 @@ L8-3 Upgrade:
 L8-4 Upgrade:
 - ExecutionRecord MUST include side_effect_events (declared IO only).
 - record_hash MUST cover side_effect_events.
+
+Models are slotted (no per-instance __dict__) to keep large in-memory
+record volumes compact (see scripts/measure_l8_memory.py).
+
+Spill mode:
+- side_effect_stream ({count, sha256}) replaces in-memory events when the
+  SideEffectBus spilled to disk; record_hash covers it when present.
 """
 
 from __future__ import annotations
@@ -21,7 +28,7 @@ from typing import Any, Mapping, Literal, Tuple
 Status = Literal["SUCCESS", "FAILURE", "BLOCKED"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionRequest:
     decision_id: str
     verdict: str
@@ -30,7 +37,7 @@ class ExecutionRequest:
     decision_hash: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionResult:
     status: Status
     timestamp_utc: str
@@ -38,7 +45,7 @@ class ExecutionResult:
     note: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionRecord:
     execution_id: str
     decision_hash: str
@@ -49,3 +56,6 @@ class ExecutionRecord:
 
     # NEW (P2.2 wiring)
     policy_verdict: dict | None = None
+
+    # Spill mode: commitment to the on-disk event stream (None for in-memory events)
+    side_effect_stream: dict | None = None
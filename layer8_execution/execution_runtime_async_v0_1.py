@@ -0,0 +1,119 @@
+"""
+GUS v4.0 — L8 Execution Layer
+Async Execution Runtime v0.1
+
+Purpose:
+- async execute() / execute_many() over the SAME gates, hashing and record
+  derivation as ExecutionRuntimeV0_1: records are interchangeable (equal
+  record_hash, execution_id, execution_hash) with sync execute().
+- Side effects go through AsyncSideEffectBus; per-channel async sinks are
+  awaited on emit, so IO-bound delivery never blocks other executions.
+- Bounded concurrency: at most max_concurrency executions are in flight per
+  event loop.
+
+Determinism:
+- Gating, policy preflight and hashing are synchronous and pure; only sink
+  delivery yields to the loop.
+- Event seq order is fixed at emit time (per run), never by sink completion.
+- execute_many() returns records in input order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from pathlib import Path
+from typing import Any, Callable, List, Mapping, Sequence
+
+from .execution_record_v0_1 import ExecutionRecord, ExecutionRequest
+from .execution_runtime_v0_1 import ExecutionRuntimeV0_1, _RegistryLookups
+from .side_effects_v0_1 import AsyncSideEffectBus, AsyncSink
+
+
+class AsyncExecutionRuntime:
+    def __init__(
+        self,
+        clock_utc: Callable[[], str] | None = None,
+        *,
+        side_effect_spill_dir: Path | str | None = None,
+        max_concurrency: int = 16,
+        channel_sinks: Mapping[str, AsyncSink] | None = None,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self._runtime = ExecutionRuntimeV0_1(clock_utc, side_effect_spill_dir=side_effect_spill_dir)
+        self._max_concurrency = max_concurrency
+        self._sinks = dict(channel_sinks or {})
+        # asyncio primitives bind to one loop; keep one semaphore per running loop
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        sem = self._semaphores.get(loop)
+        if sem is None:
+            sem = self._semaphores[loop] = asyncio.Semaphore(self._max_concurrency)
+        return sem
+
+    async def execute(self, decision: Mapping[str, Any]) -> ExecutionRecord:
+        """
+        Async counterpart of ExecutionRuntimeV0_1.execute().
+        Always returns ExecutionRecord (even when BLOCKED).
+        """
+        rt = self._runtime
+        rt._require_fields(decision)
+        req = rt._request(decision)
+        async with self._semaphore():
+            policy_verdict_wire = rt._policy_preflight(
+                action_id=req.authorized_action,
+                actor_id=rt._actor_id(decision),
+                inputs=req.parameters,
+            )
+            return await self._gate(req, policy_verdict_wire, _RegistryLookups())
+
+    async def execute_many(self, decisions: Sequence[Mapping[str, Any]]) -> List[ExecutionRecord]:
+        """
+        Run decisions concurrently (bounded); records are returned in input order.
+        Fail-closed: all decisions are validated before any is executed.
+        """
+        batch = tuple(decisions)
+        for decision in batch:
+            self._runtime._require_fields(decision)
+        return list(await asyncio.gather(*(self.execute(d) for d in batch)))
+
+    async def _gate(
+        self,
+        req: ExecutionRequest,
+        policy_verdict_wire: Mapping[str, Any],
+        lookups: _RegistryLookups,
+    ) -> ExecutionRecord:
+        # Mirrors ExecutionRuntimeV0_1._gate; only the bus (and action body) are async.
+        rt = self._runtime
+        note = rt._gate_block_note(req, policy_verdict_wire, lookups)
+        if note is not None:
+            return rt._blocked(req, note, policy_verdict_wire)
+
+        try:
+            declared = lookups.declared_channels(req.authorized_action)
+            async with AsyncSideEffectBus(sinks=self._sinks, **rt._bus_kwargs(req, declared)) as bus:
+                pass  # v0.1: NOOP emits nothing
+            side_effect_events, side_effect_stream = rt._bus_output(bus)
+        except ValueError:
+            return rt._blocked(req, "Registry metadata invalid", policy_verdict_wire)
+        except OSError as exc:
+            return rt._blocked(req, rt._spill_failure_note(exc), policy_verdict_wire)
+
+        return rt._record(
+            req,
+            status="SUCCESS",
+            note="NOOP executed",
+            side_effect_events=side_effect_events,
+            declared_channels=declared,
+            policy_verdict=policy_verdict_wire,
+            side_effect_stream=side_effect_stream,
+        )
@@ -14,28 +14,32 @@ L8-4 Upgrade:
 - Side effects MUST be declared IO only (SideEffectBus).
 - ExecutionRecord MUST include side_effect_events.
 - record_hash MUST cover side_effect_events.
+
+Spill mode (side_effect_spill_dir):
+- Events stream to <spill_dir>/<run_id>.jsonl instead of memory.
+- ExecutionRecord.side_effect_events is () and side_effect_stream carries
+  {count, sha256}; execution_hash and record_hash cover side_effect_stream.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any, Callable, Mapping, Tuple
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
 
-from layer8_execution.action_registry_v0_1 import (
-    get_declared_side_effect_channels,
-    is_action_allowed,
-)
+from layer8_execution.action_registry_v0_1 import compiled_action_registry
 from layer8_execution.execution_record_v0_1 import (
     ExecutionRecord,
     ExecutionRequest,
     ExecutionResult,
 )
-from layer8_execution.side_effects_v0_1 import SideEffectBus
+from layer8_execution.side_effects_v0_1 import SideEffectBus, event_to_wire
 
 from layer10_policy_verdict.policy_verdict_engine_v0_1 import PolicyVerdictEngine
 from layer10_policy_verdict.policy_rules_v0_1 import RuleContext
 from layer10_policy_verdict.verdict_types_v0_1 import VerdictCode
+from utils.canonical_json import canonical_raw, canonical_sha256_hex
 
 
 _FIXED_TIMESTAMP_UTC = "1970-01-01T00:00:00Z"
@@ -50,25 +54,105 @@ def _hash_str(s: str) -> str:
 
 
 def _events_to_wire(events: Tuple[Any, ...]) -> Tuple[Mapping[str, Any], ...]:
-    out: list[Mapping[str, Any]] = []
-    for ev in events:
-        out.append(
-            {
-                "seq": int(getattr(ev, "seq")),
-                "timestamp_utc": str(getattr(ev, "timestamp_utc")),
-                "channel": str(getattr(ev, "channel")),
-                "payload": dict(getattr(ev, "payload")),
-                "action_id": str(getattr(ev, "action_id")),
-                "run_id": str(getattr(ev, "run_id")),
-            }
-        )
-    return tuple(out)
+    return tuple(map(event_to_wire, events))
+
+
+# ---------------------------------------------------------------------------
+# Hash derivations (single source of truth for _record and offline verifiers).
+# side_effect_events / policy_verdict may be CanonicalRaw fragments.
+# ---------------------------------------------------------------------------
+
+def compute_execution_hash(
+    *,
+    decision_hash: str,
+    status: str,
+    action: str,
+    timestamp_utc: str,
+    note: str,
+    side_effect_events: Any,
+    policy_verdict: Any,
+    side_effect_stream: Mapping[str, Any] | None = None,
+) -> str:
+    core: Dict[str, Any] = {
+        "decision_hash": decision_hash,
+        "status": status,
+        "action": action,
+        "timestamp_utc": timestamp_utc,
+        "note": note,
+        "side_effect_events": side_effect_events,
+        "policy_verdict": policy_verdict,
+    }
+    if side_effect_stream is not None:
+        core["side_effect_stream"] = side_effect_stream
+    return canonical_sha256_hex(core)
+
+
+def compute_execution_id(*, decision_id: str, execution_hash: str) -> str:
+    return canonical_sha256_hex({"decision_id": decision_id, "execution_hash": execution_hash})
+
+
+def compute_record_hash(
+    *,
+    execution_id: str,
+    decision_hash: str,
+    status: str,
+    timestamp_utc: str,
+    execution_hash: str,
+    note: str,
+    audit_trace: Mapping[str, Any],
+    side_effect_events: Any,
+    policy_verdict: Any,
+    side_effect_stream: Mapping[str, Any] | None = None,
+) -> str:
+    core: Dict[str, Any] = {
+        "execution_id": execution_id,
+        "decision_hash": decision_hash,
+        "result": {
+            "status": status,
+            "timestamp_utc": timestamp_utc,
+            "execution_hash": execution_hash,
+            "note": note,
+            "declared_channels": audit_trace["declared_channels"],
+            "emitted_channels": audit_trace["emitted_channels"],
+            "emitted_count": audit_trace["emitted_count"],
+        },
+        "audit_trace": audit_trace,
+        "side_effect_events": side_effect_events,
+        "policy_verdict": policy_verdict,
+    }
+    if side_effect_stream is not None:
+        core["side_effect_stream"] = side_effect_stream
+    return canonical_sha256_hex(core)
+
+
+class _RegistryLookups:
+    """
+    Registry view for one execute()/execute_many() call: a single compiled
+    snapshot, so every decision in a batch sees the same (pre-validated) registry.
+    """
+
+    __slots__ = ("_registry",)
+
+    def __init__(self) -> None:
+        self._registry = compiled_action_registry()
+
+    def is_allowed(self, action: str) -> bool:
+        return self._registry.is_allowed(action)
+
+    def declared_channels(self, action: str) -> Tuple[str, ...]:
+        return self._registry.declared_channels(action)
 
 
 class ExecutionRuntimeV0_1:
-    def __init__(self, clock_utc: Callable[[], str] | None = None) -> None:
+    def __init__(
+        self,
+        clock_utc: Callable[[], str] | None = None,
+        *,
+        side_effect_spill_dir: Path | str | None = None,
+    ) -> None:
         self._clock_utc = clock_utc or (lambda: _FIXED_TIMESTAMP_UTC)
         self._policy_engine = PolicyVerdictEngine()
+        self._spill_dir = Path(side_effect_spill_dir) if side_effect_spill_dir is not None else None
 
     @staticmethod
     def _require_fields(decision: Mapping[str, Any]) -> None:
@@ -96,8 +180,53 @@ class ExecutionRuntimeV0_1:
         Always returns ExecutionRecord (even when BLOCKED).
         """
         self._require_fields(decision)
+        req = self._request(decision)
 
-        req = ExecutionRequest(
+        # Policy preflight: uses req fields (no undefined vars)
+        policy_verdict_wire = self._policy_preflight(
+            action_id=req.authorized_action,
+            actor_id=self._actor_id(decision),
+            inputs=req.parameters,
+        )
+        return self._gate(req, policy_verdict_wire, _RegistryLookups())
+
+    def execute_many(self, decisions: Sequence[Mapping[str, Any]]) -> List[ExecutionRecord]:
+        """
+        Batched execute(): records are returned in input order and are identical
+        to serial execute() calls.
+
+        - All decisions are validated up front (fail-closed: the first invalid
+          decision raises ValueError before anything is recorded).
+        - Policy preflight runs once over the batch (PolicyVerdictEngine.evaluate_many);
+          each distinct verdict is converted to wire form once.
+        - Registry lookups are resolved once per distinct action.
+        """
+        batch = tuple(decisions)
+        for decision in batch:
+            self._require_fields(decision)
+        reqs = [self._request(d) for d in batch]
+
+        verdicts = self._policy_engine.evaluate_many(
+            [
+                RuleContext(action_id=req.authorized_action, actor_id=self._actor_id(d), inputs=req.parameters)
+                for req, d in zip(reqs, batch)
+            ]
+        )
+
+        lookups = _RegistryLookups()
+        wires: Dict[int, Mapping[str, Any]] = {}
+        out: List[ExecutionRecord] = []
+        for req, verdict in zip(reqs, verdicts):
+            # verdicts list keeps shared instances alive, so id() is stable for this batch
+            wire = wires.get(id(verdict))
+            if wire is None:
+                wire = wires[id(verdict)] = verdict.to_dict()
+            out.append(self._gate(req, wire, lookups))
+        return out
+
+    @staticmethod
+    def _request(decision: Mapping[str, Any]) -> ExecutionRequest:
+        return ExecutionRequest(
             decision_id=decision["decision_id"],
             verdict=decision["verdict"],
             authorized_action=decision["authorized_action"],
@@ -105,88 +234,102 @@ class ExecutionRuntimeV0_1:
             decision_hash=decision["decision_hash"],
         )
 
-        # Policy preflight: uses req fields (no undefined vars)
-        actor_id = str(decision.get("actor_id", "UNKNOWN_ACTOR"))
-        policy_verdict_wire = self._policy_preflight(
-            action_id=req.authorized_action,
-            actor_id=actor_id,
-            inputs=req.parameters,
+    @staticmethod
+    def _actor_id(decision: Mapping[str, Any]) -> str:
+        return str(decision.get("actor_id", "UNKNOWN_ACTOR"))
+
+    def _gate(
+        self,
+        req: ExecutionRequest,
+        policy_verdict_wire: Mapping[str, Any],
+        lookups: "_RegistryLookups",
+    ) -> ExecutionRecord:
+        note = self._gate_block_note(req, policy_verdict_wire, lookups)
+        if note is not None:
+            return self._blocked(req, note, policy_verdict_wire)
+
+        # L8-4/L8-6: declared channels enforced by registry+bus. Fail-closed on invalid registry metadata.
+        try:
+            declared = lookups.declared_channels(req.authorized_action)
+            with self._open_bus(req, declared) as bus:
+                pass  # v0.1: NOOP emits nothing
+            side_effect_events, side_effect_stream = self._bus_output(bus)
+        except ValueError:
+            return self._blocked(req, "Registry metadata invalid", policy_verdict_wire)
+        except OSError as exc:
+            return self._blocked(req, self._spill_failure_note(exc), policy_verdict_wire)
+
+        return self._record(
+            req,
+            status="SUCCESS",
+            note="NOOP executed",
+            side_effect_events=side_effect_events,
+            declared_channels=declared,
+            policy_verdict=policy_verdict_wire,
+            side_effect_stream=side_effect_stream,
         )
 
+    @staticmethod
+    def _gate_block_note(
+        req: ExecutionRequest,
+        policy_verdict_wire: Mapping[str, Any],
+        lookups: "_RegistryLookups",
+    ) -> str | None:
+        """Return the BLOCKED note of the first failing gate, or None if all gates pass."""
         # Enforce policy DENY immediately (hard stop), but still return a record
         if policy_verdict_wire["code"] == VerdictCode.DENY.value:
-            return self._record(
-                req,
-                status="BLOCKED",
-                note=f"Execution denied by policy: {policy_verdict_wire.get('summary', '')}",
-                side_effect_events=(),
-                declared_channels=(),
-                policy_verdict=policy_verdict_wire,
-            )
+            return f"Execution denied by policy: {policy_verdict_wire.get('summary', '')}"
 
         # Gate 1: verdict must be ALLOW
         if req.verdict != "ALLOW":
-            return self._record(
-                req,
-                status="BLOCKED",
-                note="Verdict not ALLOW",
-                side_effect_events=(),
-                declared_channels=(),
-                policy_verdict=policy_verdict_wire,
-            )
+            return "Verdict not ALLOW"
 
         # Gate 2: action must be allow-listed
-        if not is_action_allowed(req.authorized_action):
-            return self._record(
-                req,
-                status="BLOCKED",
-                note="Action not in registry",
-                side_effect_events=(),
-                declared_channels=(),
-                policy_verdict=policy_verdict_wire,
-            )
+        if not lookups.is_allowed(req.authorized_action):
+            return "Action not in registry"
 
         # v0.1: NOOP only
         if req.authorized_action != "NOOP":
-            return self._record(
-                req,
-                status="BLOCKED",
-                note="Only NOOP permitted in v0.1",
-                side_effect_events=(),
-                declared_channels=(),
-                policy_verdict=policy_verdict_wire,
-            )
+            return "Only NOOP permitted in v0.1"
 
-        # L8-4/L8-6: declared channels enforced by registry+bus. Fail-closed on invalid registry metadata.
-        run_id = _hash_str(_stable_json({"decision_id": req.decision_id, "decision_hash": req.decision_hash}))
-        try:
-            declared = get_declared_side_effect_channels(req.authorized_action)
-            bus = SideEffectBus(
-                declared_channels=declared,
-                clock_utc=self._clock_utc,
-                action_id=req.authorized_action,
-                run_id=run_id,
-            )
-            side_effect_events = _events_to_wire(bus.snapshot())
-        except ValueError:
-            return self._record(
-                req,
-                status="BLOCKED",
-                note="Registry metadata invalid",
-                side_effect_events=(),
-                declared_channels=(),
-                policy_verdict=policy_verdict_wire,
-            )
+        return None
 
+    def _blocked(self, req: ExecutionRequest, note: str, policy_verdict_wire: Mapping[str, Any]) -> ExecutionRecord:
         return self._record(
             req,
-            status="SUCCESS",
-            note="NOOP executed",
-            side_effect_events=side_effect_events,
-            declared_channels=declared,
+            status="BLOCKED",
+            note=note,
+            side_effect_events=(),
+            declared_channels=(),
             policy_verdict=policy_verdict_wire,
         )
 
+    @staticmethod
+    def _spill_failure_note(exc: OSError) -> str:
+        # Class name only: paths and errno text are environment-specific and would leak into the hash.
+        return f"Side-effect spill failed: {type(exc).__name__}"
+
+    def _open_bus(self, req: ExecutionRequest, declared: Tuple[str, ...]) -> SideEffectBus:
+        return SideEffectBus(**self._bus_kwargs(req, declared))
+
+    def _bus_kwargs(self, req: ExecutionRequest, declared: Tuple[str, ...]) -> Dict[str, Any]:
+        run_id = _hash_str(_stable_json({"decision_id": req.decision_id, "decision_hash": req.decision_hash}))
+        return {
+            "declared_channels": declared,
+            "clock_utc": self._clock_utc,
+            "action_id": req.authorized_action,
+            "run_id": run_id,
+            "spill_path": self._spill_dir / f"{run_id}.jsonl" if self._spill_dir is not None else None,
+        }
+
+    @staticmethod
+    def _bus_output(
+        bus: SideEffectBus,
+    ) -> Tuple[Tuple[Mapping[str, Any], ...], Mapping[str, Any] | None]:
+        if bus.spilling:
+            return (), bus.stream_digest()
+        return _events_to_wire(bus.snapshot()), None
+
     def _record(
         self,
         req: ExecutionRequest,
@@ -196,21 +339,30 @@ class ExecutionRuntimeV0_1:
         side_effect_events: Tuple[Mapping[str, Any], ...],
         declared_channels: Tuple[str, ...] = (),
         policy_verdict: Mapping[str, Any] | None = None,
+        side_effect_stream: Mapping[str, Any] | None = None,
     ) -> ExecutionRecord:
         ts = self._clock_utc()
 
-        execution_hash = _hash_str(
-            _stable_json(
-                {
-                    "decision_hash": req.decision_hash,
-                    "status": status,
-                    "action": req.authorized_action,
-                    "timestamp_utc": ts,
-                    "note": note,
-                    "side_effect_events": side_effect_events,
-                    "policy_verdict": policy_verdict or {},
-                }
-            )
+        # Large sub-objects are canonically encoded once and spliced into every
+        # hash payload that covers them (bytes identical to _stable_json).
+        events_raw = canonical_raw(side_effect_events)
+        verdict_raw = canonical_raw(policy_verdict or {})
+
+        # Spilled streams are committed by {count, sha256}; in-memory records keep
+        # their original payload shape (and therefore their original hashes).
+        stream = None
+        if side_effect_stream is not None:
+            stream = {"count": int(side_effect_stream["count"]), "sha256": str(side_effect_stream["sha256"])}
+
+        execution_hash = compute_execution_hash(
+            decision_hash=req.decision_hash,
+            status=status,
+            action=req.authorized_action,
+            timestamp_utc=ts,
+            note=note,
+            side_effect_events=events_raw,
+            policy_verdict=verdict_raw,
+            side_effect_stream=stream,
         )
 
         result = ExecutionResult(
@@ -220,7 +372,7 @@ class ExecutionRuntimeV0_1:
             note=note,
         )
 
-        execution_id = _hash_str(_stable_json({"decision_id": req.decision_id, "execution_hash": execution_hash}))
+        execution_id = compute_execution_id(decision_id=req.decision_id, execution_hash=execution_hash)
 
         emitted_channels = tuple(
             sorted(
@@ -234,6 +386,9 @@ class ExecutionRuntimeV0_1:
             )
         )
         emitted_count = len(side_effect_events)
+        if side_effect_stream is not None:
+            emitted_channels = tuple(side_effect_stream.get("channels", ()))
+            emitted_count = stream["count"]
 
         audit_trace = {
             "gate_version": "0.1",
@@ -246,29 +401,21 @@ class ExecutionRuntimeV0_1:
             "declared_channels": declared_channels,
             "emitted_channels": emitted_channels,
             "emitted_count": emitted_count,
-            "side_effect_count": len(side_effect_events),
+            "side_effect_count": emitted_count,
             "policy_verdict": policy_verdict or {},
         }
 
-        record_hash = _hash_str(
-            _stable_json(
-                {
-                    "execution_id": execution_id,
-                    "decision_hash": req.decision_hash,
-                    "result": {
-                        "status": result.status,
-                        "timestamp_utc": result.timestamp_utc,
-                        "execution_hash": result.execution_hash,
-                        "note": result.note,
-                        "declared_channels": declared_channels,
-                        "emitted_channels": emitted_channels,
-                        "emitted_count": emitted_count,
-                    },
-                    "audit_trace": audit_trace,
-                    "side_effect_events": side_effect_events,
-                    "policy_verdict": policy_verdict or {},
-                }
-            )
+        record_hash = compute_record_hash(
+            execution_id=execution_id,
+            decision_hash=req.decision_hash,
+            status=result.status,
+            timestamp_utc=result.timestamp_utc,
+            execution_hash=result.execution_hash,
+            note=result.note,
+            audit_trace=dict(audit_trace, policy_verdict=verdict_raw),
+            side_effect_events=events_raw,
+            policy_verdict=verdict_raw,
+            side_effect_stream=stream,
         )
 
         # NOTE: ExecutionRecord must have policy_verdict: dict | None field.
@@ -280,5 +427,6 @@ class ExecutionRuntimeV0_1:
             side_effect_events=side_effect_events,
             record_hash=record_hash,
             policy_verdict=dict(policy_verdict) if policy_verdict is not None else None,
+            side_effect_stream=stream,
         )
 
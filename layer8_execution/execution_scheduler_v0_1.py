@@ -0,0 +1,147 @@
+"""
+GUS v4.0 — L8 Execution Layer
+Execution Scheduler v0.1 (dependency-aware, parallel)
+
+Purpose:
+- Execute a DAG of decisions through ExecutionRuntimeV0_1 on a thread pool.
+- Independent decisions run concurrently; decisions that share a declared
+  side-effect channel never overlap.
+
+Determinism:
+- A canonical order is fixed up front: topological order over depends_on,
+  ties broken by decision_id.
+- Decisions sharing a channel run in canonical order (implicit edges), so the
+  order of side effects per channel never depends on thread timing.
+- Records are returned in canonical order.
+
+Notes:
+- depends_on is an ordering constraint only: a dependency that ends BLOCKED
+  does not block its dependents (each decision is gated on its own merits).
+- Fail-closed: invalid decisions, unknown dependencies, duplicate ids and
+  cycles raise ValueError before anything executes.
+"""
+
+from __future__ import annotations
+
+import heapq
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Sequence, Set, Tuple
+
+from .action_registry_v0_1 import get_declared_side_effect_channels, is_action_allowed
+from .execution_record_v0_1 import ExecutionRecord
+from .execution_runtime_v0_1 import ExecutionRuntimeV0_1
+
+
+@dataclass(frozen=True)
+class ScheduledDecision:
+    decision: Mapping[str, Any]
+    depends_on: Tuple[str, ...] = ()
+    # Extra channels to serialize on; registry-declared channels are always included.
+    channels: Tuple[str, ...] = ()
+
+    @property
+    def decision_id(self) -> str:
+        return self.decision["decision_id"]
+
+
+def _channels_for(item: ScheduledDecision) -> Set[str]:
+    channels = set(item.channels)
+    action = item.decision["authorized_action"]
+    if is_action_allowed(action):
+        try:
+            channels.update(get_declared_side_effect_channels(action))
+        except ValueError:
+            pass  # runtime blocks it ("Registry metadata invalid"); nothing to serialize
+    return channels
+
+
+def canonical_order(items: Sequence[ScheduledDecision]) -> List[str]:
+    """Topological order over depends_on; ties broken by decision_id."""
+    by_id: Dict[str, ScheduledDecision] = {}
+    for it in items:
+        if it.decision_id in by_id:
+            raise ValueError(f"Duplicate decision_id in schedule: {it.decision_id}")
+        by_id[it.decision_id] = it
+
+    indegree = {d: 0 for d in by_id}
+    succs: Dict[str, List[str]] = {d: [] for d in by_id}
+    for it in items:
+        for dep in dict.fromkeys(it.depends_on):
+            if dep not in by_id:
+                raise ValueError(f"Decision {it.decision_id} depends on unknown decision_id: {dep}")
+            succs[dep].append(it.decision_id)
+            indegree[it.decision_id] += 1
+
+    heap = [d for d, n in indegree.items() if n == 0]
+    heapq.heapify(heap)
+    order: List[str] = []
+    while heap:
+        d = heapq.heappop(heap)
+        order.append(d)
+        for s in succs[d]:
+            indegree[s] -= 1
+            if indegree[s] == 0:
+                heapq.heappush(heap, s)
+
+    if len(order) != len(by_id):
+        cyclic = sorted(d for d, n in indegree.items() if n > 0)
+        raise ValueError(f"Dependency cycle among decisions: {cyclic}")
+    return order
+
+
+class ExecutionSchedulerV0_1:
+    def __init__(self, runtime: ExecutionRuntimeV0_1 | None = None, *, max_workers: int = 4) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be >= 1")
+        self._runtime = runtime or ExecutionRuntimeV0_1()
+        self._max_workers = max_workers
+
+    def run(self, items: Sequence[ScheduledDecision]) -> List[ExecutionRecord]:
+        """Execute the DAG; returns records in canonical (topological, decision_id) order."""
+        for it in items:
+            self._runtime._require_fields(it.decision)
+
+        by_id = {it.decision_id: it for it in items}
+        order = canonical_order(items)
+        rank = {d: i for i, d in enumerate(order)}
+
+        # Predecessors = explicit dependencies + previous holder of each shared channel.
+        preds: Dict[str, Set[str]] = {d: set(by_id[d].depends_on) for d in order}
+        last_on_channel: Dict[str, str] = {}
+        for d in order:
+            for ch in sorted(_channels_for(by_id[d])):
+                prev = last_on_channel.get(ch)
+                if prev is not None:
+                    preds[d].add(prev)
+                last_on_channel[ch] = d
+
+        succs: Dict[str, List[str]] = {d: [] for d in order}
+        for d, ps in preds.items():
+            for p in ps:
+                succs[p].append(d)
+        waiting = {d: len(ps) for d, ps in preds.items()}
+
+        records: Dict[str, ExecutionRecord] = {}
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            running: Dict[Future[ExecutionRecord], str] = {}
+
+            def submit(d: str) -> None:
+                running[pool.submit(self._runtime.execute, by_id[d].decision)] = d
+
+            for d in order:
+                if waiting[d] == 0:
+                    submit(d)
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                # release in canonical order so submission order is deterministic too
+                for fut in sorted(done, key=lambda f: rank[running[f]]):
+                    d = running.pop(fut)
+                    records[d] = fut.result()
+                    for s in sorted(succs[d], key=rank.__getitem__):
+                        waiting[s] -= 1
+                        if waiting[s] == 0:
+                            submit(s)
+
+        return [records[d] for d in order]
@@ -0,0 +1,279 @@
+"""
+GUS v4.0 — L8 Execution Layer
+Execution Export Verifier v0.1
+
+Purpose:
+- Offline re-derivation of execution_hash, execution_id, record_hash and
+  packet_hash for stored exports, using the SAME derivations as
+  ExecutionRuntimeV0_1._record and the packet builders.
+- Streaming: files are read line by line (JSONL); directories are walked.
+- Parallel: files are verified on a process pool (one file per task).
+
+Accepted line shapes (one JSON object per line):
+- single packet   (build_execution_packet_v0_1): packet_version/record_hash/packet_hash/execution_record
+- batch packet    (execution_packet_batch_v0_1): kind=batch_header, then kind=record lines
+- bare record     (export_execution_record):     execution_id/.../record_hash
+
+Every mismatch is reported with its location (path, line number, field).
+"""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+from .execution_packet_batch_v0_1 import compute_batch_packet_hash, merkle_root, verify_inclusion
+from .execution_packet_v0_1 import compute_packet_hash
+from .execution_runtime_v0_1 import compute_execution_hash, compute_execution_id, compute_record_hash
+
+
+EXPORT_SUFFIXES = (".jsonl", ".json")
+
+
+@dataclass(frozen=True)
+class VerificationIssue:
+    path: str
+    line: int
+    field: str
+    expected: Optional[str]
+    actual: Optional[str]
+    reason: str = "hash mismatch"
+
+
+@dataclass
+class FileVerification:
+    path: str
+    records: int = 0
+    packets: int = 0
+    issues: List[VerificationIssue] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.issues
+
+
+def _issue(
+    out: List[VerificationIssue],
+    path: str,
+    line: int,
+    fld: str,
+    expected: Any,
+    actual: Any,
+    reason: str = "hash mismatch",
+) -> None:
+    out.append(
+        VerificationIssue(
+            path=path,
+            line=line,
+            field=fld,
+            expected=None if expected is None else str(expected),
+            actual=None if actual is None else str(actual),
+            reason=reason,
+        )
+    )
+
+
+def verify_exported_record(exported: Mapping[str, Any], *, path: str = "", line: int = 0) -> List[VerificationIssue]:
+    """Recompute execution_hash, execution_id and record_hash of one exported record."""
+    issues: List[VerificationIssue] = []
+    try:
+        result = exported["result"]
+        audit = exported["audit_trace"]
+        events = exported["side_effect_events"]
+        verdict = exported.get("policy_verdict") or {}
+        stream = exported.get("side_effect_stream")
+
+        execution_hash = compute_execution_hash(
+            decision_hash=exported["decision_hash"],
+            status=result["status"],
+            action=audit["authorized_action"],
+            timestamp_utc=result["timestamp_utc"],
+            note=result["note"],
+            side_effect_events=events,
+            policy_verdict=verdict,
+            side_effect_stream=stream,
+        )
+        if execution_hash != result["execution_hash"]:
+            _issue(issues, path, line, "result.execution_hash", execution_hash, result["execution_hash"])
+
+        execution_id = compute_execution_id(decision_id=audit["decision_id"], execution_hash=result["execution_hash"])
+        if execution_id != exported["execution_id"]:
+            _issue(issues, path, line, "execution_id", execution_id, exported["execution_id"])
+
+        record_hash = compute_record_hash(
+            execution_id=exported["execution_id"],
+            decision_hash=exported["decision_hash"],
+            status=result["status"],
+            timestamp_utc=result["timestamp_utc"],
+            execution_hash=result["execution_hash"],
+            note=result["note"],
+            audit_trace=audit,
+            side_effect_events=events,
+            policy_verdict=verdict,
+            side_effect_stream=stream,
+        )
+        if record_hash != exported["record_hash"]:
+            _issue(issues, path, line, "record_hash", record_hash, exported["record_hash"])
+    except (KeyError, TypeError) as exc:
+        _issue(issues, path, line, "execution_record", None, None, reason=f"malformed record: {exc!r}")
+    return issues
+
+
+def _iter_lines(path: Path) -> Iterator[tuple[int, Any]]:
+    """Yield (lineno, obj); a line that fails to decode yields its exception instead."""
+    with path.open("rb") as f:
+        for lineno, raw in enumerate(f, start=1):
+            if not raw.strip():
+                continue
+            try:
+                yield lineno, json.loads(raw.decode("utf-8"))
+            except ValueError as exc:  # JSONDecodeError and UnicodeDecodeError
+                yield lineno, exc
+
+
+def _exported_record(issues: List[VerificationIssue], path: str, line: int, obj: Mapping[str, Any]) -> Optional[Mapping[str, Any]]:
+    """The embedded execution_record if it is an object; otherwise report it and return None."""
+    exported = obj.get("execution_record")
+    if isinstance(exported, dict):
+        return exported
+    _issue(issues, path, line, "execution_record", "object", type(exported).__name__, reason="execution_record is not an object")
+    return None
+
+
+def verify_export_file(path: Union[str, Path]) -> FileVerification:
+    """Verify one JSONL/JSON export file (single packets, batch packets or bare records)."""
+    p = Path(path)
+    rep = FileVerification(path=str(p))
+    issues = rep.issues
+
+    if not p.is_file():
+        _issue(issues, str(p), 0, "path", None, None, reason="missing")
+        return rep
+
+    header: Optional[Dict[str, Any]] = None
+    header_line = 0
+    batch_hashes: List[str] = []
+
+    for lineno, obj in _iter_lines(p):
+        if isinstance(obj, Exception) or not isinstance(obj, dict):
+            _issue(issues, str(p), lineno, "line", None, None, reason=f"unparseable line: {obj!r}")
+            continue
+
+        kind = obj.get("kind")
+        if kind == "batch_header":
+            if header is not None:
+                _finish_batch(rep, header, header_line, batch_hashes)
+            header, header_line, batch_hashes = obj, lineno, []
+            rep.packets += 1
+            expected = compute_batch_packet_hash(
+                packet_version=obj.get("packet_version"),
+                merkle_scheme=obj.get("merkle_scheme"),
+                record_count=obj.get("record_count"),
+                merkle_root=obj.get("merkle_root"),
+            )
+            if expected != obj.get("packet_hash"):
+                _issue(issues, str(p), lineno, "packet_hash", expected, obj.get("packet_hash"))
+
+        elif kind == "record":
+            rep.records += 1
+            exported = _exported_record(issues, str(p), lineno, obj)
+            if exported is not None:
+                issues.extend(verify_exported_record(exported, path=str(p), line=lineno))
+            if exported is not None and obj.get("record_hash") != exported.get("record_hash"):
+                _issue(issues, str(p), lineno, "record_hash", exported.get("record_hash"), obj.get("record_hash"))
+            if header is None:
+                _issue(issues, str(p), lineno, "kind", "batch_header", "record", reason="record line without batch header")
+                continue
+            if obj.get("index") != len(batch_hashes):
+                _issue(issues, str(p), lineno, "index", len(batch_hashes), obj.get("index"), reason="index out of order")
+            batch_hashes.append(str(obj.get("record_hash")))
+            if not verify_inclusion(str(obj.get("record_hash")), obj.get("proof") or [], str(header.get("merkle_root"))):
+                _issue(issues, str(p), lineno, "proof", header.get("merkle_root"), None, reason="inclusion proof failed")
+
+        elif "packet_hash" in obj and "execution_record" in obj:
+            rep.packets += 1
+            rep.records += 1
+            exported = _exported_record(issues, str(p), lineno, obj)
+            if exported is None:
+                continue
+            issues.extend(verify_exported_record(exported, path=str(p), line=lineno))
+            if obj.get("record_hash") != exported.get("record_hash"):
+                _issue(issues, str(p), lineno, "record_hash", exported.get("record_hash"), obj.get("record_hash"))
+            expected = compute_packet_hash(
+                packet_version=obj.get("packet_version"),
+                record_hash=obj.get("record_hash"),
+                execution_record=exported,
+            )
+            if expected != obj["packet_hash"]:
+                _issue(issues, str(p), lineno, "packet_hash", expected, obj["packet_hash"])
+
+        elif "record_hash" in obj and "result" in obj:
+            rep.records += 1
+            issues.extend(verify_exported_record(obj, path=str(p), line=lineno))
+
+        else:
+            _issue(issues, str(p), lineno, "line", None, None, reason="unrecognized export line")
+
+    if header is not None:
+        _finish_batch(rep, header, header_line, batch_hashes)
+    return rep
+
+
+def _finish_batch(rep: FileVerification, header: Mapping[str, Any], line: int, hashes: Sequence[str]) -> None:
+    if header.get("record_count") != len(hashes):
+        _issue(rep.issues, rep.path, line, "record_count", len(hashes), header.get("record_count"), reason="record count mismatch")
+    try:
+        root = merkle_root(hashes)
+    except ValueError:
+        _issue(rep.issues, rep.path, line, "merkle_root", None, header.get("merkle_root"), reason="empty or invalid batch")
+        return
+    if root != header.get("merkle_root"):
+        _issue(rep.issues, rep.path, line, "merkle_root", root, header.get("merkle_root"))
+
+
+def iter_export_files(paths: Iterable[Union[str, Path]]) -> Iterator[Path]:
+    """Expand files/directories into export files (sorted within each directory)."""
+    for raw in paths:
+        p = Path(raw)
+        if p.is_dir():
+            for f in sorted(p.rglob("*")):
+                if f.is_file() and f.suffix in EXPORT_SUFFIXES:
+                    yield f
+        else:
+            yield p
+
+
+def verify_exports(paths: Iterable[Union[str, Path]], *, workers: int = 0) -> List[FileVerification]:
+    """
+    Verify every export file under paths. Results are in file order.
+    workers <= 1 verifies in-process; otherwise a process pool of that size is used.
+    """
+    files = [str(f) for f in iter_export_files(paths)]
+    if workers <= 1 or len(files) <= 1:
+        return [verify_export_file(f) for f in files]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(verify_export_file, files, chunksize=max(1, len(files) // (workers * 4))))
+
+
+def summarize_verification(reports: Sequence[FileVerification]) -> Dict[str, Any]:
+    issues = [i for r in reports for i in r.issues]
+    return {
+        "ok": not issues,
+        "files": len(reports),
+        "packets": sum(r.packets for r in reports),
+        "records": sum(r.records for r in reports),
+        "issues": [
+            {
+                "path": i.path,
+                "line": i.line,
+                "field": i.field,
+                "expected": i.expected,
+                "actual": i.actual,
+                "reason": i.reason,
+            }
+            for i in issues
+        ],
+    }
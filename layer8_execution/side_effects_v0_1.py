@@ -10,19 +10,41 @@ Purpose:
 Notes:
 - This enforces declared side effects at the engine boundary (SideEffectBus).
 - It does not attempt to intercept direct filesystem/network IO in user code.
+
+Spill mode:
+- SideEffectBus(spill_path=...) streams each event as a canonical JSONL line to
+  disk instead of keeping it in memory, with a running sha256 over the stream.
+- Records then commit to stream_digest() (count + sha256) instead of the events.
+- An existing spill file is never overwritten (it may back an earlier record's
+  digest). Re-running the same run_id (a replay) is matched byte-for-byte
+  against the existing stream instead; any divergence raises
+  SideEffectSpillConflictError.
+
+Async emitters:
+- AsyncSideEffectBus.aemit() records the event synchronously (seq order is fixed
+  at call time) and then awaits the channel's async sink, if one is registered.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 from dataclasses import dataclass
-from typing import Any, Callable, Final, Mapping
+from pathlib import Path
+from typing import Any, Awaitable, BinaryIO, Callable, Dict, Final, Iterator, Mapping
+
+from utils.canonical_json import canonical_json_bytes
 
 
 class SideEffectPolicyError(RuntimeError):
     """Raised when an action attempts an undeclared side effect."""
 
 
-@dataclass(frozen=True)
+class SideEffectSpillConflictError(FileExistsError):
+    """Raised when a replayed run diverges from the spill stream already on disk."""
+
+
+@dataclass(frozen=True, slots=True)
 class SideEffectEvent:
     seq: int
     timestamp_utc: str
@@ -32,12 +54,34 @@ class SideEffectEvent:
     run_id: str
 
 
+def event_to_wire(ev: SideEffectEvent) -> Dict[str, Any]:
+    """JSON-safe wire form of an event (the shape hashed into ExecutionRecord)."""
+    return {
+        "seq": int(ev.seq),
+        "timestamp_utc": str(ev.timestamp_utc),
+        "channel": str(ev.channel),
+        "payload": dict(ev.payload),
+        "action_id": str(ev.action_id),
+        "run_id": str(ev.run_id),
+    }
+
+
+def iter_spilled_events(path: Path | str) -> Iterator[Dict[str, Any]]:
+    """Read back a spill file written by SideEffectBus(spill_path=...)."""
+    with Path(path).open("r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
 class SideEffectBus:
     """
     Deterministic side-effect bus.
 
     - Enforces a fixed allow-list of channels per action (declared at registration).
     - Captures every emission as a SideEffectEvent (ordered by seq).
+    - With spill_path set, events are streamed to disk as canonical JSONL instead
+      of being held in memory (snapshot() is then unavailable; use stream_digest()).
     """
 
     def __init__(
@@ -47,6 +91,7 @@ class SideEffectBus:
         clock_utc: Callable[[], str],
         action_id: str,
         run_id: str,
+        spill_path: Path | str | None = None,
     ) -> None:
         self._declared_channels: Final[tuple[str, ...]] = tuple(declared_channels)
         self._clock_utc = clock_utc
@@ -55,10 +100,25 @@ class SideEffectBus:
         self._seq = 0
         self._events: list[SideEffectEvent] = []
 
+        self._spill_path = Path(spill_path) if spill_path is not None else None
+        self._spill_file: BinaryIO | None = None
+        self._replay_file: BinaryIO | None = None  # existing stream a replay is matched against
+        self._replay_diverged = False
+        self._spill_hash = hashlib.sha256()
+        self._emitted_channels: set[str] = set()
+
     @property
     def declared_channels(self) -> tuple[str, ...]:
         return self._declared_channels
 
+    @property
+    def spilling(self) -> bool:
+        return self._spill_path is not None
+
+    @property
+    def spill_path(self) -> Path | None:
+        return self._spill_path
+
     def emit(self, channel: str, payload: Mapping[str, Any]) -> SideEffectEvent:
         if not isinstance(channel, str) or not channel.strip():
             raise TypeError("channel must be a non-empty string")
@@ -78,9 +138,100 @@ class SideEffectBus:
             action_id=self._action_id,
             run_id=self._run_id,
         )
-        self._events.append(ev)
+        if self._spill_path is None:
+            self._events.append(ev)
+        else:
+            self._spill(ev)
         return ev
 
+    def _spill(self, ev: SideEffectEvent) -> None:
+        if self._spill_file is None and self._replay_file is None:
+            # opened lazily: actions that emit nothing leave no file behind;
+            # "xb": never clobber a stream an earlier record's digest commits to
+            self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                self._spill_file = self._spill_path.open("xb")
+            except FileExistsError:
+                self._replay_file = self._spill_path.open("rb")
+        line = canonical_json_bytes(event_to_wire(ev)) + b"\n"
+        if self._replay_file is not None:
+            if self._replay_file.read(len(line)) != line:
+                self._replay_diverged = True
+                raise SideEffectSpillConflictError(
+                    f"replayed run diverges from existing spill stream: {self._spill_path}"
+                )
+        else:
+            self._spill_file.write(line)
+        self._spill_hash.update(line)
+        self._emitted_channels.add(ev.channel)
+
     def snapshot(self) -> tuple[SideEffectEvent, ...]:
         """Return an immutable snapshot of events in deterministic order."""
+        if self._spill_path is not None:
+            raise RuntimeError("snapshot() unavailable in spill mode; use stream_digest()")
         return tuple(self._events)
+
+    def stream_digest(self) -> Dict[str, Any]:
+        """
+        Commitment to the spilled event stream:
+          count:    number of events emitted
+          sha256:   sha256 over the exact JSONL bytes written (empty stream -> sha256(b""))
+          channels: sorted emitted channels
+        """
+        if self._spill_path is None:
+            raise RuntimeError("stream_digest() requires spill mode")
+        return {
+            "count": self._seq,
+            "sha256": self._spill_hash.hexdigest(),
+            "channels": sorted(self._emitted_channels),
+        }
+
+    def close(self) -> None:
+        if self._spill_file is not None:
+            self._spill_file.flush()
+            self._spill_file.close()
+            self._spill_file = None
+        if self._replay_file is not None:
+            extra = self._replay_file.read(1)
+            self._replay_file.close()
+            self._replay_file = None
+            if extra and not self._replay_diverged:
+                raise SideEffectSpillConflictError(
+                    f"replayed run is shorter than existing spill stream: {self._spill_path}"
+                )
+
+    def __enter__(self) -> "SideEffectBus":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+AsyncSink = Callable[[SideEffectEvent], Awaitable[None]]
+
+
+class AsyncSideEffectBus(SideEffectBus):
+    """
+    SideEffectBus with async emitters.
+
+    - aemit() validates and captures exactly like emit(), then awaits the sink
+      registered for the channel (delivery only; the captured event is final).
+    - Captured events, snapshot() and stream_digest() are identical to the sync bus.
+    """
+
+    def __init__(self, *, sinks: Mapping[str, AsyncSink] | None = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._sinks: Dict[str, AsyncSink] = dict(sinks or {})
+
+    async def aemit(self, channel: str, payload: Mapping[str, Any]) -> SideEffectEvent:
+        ev = self.emit(channel, payload)
+        sink = self._sinks.get(channel)
+        if sink is not None:
+            await sink(ev)
+        return ev
+
+    async def __aenter__(self) -> "AsyncSideEffectBus":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        self.close()
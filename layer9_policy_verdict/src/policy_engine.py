@@ -5,6 +5,7 @@ import hashlib
 import json
 
 from utils.canonical_json import canonical_json_bytes
+from utils.rule_profiler import RuleProfiler
 from typing import Any, Dict, List, Optional
 
 from .verdict_types import PolicyVerdict, VerdictLevel
@@ -21,6 +22,7 @@ def evaluate_policy(
     policy: Dict[str, Any],
     epoch_ref: str,
     chain_head: str,
+    profiler: Optional[RuleProfiler] = None,
 ) -> PolicyVerdict:
     """
     TEST-BACKED CONTRACT (do not change without updating tests):
@@ -32,6 +34,7 @@ def evaluate_policy(
         else block
     - reasons non-empty
     - object_hash hashes (action, context, policy, epoch_ref, chain_head, derived fields except object_hash)
+    - profiler (optional) only observes rule timing/hits; it never affects the verdict
     """
     require_policy_v1(policy)
 
@@ -41,7 +44,7 @@ def evaluate_policy(
 
     # Apply deterministic ruleset v1 and compute final score + reasons
     base_score = float(policy.get("base_score", 10.0))
-    rules = apply_ruleset_v1(action=action, context=context)
+    rules = apply_ruleset_v1(action=action, context=context, profiler=profiler)
     score, reasons = score_from_policy_and_rules(base_score=base_score, rules=rules)
 
     # Level decision by thresholds (use defaults-safe values)
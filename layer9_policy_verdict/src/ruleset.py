@@ -1,7 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Tuple
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.rule_profiler import RuleProfiler
+
+
+PROFILE_SCOPE = "L9"
 
 
 @dataclass(frozen=True)
@@ -15,24 +21,62 @@ def _clamp_score(x: float) -> float:
     return 0.0 if x < 0.0 else 10.0 if x > 10.0 else float(x)
 
 
-def apply_ruleset_v1(*, action: Dict[str, Any], context: Dict[str, Any]) -> List[RuleResult]:
-    """
-    Deterministic, stdlib-only ruleset.
-    Rules are intentionally simple v1 scaffolds (expand later).
-    """
-    out: List[RuleResult] = []
-
+def _r1_checks_green(action: Dict[str, Any], context: Dict[str, Any]) -> Optional[RuleResult]:
     # R1: If context says checks are green, small boost.
     if str(context.get("checks", "")).lower() in {"green", "pass", "passed"}:
-        out.append(RuleResult("R1_CHECKS_GREEN", +0.2, "CI checks green."))
+        return RuleResult("R1_CHECKS_GREEN", +0.2, "CI checks green.")
+    return None
 
+
+def _r2_main_target_guard(action: Dict[str, Any], context: Dict[str, Any]) -> Optional[RuleResult]:
     # R2: If action targets main, require extra discipline (slight penalty unless explicitly merge_pr).
     if str(action.get("target", "")).lower() == "main" and str(action.get("type", "")).lower() != "merge_pr":
-        out.append(RuleResult("R2_MAIN_TARGET_GUARD", -0.3, "Target is main; non-PR action is risky."))
+        return RuleResult("R2_MAIN_TARGET_GUARD", -0.3, "Target is main; non-PR action is risky.")
+    return None
+
 
+def _r3_actor_present(action: Dict[str, Any], context: Dict[str, Any]) -> Optional[RuleResult]:
     # R3: If actor present, small neutral confirmation (no delta) – keeps audit trail.
     if "actor" in context:
-        out.append(RuleResult("R3_ACTOR_PRESENT", 0.0, "Actor present in context."))
+        return RuleResult("R3_ACTOR_PRESENT", 0.0, "Actor present in context.")
+    return None
+
+
+# Declared order is part of the contract (reasons are emitted in this order).
+RULES_V1: Tuple[Tuple[str, Callable[[Dict[str, Any], Dict[str, Any]], Optional[RuleResult]]], ...] = (
+    ("R1_CHECKS_GREEN", _r1_checks_green),
+    ("R2_MAIN_TARGET_GUARD", _r2_main_target_guard),
+    ("R3_ACTOR_PRESENT", _r3_actor_present),
+)
+
+
+def apply_ruleset_v1(
+    *,
+    action: Dict[str, Any],
+    context: Dict[str, Any],
+    profiler: Optional[RuleProfiler] = None,
+) -> List[RuleResult]:
+    """
+    Deterministic, stdlib-only ruleset.
+    Rules are intentionally simple v1 scaffolds (expand later).
+
+    If profiler is given, per-rule calls/hits/wall time are recorded under scope "L9".
+    """
+    out: List[RuleResult] = []
+
+    if profiler is None:
+        for _, rule in RULES_V1:
+            r = rule(action, context)
+            if r is not None:
+                out.append(r)
+        return out
+
+    for rule_id, rule in RULES_V1:
+        t0 = perf_counter_ns()
+        r = rule(action, context)
+        profiler.record(scope=PROFILE_SCOPE, rule_id=rule_id, hit=r is not None, elapsed_ns=perf_counter_ns() - t0)
+        if r is not None:
+            out.append(r)
 
     return out
 
@@ -0,0 +1,55 @@
+# scripts/l1_integrity_watch.py
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Repo-root import safety (world-facing script invariant)
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import argparse
+import json
+
+from layer1_integrity_core.L1_integrity_watcher import IntegrityChangeEvent, IntegrityWatcher
+
+
+def _print_event(ev: IntegrityChangeEvent) -> None:
+    print(
+        json.dumps(
+            {
+                "overall_ok_before": ev.overall_ok_before,
+                "overall_ok": ev.overall_ok,
+                "changed": [{"path": f.path, "ok": f.ok, "reason": f.reason} for f in ev.changed],
+            },
+            sort_keys=True,
+        ),
+        flush=True,
+    )
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="GUS v4 L1: watch manifest files and keep the integrity status current")
+    ap.add_argument("--poll-interval", type=float, default=1.0, help="seconds between polls / wake-ups")
+    ap.add_argument("--no-inotify", action="store_true", help="force the stat-polling backend")
+    args = ap.parse_args()
+
+    watcher = IntegrityWatcher(
+        on_change=_print_event,
+        poll_interval=args.poll_interval,
+        use_inotify=not args.no_inotify,
+    )
+    status = watcher.status()
+    print(json.dumps({"backend": watcher.backend_name, "overall_ok": status.overall_ok}), flush=True)
+    try:
+        while True:
+            watcher.step(timeout=args.poll_interval)
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        watcher.stop()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,49 @@
+# scripts/l1_rebaseline.py
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Repo-root import safety (world-facing script invariant)
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import argparse
+
+from layer1_integrity_core.L1_integrity_core_stub import L1_MANIFEST_PATH
+from layer1_integrity_core.L1_rebaseline import rebaseline
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="GUS v4 L1: deliberate manifest rebaseline (parallel hashing)")
+    ap.add_argument("--manifest", default=str(L1_MANIFEST_PATH), help="flat L1 manifest to rebaseline")
+    ap.add_argument("--add", action="append", default=[], help="add a file to the baseline (repeatable)")
+    ap.add_argument("--remove", action="append", default=[], help="drop a file from the baseline (repeatable)")
+    ap.add_argument("--workers", type=int, default=None, help="hashing threads (default: L1_MAX_HASH_WORKERS)")
+    ap.add_argument("--dry-run", action="store_true", help="print the diff without writing")
+    args = ap.parse_args()
+
+    try:
+        diff = rebaseline(
+            args.manifest,
+            add=args.add,
+            remove=args.remove,
+            max_workers=args.workers,
+            dry_run=args.dry_run,
+        )
+    except (FileNotFoundError, ValueError) as exc:
+        print(f"rebaseline refused: {exc}", file=sys.stderr)
+        return 2
+
+    for line in diff.lines():
+        print(line)
+    if diff.empty:
+        print("manifest unchanged")
+    elif args.dry_run:
+        print("dry run: manifest not written")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
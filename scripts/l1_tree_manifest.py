@@ -0,0 +1,49 @@
+# scripts/l1_tree_manifest.py
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Repo-root import safety (world-facing script invariant)
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import argparse
+import json
+
+from layer1_integrity_core.L1_integrity_core_stub import L1_MANIFEST_PATH
+from layer1_integrity_core.L1_tree_manifest import (
+    tree_manifest_from_flat,
+    verify_tree_manifest,
+    write_tree_manifest,
+)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="GUS v4 L1: build or verify the Merkle directory-tree manifest")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    b = sub.add_parser("build", help="convert the flat L1 baseline into a tree manifest")
+    b.add_argument("--flat", default=str(L1_MANIFEST_PATH), help="flat manifest to convert")
+    b.add_argument("--out", required=True, help="tree manifest output path")
+
+    v = sub.add_parser("verify", help="verify the working tree against a tree manifest")
+    v.add_argument("tree", help="tree manifest path")
+    v.add_argument("--strict", action="store_true", help="bypass the hash cache")
+    args = ap.parse_args()
+
+    if args.cmd == "build":
+        tree = tree_manifest_from_flat(json.loads(Path(args.flat).read_text(encoding="utf-8")))
+        write_tree_manifest(args.out, tree)
+        print(json.dumps({"root_hash": tree["root_hash"], "out": args.out}))
+        return 0
+
+    tree = json.loads(Path(args.tree).read_text(encoding="utf-8"))
+    ok, issues = verify_tree_manifest(tree, strict=args.strict)
+    print(json.dumps({"ok": ok, "issues": [{"path": i.path, "reason": i.reason} for i in issues]}, indent=2))
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Repo-root import safety (world-facing script invariant)
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import argparse
+import json
+import tracemalloc
+from dataclasses import replace
+from typing import Any, Callable, Dict, List
+
+from layer8_execution.execution_runtime_v0_1 import ExecutionRuntimeV0_1
+from layer8_execution.side_effects_v0_1 import SideEffectEvent, event_to_wire
+
+
+def _bytes_per_item(n: int, build: Callable[[int], Any]) -> float:
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        items: List[Any] = [build(i) for i in range(n)]
+        cur, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del items
+    return (cur - base) / n
+
+
+def measure(n_events: int, n_records: int) -> Dict[str, Any]:
+    """
+    Retained bytes per object (tracemalloc), including the list slot and the
+    per-item int seq. Payloads/strings are shared so only the model cost is measured.
+    """
+    payload = {"k": 1}
+    ev = lambda i: SideEffectEvent(  # noqa: E731
+        seq=i, timestamp_utc="1970-01-01T00:00:00Z", channel="log", payload=payload, action_id="A", run_id="R"
+    )
+    wire_ev = SideEffectEvent(
+        seq=1, timestamp_utc="1970-01-01T00:00:00Z", channel="log", payload=payload, action_id="A", run_id="R"
+    )
+
+    rt = ExecutionRuntimeV0_1()
+    rec = rt.execute(
+        {"decision_id": "d", "verdict": "ALLOW", "authorized_action": "NOOP", "parameters": {}, "decision_hash": "H"}
+    )
+    return {
+        "events": n_events,
+        "side_effect_event_bytes": round(_bytes_per_item(n_events, ev), 1),
+        "event_wire_dict_bytes": round(_bytes_per_item(n_events, lambda i: event_to_wire(wire_ev)), 1),
+        "records": n_records,
+        "execution_record_shell_bytes": round(_bytes_per_item(n_records, lambda i: replace(rec)), 1),
+    }
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="GUS v4 L8 model memory measurement")
+    p.add_argument("--events", type=int, default=1_000_000)
+    p.add_argument("--records", type=int, default=100_000)
+    args = p.parse_args()
+    print(json.dumps(measure(args.events, args.records), indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
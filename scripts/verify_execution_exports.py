@@ -0,0 +1,33 @@
+# scripts/verify_execution_exports.py
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Repo-root import safety (world-facing script invariant)
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import argparse
+import json
+import os
+
+from layer8_execution.execution_verify_v0_1 import summarize_verification, verify_exports
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(
+        description="GUS v4 L8: re-derive execution/record/packet hashes of stored exports (JSONL files or directories)"
+    )
+    ap.add_argument("paths", nargs="+", help="export files (.jsonl/.json) or directories to scan recursively")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="process pool size (1 = in-process)")
+    args = ap.parse_args()
+
+    summary = summarize_verification(verify_exports(args.paths, workers=args.workers))
+    print(json.dumps(summary, indent=2, sort_keys=True))
+    return 0 if summary["ok"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
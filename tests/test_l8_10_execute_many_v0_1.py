@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pytest
+
+import layer8_execution.action_registry_v0_1 as registry
+from layer8_execution.execution_runtime_v0_1 import ExecutionRuntimeV0_1
+
+
+def _decision(*, decision_id: str, verdict: str = "ALLOW", action: str = "NOOP", params=None) -> dict:
+    return {
+        "decision_id": decision_id,
+        "verdict": verdict,
+        "authorized_action": action,
+        "parameters": params if params is not None else {"action": "do", "target": "t"},
+        "decision_hash": f"H-{decision_id}",
+        "actor_id": "X",
+    }
+
+
+def _batch():
+    return [
+        _decision(decision_id="d1"),
+        _decision(decision_id="d2", params={"deny": True}),
+        _decision(decision_id="d3", verdict="DENY"),
+        _decision(decision_id="d4", action="NOT_REGISTERED"),
+        _decision(decision_id="d5", params={}),
+        _decision(decision_id="d6", params={"action": "do"}),
+        _decision(decision_id="d1"),
+    ]
+
+
+def test_execute_many_identical_to_serial_execute():
+    rt = ExecutionRuntimeV0_1()
+    batch = _batch()
+    assert rt.execute_many(batch) == [rt.execute(d) for d in batch]
+    assert rt.execute_many([]) == []
+
+
+def test_execute_many_fail_closed_on_invalid_decision():
+    rt = ExecutionRuntimeV0_1()
+    bad = _decision(decision_id="d2")
+    del bad["decision_hash"]
+    with pytest.raises(ValueError):
+        rt.execute_many([_decision(decision_id="d1"), bad])
+
+
+def test_execute_many_invalid_registry_blocks_every_record(monkeypatch):
+    rt = ExecutionRuntimeV0_1()
+    bad = dict(registry.ACTION_REGISTRY)
+    bad["NOOP"] = dict(bad["NOOP"], declared_channels=["log"])
+    monkeypatch.setattr(registry, "ACTION_REGISTRY", bad, raising=True)
+
+    recs = rt.execute_many([_decision(decision_id="d1"), _decision(decision_id="d2")])
+    assert [r.result.note for r in recs] == ["Registry metadata invalid"] * 2
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import hashlib
+
+import pytest
+
+from layer8_execution.execution_export_v0_1 import export_execution_record
+from layer8_execution.execution_runtime_v0_1 import ExecutionRuntimeV0_1
+from layer8_execution.side_effects_v0_1 import SideEffectBus, SideEffectSpillConflictError, iter_spilled_events
+from utils.canonical_json import canonical_json_bytes
+
+
+def _bus(spill_path):
+    return SideEffectBus(
+        declared_channels=("log", "metric"),
+        clock_utc=lambda: "1970-01-01T00:00:00Z",
+        action_id="TEST",
+        run_id="RUN",
+        spill_path=spill_path,
+    )
+
+
+def test_spill_bus_streams_canonical_jsonl_with_running_digest(tmp_path):
+    path = tmp_path / "spill" / "RUN.jsonl"
+    with _bus(path) as bus:
+        bus.emit("log", {"msg": "é"})
+        bus.emit("metric", {"v": 1})
+        with pytest.raises(RuntimeError):
+            bus.snapshot()
+
+    raw = path.read_bytes()
+    events = list(iter_spilled_events(path))
+    assert [e["seq"] for e in events] == [1, 2]
+    assert raw == b"".join(canonical_json_bytes(e) + b"\n" for e in events)
+
+    digest = bus.stream_digest()
+    assert digest == {"count": 2, "sha256": hashlib.sha256(raw).hexdigest(), "channels": ["log", "metric"]}
+
+
+def test_spill_bus_refuses_to_overwrite_an_existing_stream(tmp_path):
+    path = tmp_path / "RUN.jsonl"
+    with _bus(path) as bus:
+        bus.emit("log", {"msg": "first"})
+    before = path.read_bytes()
+
+    with _bus(path) as bus:
+        with pytest.raises(FileExistsError):
+            bus.emit("log", {"msg": "second"})
+    assert path.read_bytes() == before
+
+
+def test_spill_bus_replay_matches_existing_stream_byte_for_byte(tmp_path):
+    path = tmp_path / "RUN.jsonl"
+    with _bus(path) as first:
+        first.emit("log", {"msg": "a"})
+        first.emit("metric", {"v": 1})
+    before = path.read_bytes()
+
+    with _bus(path) as replay:
+        replay.emit("log", {"msg": "a"})
+        replay.emit("metric", {"v": 1})
+    assert replay.stream_digest() == first.stream_digest()
+    assert path.read_bytes() == before
+
+    with pytest.raises(SideEffectSpillConflictError):
+        with _bus(path) as shorter:
+            shorter.emit("log", {"msg": "a"})
+    assert path.read_bytes() == before
+
+
+def test_spill_bus_without_events_writes_no_file(tmp_path):
+    path = tmp_path / "RUN.jsonl"
+    with _bus(path) as bus:
+        pass
+    assert not path.exists()
+    assert bus.stream_digest() == {"count": 0, "sha256": hashlib.sha256(b"").hexdigest(), "channels": []}
+
+
+def test_runtime_spill_mode_commits_to_stream_digest(tmp_path):
+    d = {"decision_id": "d1", "verdict": "ALLOW", "authorized_action": "NOOP", "parameters": {}, "decision_hash": "H"}
+
+    in_memory = ExecutionRuntimeV0_1().execute(d)
+    spilled = ExecutionRuntimeV0_1(side_effect_spill_dir=tmp_path).execute(d)
+
+    assert in_memory.side_effect_stream is None
+    assert "side_effect_stream" not in export_execution_record(in_memory)
+
+    assert spilled.result.status == "SUCCESS"
+    assert spilled.side_effect_events == ()
+    assert spilled.side_effect_stream == {"count": 0, "sha256": hashlib.sha256(b"").hexdigest()}
+    assert spilled.record_hash != in_memory.record_hash
+    assert export_execution_record(spilled)["side_effect_stream"] == spilled.side_effect_stream
+    assert ExecutionRuntimeV0_1(side_effect_spill_dir=tmp_path).execute(d) == spilled
+
+
+class _EmittingRuntime(ExecutionRuntimeV0_1):
+    payload_base = 0
+
+    def _open_bus(self, req, declared):
+        bus = SideEffectBus(**dict(self._bus_kwargs(req, declared), declared_channels=("log",)))
+        bus.emit("log", {"n": self.payload_base + 1})
+        bus.emit("log", {"n": self.payload_base + 2})
+        return bus
+
+
+_D = {"decision_id": "d1", "verdict": "ALLOW", "authorized_action": "NOOP", "parameters": {}, "decision_hash": "H"}
+
+
+def test_runtime_spill_mode_audit_trace_counts_spilled_events(tmp_path):
+    d = _D
+    spilled = _EmittingRuntime(side_effect_spill_dir=tmp_path).execute(d)
+    in_memory = _EmittingRuntime().execute(d)
+
+    assert spilled.side_effect_stream["count"] == 2
+    assert spilled.audit_trace["emitted_count"] == spilled.audit_trace["side_effect_count"] == 2
+    assert in_memory.audit_trace["emitted_count"] == in_memory.audit_trace["side_effect_count"] == 2
+
+
+def test_runtime_spill_mode_reexecution_is_a_replay(tmp_path):
+    rt = _EmittingRuntime(side_effect_spill_dir=tmp_path)
+    first = rt.execute(_D)
+    spill = next(tmp_path.iterdir())
+    before = spill.read_bytes()
+
+    assert rt.execute(_D) == first
+    assert rt.execute_many([_D, _D]) == [first, first]
+    assert spill.read_bytes() == before
+
+    diverging = _EmittingRuntime(side_effect_spill_dir=tmp_path)
+    diverging.payload_base = 100
+    blocked = diverging.execute(_D)
+    assert blocked.result.status == "BLOCKED"
+    assert blocked.result.note == "Side-effect spill failed: SideEffectSpillConflictError"
+    assert spill.read_bytes() == before
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import pytest
+
+from layer8_execution.execution_record_v0_1 import ExecutionRecord, ExecutionRequest, ExecutionResult
+from layer8_execution.execution_runtime_v0_1 import ExecutionRuntimeV0_1, _events_to_wire
+from layer8_execution.side_effects_v0_1 import SideEffectEvent
+
+
+@pytest.mark.parametrize("cls", [SideEffectEvent, ExecutionRequest, ExecutionResult, ExecutionRecord])
+def test_models_are_slotted(cls):
+    assert "__slots__" in cls.__dict__
+    assert "__dict__" not in cls.__dict__
+
+
+def test_events_to_wire_shape():
+    ev = SideEffectEvent(seq=3, timestamp_utc="t", channel="log", payload={"a": 1}, action_id="A", run_id="R")
+    (wire,) = _events_to_wire((ev,))
+    assert wire == {"seq": 3, "timestamp_utc": "t", "channel": "log", "payload": {"a": 1}, "action_id": "A", "run_id": "R"}
+    assert wire["payload"] is not ev.payload
+
+
+def test_record_still_replaceable_and_comparable():
+    from dataclasses import replace
+
+    rt = ExecutionRuntimeV0_1()
+    rec = rt.execute({"decision_id": "d", "verdict": "ALLOW", "authorized_action": "NOOP", "parameters": {}, "decision_hash": "H"})
+    assert replace(rec) == rec
+    with pytest.raises(AttributeError):
+        rec.record_hash = "x"  # type: ignore[misc]
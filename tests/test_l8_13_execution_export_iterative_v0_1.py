@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import asdict, dataclass, is_dataclass
+from typing import Any, Dict, List, Mapping
+
+import pytest
+
+from layer8_execution.execution_export_v0_1 import _to_json_safe, export_execution_record
+from layer8_execution.execution_runtime_v0_1 import ExecutionRuntimeV0_1
+from layer10_policy_verdict.verdict_types_v0_1 import VerdictCode
+from utils.canonical_json import canonical_dumps
+
+
+def _legacy_to_json_safe(obj: Any) -> Any:
+    # Reference: the original recursive asdict-based exporter.
+    if isinstance(obj, (str, int, float, bool, type(None))):
+        return obj
+    if is_dataclass(obj):
+        return _legacy_to_json_safe(asdict(obj))
+    if isinstance(obj, Mapping):
+        out: Dict[str, Any] = {}
+        for k in sorted(obj.keys()):
+            if not isinstance(k, str):
+                raise TypeError(k)
+            out[k] = _legacy_to_json_safe(obj[k])
+        return out
+    if isinstance(obj, (list, tuple)):
+        return [_legacy_to_json_safe(x) for x in obj]
+    raise TypeError(type(obj).__name__)
+
+
+@dataclass(frozen=True)
+class _Inner:
+    b: tuple
+    a: Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class _Outer:
+    z: _Inner
+    y: list
+    code: VerdictCode = VerdictCode.WARN
+
+
+def _samples():
+    inner = _Inner(b=(1, "x", None, (True, 2.5)), a={"k": [{"n": 1}], "c": ()})
+    return [
+        "s",
+        7,
+        {"b": 1, "a": {"d": [], "c": {}}},
+        (1, [2, (3, {"x": inner})]),
+        _Outer(z=inner, y=[inner, {"q": VerdictCode.DENY}]),
+    ]
+
+
+@pytest.mark.parametrize("obj", _samples())
+def test_iterative_export_matches_legacy_exporter(obj):
+    new, old = _to_json_safe(obj), _legacy_to_json_safe(obj)
+    assert new == old
+    assert canonical_dumps(new) == canonical_dumps(old)
+    if isinstance(new, dict):
+        assert list(new) == list(old)
+
+
+def test_export_record_unchanged_against_legacy():
+    rt = ExecutionRuntimeV0_1()
+    rec = rt.execute({"decision_id": "d", "verdict": "ALLOW", "authorized_action": "NOOP", "parameters": {"deny": True}, "decision_hash": "H"})
+    out = export_execution_record(rec)
+    assert canonical_dumps(out) == canonical_dumps(
+        _legacy_to_json_safe(
+            {
+                "execution_id": rec.execution_id,
+                "decision_hash": rec.decision_hash,
+                "result": rec.result,
+                "audit_trace": rec.audit_trace,
+                "side_effect_events": rec.side_effect_events,
+                "policy_verdict": rec.policy_verdict,
+                "record_hash": rec.record_hash,
+            }
+        )
+    )
+
+
+def test_deep_nesting_beyond_recursion_limit():
+    depth = sys.getrecursionlimit() * 3
+    obj: Any = {"leaf": 1}
+    for _ in range(depth):
+        obj = {"n": [obj]}
+    out = _to_json_safe(obj)
+    for _ in range(depth):
+        out = out["n"][0]
+    assert out == {"leaf": 1}
+
+
+def _self_dict():
+    d: Dict[str, Any] = {"a": 1}
+    d["self"] = d
+    return d
+
+
+def _self_list():
+    lst: List[Any] = [1]
+    lst.append({"back": lst})
+    return lst
+
+
+@pytest.mark.parametrize("make", [_self_dict, _self_list])
+def test_cycles_are_rejected_not_looped(make):
+    with pytest.raises(TypeError, match="cyclic"):
+        _to_json_safe(make())
+
+
+def test_shared_acyclic_references_are_allowed():
+    shared = {"x": [1, 2]}
+    assert _to_json_safe({"a": shared, "b": [shared, shared]}) == {
+        "a": {"x": [1, 2]},
+        "b": [{"x": [1, 2]}, {"x": [1, 2]}],
+    }
+
+
+@pytest.mark.parametrize("bad", [{1: "x"}, {"a": {2, 3}}, [object()], _Outer])
+def test_non_json_safe_still_rejected(bad):
+    with pytest.raises(TypeError):
+        _to_json_safe(bad)
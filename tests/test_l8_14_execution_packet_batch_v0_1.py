@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+
+from layer8_execution.execution_export_v0_1 import export_execution_record
+from layer8_execution.execution_packet_batch_v0_1 import (
+    merkle_levels,
+    merkle_proof,
+    merkle_root,
+    read_execution_packet_batch_v0_1,
+    verify_inclusion,
+    write_execution_packet_batch_v0_1,
+)
+from layer8_execution.execution_runtime_v0_1 import ExecutionRuntimeV0_1
+
+
+def _records(n: int):
+    rt = ExecutionRuntimeV0_1()
+    return rt.execute_many(
+        [
+            {
+                "decision_id": f"d{i}",
+                "verdict": "ALLOW" if i % 3 else "DENY",
+                "authorized_action": "NOOP",
+                "parameters": {},
+                "decision_hash": f"H{i}",
+            }
+            for i in range(n)
+        ]
+    )
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 7, 8])
+def test_batch_packet_proofs_verify_against_root(tmp_path, n):
+    recs = _records(n)
+    path = tmp_path / "batch.jsonl"
+    header = write_execution_packet_batch_v0_1(path, recs)
+
+    lines = list(read_execution_packet_batch_v0_1(path))
+    assert lines[0] == header
+    assert header["record_count"] == n
+    assert header["merkle_root"] == merkle_root([r.record_hash for r in recs])
+
+    for i, (line, rec) in enumerate(zip(lines[1:], recs)):
+        assert line["index"] == i
+        assert line["record_hash"] == rec.record_hash
+        assert line["execution_record"] == export_execution_record(rec)
+        assert verify_inclusion(line["record_hash"], line["proof"], header["merkle_root"])
+
+
+def test_batch_packet_is_deterministic_and_order_sensitive(tmp_path):
+    recs = _records(5)
+    h1 = write_execution_packet_batch_v0_1(tmp_path / "a.jsonl", recs)
+    h2 = write_execution_packet_batch_v0_1(tmp_path / "b.jsonl", recs)
+    assert (tmp_path / "a.jsonl").read_bytes() == (tmp_path / "b.jsonl").read_bytes()
+    assert h1["packet_hash"] == h2["packet_hash"]
+
+    h3 = write_execution_packet_batch_v0_1(tmp_path / "c.jsonl", list(reversed(recs)))
+    assert h3["merkle_root"] != h1["merkle_root"]
+
+
+def test_tampered_proof_or_hash_fails():
+    recs = _records(4)
+    hashes = [r.record_hash for r in recs]
+    root = merkle_root(hashes)
+    proof = merkle_proof(merkle_levels(hashes), 2)
+    assert verify_inclusion(hashes[2], proof, root)
+    assert not verify_inclusion(hashes[1], proof, root)
+    assert not verify_inclusion(hashes[2], proof[:-1], root)
+
+
+def test_empty_batch_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        write_execution_packet_batch_v0_1(tmp_path / "x.jsonl", [])
+    assert not (tmp_path / "x.jsonl").exists()
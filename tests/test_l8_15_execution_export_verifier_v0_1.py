@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+
+from layer8_execution.execution_export_v0_1 import export_execution_record
+from layer8_execution.execution_packet_batch_v0_1 import write_execution_packet_batch_v0_1
+from layer8_execution.execution_packet_v0_1 import build_execution_packet_v0_1
+from layer8_execution.execution_runtime_v0_1 import ExecutionRuntimeV0_1
+from layer8_execution.execution_verify_v0_1 import summarize_verification, verify_exports
+from utils.canonical_json import canonical_json_line
+
+
+def _records(n: int, *, spill_dir=None):
+    rt = ExecutionRuntimeV0_1(side_effect_spill_dir=spill_dir)
+    return rt.execute_many(
+        [
+            {
+                "decision_id": f"d{i}",
+                "verdict": "ALLOW",
+                "authorized_action": "NOOP",
+                "parameters": {"deny": True} if i == 1 else {"action": "a", "target": "t"},
+                "decision_hash": f"H{i}",
+            }
+            for i in range(n)
+        ]
+    )
+
+
+def _write_single_packets(path, recs):
+    path.write_text("".join(canonical_json_line(build_execution_packet_v0_1(r)) for r in recs), encoding="utf-8")
+
+
+def test_clean_exports_verify_ok(tmp_path):
+    recs = _records(4)
+    (tmp_path / "a").mkdir()
+    _write_single_packets(tmp_path / "a" / "single.jsonl", recs)
+    write_execution_packet_batch_v0_1(tmp_path / "a" / "batch.jsonl", recs)
+    (tmp_path / "bare.jsonl").write_text(
+        "".join(canonical_json_line(export_execution_record(r)) for r in _records(2, spill_dir=tmp_path / "spill")),
+        encoding="utf-8",
+    )
+
+    summary = summarize_verification(verify_exports([tmp_path]))
+    assert summary["ok"] is True, summary["issues"]
+    assert summary["files"] == 3
+    assert summary["records"] == 4 + 4 + 2
+    assert summary["packets"] == 4 + 1
+
+
+def test_tampered_records_are_located(tmp_path):
+    recs = _records(3)
+    single = tmp_path / "single.jsonl"
+    _write_single_packets(single, recs)
+    lines = single.read_text(encoding="utf-8").splitlines()
+    pkt = json.loads(lines[1])
+    pkt["execution_record"]["result"]["note"] = "tampered"
+    lines[1] = json.dumps(pkt)
+    single.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    batch = tmp_path / "batch.jsonl"
+    write_execution_packet_batch_v0_1(batch, recs)
+    blines = batch.read_text(encoding="utf-8").splitlines()
+    rec = json.loads(blines[3])
+    rec["execution_record"]["audit_trace"]["verdict"] = "DENY"
+    blines[3] = json.dumps(rec)
+    batch.write_text("\n".join(blines) + "\n", encoding="utf-8")
+
+    summary = summarize_verification(verify_exports([single, batch], workers=2))
+    assert summary["ok"] is False
+    located = {(i["path"], i["line"], i["field"]) for i in summary["issues"]}
+    assert (str(single), 2, "result.execution_hash") in located
+    assert (str(single), 2, "record_hash") in located
+    assert (str(single), 2, "packet_hash") in located
+    assert (str(batch), 4, "record_hash") in located
+    assert all(i["line"] in (2, 4) for i in summary["issues"])
+
+
+def test_batch_structure_tamper_detected(tmp_path):
+    batch = tmp_path / "batch.jsonl"
+    write_execution_packet_batch_v0_1(batch, _records(3))
+    lines = batch.read_text(encoding="utf-8").splitlines()
+    del lines[2]  # drop a record line
+    batch.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    fields = {i["field"] for i in summarize_verification(verify_exports([batch]))["issues"]}
+    assert {"index", "record_count", "merkle_root"} <= fields
+
+
+def test_malformed_lines_are_located_without_aborting(tmp_path):
+    recs = _records(2)
+    single = tmp_path / "single.jsonl"
+    _write_single_packets(single, recs)
+    lines = single.read_text(encoding="utf-8").splitlines()
+    pkt = json.loads(lines[0])
+    pkt["execution_record"] = "not-a-record"
+    lines[0] = json.dumps(pkt)
+    single.write_bytes(("\n".join(lines) + "\n").encode("utf-8") + b"\xff\xfe{\n")
+
+    batch = tmp_path / "batch.jsonl"
+    write_execution_packet_batch_v0_1(batch, recs)
+    blines = batch.read_text(encoding="utf-8").splitlines()
+    rec = json.loads(blines[1])
+    rec["execution_record"] = ["not", "a", "record"]
+    blines[1] = json.dumps(rec)
+    batch.write_text("\n".join(blines) + "\n", encoding="utf-8")
+
+    summary = summarize_verification(verify_exports([single, batch], workers=2))
+    located = {(i["path"], i["line"], i["field"]) for i in summary["issues"]}
+    assert (str(single), 1, "execution_record") in located
+    assert (str(single), 3, "line") in located
+    assert (str(batch), 2, "execution_record") in located
+    assert not any(i["path"] == str(single) and i["line"] == 2 for i in summary["issues"])
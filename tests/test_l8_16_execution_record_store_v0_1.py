@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import pytest
+
+from layer8_execution.execution_export_v0_1 import export_execution_record
+from layer8_execution.execution_record_store_v0_1 import ExecutionRecordStore
+from layer8_execution.execution_runtime_v0_1 import ExecutionRuntimeV0_1
+
+
+def _decision(decision_id: str, verdict: str = "DENY") -> dict:
+    return {
+        "decision_id": decision_id,
+        "verdict": verdict,
+        "authorized_action": "NOOP",
+        "parameters": {},
+        "decision_hash": f"H-{decision_id}",
+    }
+
+
+def test_store_dedups_identical_records_and_roundtrips(tmp_path):
+    store = ExecutionRecordStore(tmp_path / "store")
+    rt = ExecutionRuntimeV0_1()
+    r1 = rt.execute(_decision("d1"))
+    r1_again = rt.execute(_decision("d1"))
+    r2 = rt.execute(_decision("d2", verdict="ALLOW"))
+
+    assert store.put(r1) == (r1.record_hash, True)
+    assert store.put(r1_again) == (r1.record_hash, False)
+    assert store.put(export_execution_record(r2)) == (r2.record_hash, True)
+
+    assert store.exists(r1.record_hash) and r2.record_hash in store
+    assert store.get(r1.record_hash) == export_execution_record(r1)
+    assert list(store.iter_hashes()) == sorted([r1.record_hash, r2.record_hash])
+
+    p = store.path_for(r1.record_hash)
+    assert p.parent.parent.name == r1.record_hash[:2] and p.parent.name == r1.record_hash[2:4]
+
+
+def test_store_rejects_tampered_or_invalid_keys(tmp_path):
+    store = ExecutionRecordStore(tmp_path)
+    exported = export_execution_record(ExecutionRuntimeV0_1().execute(_decision("d1")))
+    exported["result"]["note"] = "tampered"
+    with pytest.raises(ValueError):
+        store.put(exported)
+    assert not store.exists(exported["record_hash"])
+
+    with pytest.raises(KeyError):
+        store.get("0" * 64)
+    with pytest.raises(ValueError):
+        store.path_for("../../etc/passwd")
+    assert "../x" not in store
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from layer8_execution.execution_runtime_v0_1 import ExecutionRuntimeV0_1
+from layer8_execution.execution_scheduler_v0_1 import ExecutionSchedulerV0_1, ScheduledDecision, canonical_order
+
+
+def _item(decision_id: str, *, deps=(), channels=()) -> ScheduledDecision:
+    return ScheduledDecision(
+        decision={
+            "decision_id": decision_id,
+            "verdict": "ALLOW",
+            "authorized_action": "NOOP",
+            "parameters": {"action": "a", "target": "t"},
+            "decision_hash": f"H-{decision_id}",
+        },
+        depends_on=tuple(deps),
+        channels=tuple(channels),
+    )
+
+
+class _TracingRuntime(ExecutionRuntimeV0_1):
+    def __init__(self, channels_by_id):
+        super().__init__()
+        self._channels_by_id = channels_by_id
+        self._lock = threading.Lock()
+        self.active: dict[str, int] = {}
+        self.max_active = 0
+        self.channel_overlap = False
+        self.started: list[str] = []
+        self._finished: list[str] = []
+
+    def execute(self, decision):
+        d = decision["decision_id"]
+        with self._lock:
+            self.started.append(d)
+            for ch in self._channels_by_id.get(d, ()):
+                self.active[ch] = self.active.get(ch, 0) + 1
+                if self.active[ch] > 1:
+                    self.channel_overlap = True
+            self.max_active = max(self.max_active, len(self.started) - len(self._finished))
+        time.sleep(0.01)
+        rec = super().execute(decision)
+        with self._lock:
+            for ch in self._channels_by_id.get(d, ()):
+                self.active[ch] -= 1
+            self._finished.append(d)
+        return rec
+
+
+def test_canonical_order_is_topological_with_id_ties():
+    items = [_item("c"), _item("b", deps=["c"]), _item("a", deps=["b"]), _item("d")]
+    assert canonical_order(items) == ["c", "b", "a", "d"]
+    assert canonical_order([_item("z"), _item("y"), _item("x", deps=["z"])]) == ["y", "z", "x"]
+
+
+def test_scheduler_records_match_serial_in_canonical_order():
+    items = [_item("d3", deps=["d1"]), _item("d1"), _item("d2"), _item("d4", deps=["d2", "d3"])]
+    recs = ExecutionSchedulerV0_1(max_workers=4).run(items)
+    rt = ExecutionRuntimeV0_1()
+    order = canonical_order(items)
+    assert order == ["d1", "d2", "d3", "d4"]
+    assert recs == [rt.execute(next(i.decision for i in items if i.decision_id == d)) for d in order]
+
+
+def test_scheduler_runs_parallel_but_serializes_shared_channels():
+    channels = {"a": ("log",), "b": ("log",), "c": ("log",), "x": (), "y": ()}
+    items = [_item(d, channels=ch) for d, ch in channels.items()]
+    rt = _TracingRuntime(channels)
+    ExecutionSchedulerV0_1(rt, max_workers=5).run(items)
+
+    assert rt.channel_overlap is False
+    assert rt.max_active >= 2
+    log_starts = [d for d in rt.started if d in ("a", "b", "c")]
+    assert log_starts == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize(
+    "items",
+    [
+        [_item("a", deps=["b"]), _item("b", deps=["a"])],
+        [_item("a", deps=["missing"])],
+        [_item("a"), _item("a")],
+    ],
+)
+def test_scheduler_fail_closed_on_bad_graph(items):
+    with pytest.raises(ValueError):
+        ExecutionSchedulerV0_1().run(items)
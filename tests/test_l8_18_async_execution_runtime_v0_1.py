@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from layer8_execution.execution_runtime_async_v0_1 import AsyncExecutionRuntime
+from layer8_execution.execution_runtime_v0_1 import ExecutionRuntimeV0_1
+from layer8_execution.side_effects_v0_1 import AsyncSideEffectBus, SideEffectBus, SideEffectPolicyError
+
+
+def _decision(i: int, **over):
+    d = {
+        "decision_id": f"D-{i}",
+        "verdict": "ALLOW",
+        "authorized_action": "NOOP",
+        "parameters": {"action": "a", "target": "t"},
+        "decision_hash": f"H-{i}",
+    }
+    d.update(over)
+    return d
+
+
+def _mixed():
+    return [
+        _decision(0),
+        _decision(1, verdict="DENY"),
+        _decision(2, authorized_action="NOT_REGISTERED"),
+        _decision(3, parameters={"deny": True, "action": "a", "target": "t"}),
+        _decision(4, parameters={}),
+    ]
+
+
+def test_async_records_are_interchangeable_with_sync():
+    sync = ExecutionRuntimeV0_1()
+    expected = [sync.execute(d) for d in _mixed()]
+
+    art = AsyncExecutionRuntime()
+    single = [asyncio.run(art.execute(d)) for d in _mixed()]
+    batch = asyncio.run(art.execute_many(_mixed()))
+
+    assert single == expected
+    assert batch == expected
+
+
+def test_async_spill_mode_matches_sync(tmp_path):
+    sync = ExecutionRuntimeV0_1(side_effect_spill_dir=tmp_path / "sync")
+    art = AsyncExecutionRuntime(side_effect_spill_dir=tmp_path / "async")
+    assert asyncio.run(art.execute_many(_mixed())) == [sync.execute(d) for d in _mixed()]
+
+
+def test_execute_many_validates_before_running():
+    art = AsyncExecutionRuntime()
+    with pytest.raises(ValueError):
+        asyncio.run(art.execute_many([_decision(0), {"decision_id": "bad"}]))
+
+
+def test_concurrency_is_bounded(monkeypatch):
+    art = AsyncExecutionRuntime(max_concurrency=2)
+    state = {"active": 0, "peak": 0}
+    orig = art._gate
+
+    async def slow_gate(*args):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        try:
+            return await orig(*args)
+        finally:
+            state["active"] -= 1
+
+    monkeypatch.setattr(art, "_gate", slow_gate)
+    recs = asyncio.run(art.execute_many([_decision(i) for i in range(8)]))
+    assert [r.audit_trace["decision_id"] for r in recs] == [f"D-{i}" for i in range(8)]
+    assert state["peak"] == 2
+
+    # runtime can be reused across event loops
+    assert len(asyncio.run(art.execute_many([_decision(9)]))) == 1
+
+
+def test_async_bus_captures_like_sync_bus_and_awaits_sinks():
+    delivered = []
+
+    async def sink(ev):
+        await asyncio.sleep(0)
+        delivered.append(ev.seq)
+
+    kwargs = dict(declared_channels=("log",), clock_utc=lambda: "T", action_id="A", run_id="R")
+
+    async def run():
+        async with AsyncSideEffectBus(sinks={"log": sink}, **kwargs) as bus:
+            await bus.aemit("log", {"n": 1})
+            await bus.aemit("log", {"n": 2})
+            with pytest.raises(SideEffectPolicyError):
+                await bus.aemit("net", {})
+        return bus.snapshot()
+
+    events = asyncio.run(run())
+
+    ref = SideEffectBus(**kwargs)
+    ref.emit("log", {"n": 1})
+    ref.emit("log", {"n": 2})
+    assert events == ref.snapshot()
+    assert delivered == [1, 2]
+
+
+def test_max_concurrency_must_be_positive():
+    with pytest.raises(ValueError):
+        AsyncExecutionRuntime(max_concurrency=0)
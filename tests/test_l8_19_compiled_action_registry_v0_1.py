@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pytest
+
+import layer8_execution.action_registry_v0_1 as registry
+from layer8_execution.action_registry_v0_1 import (
+    compile_action_registry,
+    compiled_action_registry,
+    get_declared_side_effect_channels,
+    is_action_allowed,
+)
+
+
+def _meta(**over):
+    meta = {"description": "x", "declared_channels": (), "side_effects": False, "version": "0.1"}
+    meta.update(over)
+    return meta
+
+
+def test_shipped_registry_is_compiled_once_and_read_only():
+    compiled = compiled_action_registry()
+    assert compiled is compiled_action_registry()
+    assert compiled.source is registry.ACTION_REGISTRY
+    assert compiled.allowed == frozenset({"NOOP"})
+    assert compiled.channels["NOOP"] == ()
+    assert not compiled.errors
+
+    with pytest.raises(TypeError):
+        registry.ACTION_REGISTRY["EVIL"] = _meta()  # type: ignore[index]
+    with pytest.raises(TypeError):
+        registry.ACTION_REGISTRY["NOOP"]["side_effects"] = True  # type: ignore[index]
+
+
+def test_lookups_match_legacy_semantics():
+    assert is_action_allowed("NOOP")
+    assert not is_action_allowed("NOPE")
+    assert not is_action_allowed(None)  # type: ignore[arg-type]
+    assert get_declared_side_effect_channels("NOOP") == ()
+    with pytest.raises(ValueError, match="Action not allowed"):
+        get_declared_side_effect_channels("NOPE")
+
+
+def test_strict_compile_fails_closed_on_first_invalid_entry():
+    with pytest.raises(ValueError, match="declared_channels must be a tuple"):
+        compile_action_registry({"A": _meta(declared_channels=["log"])}, strict=True)
+    with pytest.raises(ValueError, match="metadata must be a mapping"):
+        compile_action_registry({"A": None}, strict=True)  # type: ignore[dict-item]
+
+
+def test_lenient_compile_keeps_invalid_entries_allowed_but_unusable():
+    compiled = compile_action_registry(
+        {
+            "GOOD": _meta(declared_channels=("log",), side_effects=True),
+            "BAD_CH": _meta(declared_channels=("log", " ")),
+            "BAD_FLAG": _meta(side_effects="no"),
+            "MISMATCH": _meta(side_effects=True),
+        }
+    )
+    assert compiled.declared_channels("GOOD") == ("log",)
+    for action, msg in [
+        ("BAD_CH", "invalid channel entry"),
+        ("BAD_FLAG", "side_effects must be bool"),
+        ("MISMATCH", "must match declared_channels emptiness"),
+    ]:
+        assert compiled.is_allowed(action)
+        with pytest.raises(ValueError, match=msg):
+            compiled.declared_channels(action)
+
+
+def test_replaced_registry_is_recompiled(monkeypatch):
+    original = compiled_action_registry()
+    monkeypatch.setattr(registry, "ACTION_REGISTRY", {"NOOP": _meta(), "LOG": _meta(declared_channels=("log",), side_effects=True)})
+    swapped = compiled_action_registry()
+    assert swapped is not original
+    assert get_declared_side_effect_channels("LOG") == ("log",)
+
+    monkeypatch.undo()
+    assert compiled_action_registry().source is registry.ACTION_REGISTRY
+    assert not is_action_allowed("LOG")
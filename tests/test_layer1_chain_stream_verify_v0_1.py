@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+import shutil
+
+import pytest
+
+from layer1_integrity_core.chain import gus_chain_v4_stub as chain
+from layer1_integrity_core.chain.gus_chain_v4_stub import (
+    ChainCheckpoint,
+    GENESIS_PREV_HASH,
+    compute_chain_hash,
+    compute_payload_hash,
+    load_chain_checkpoint,
+    verify_chain,
+    verify_chain_incremental,
+    verify_chain_stream,
+)
+
+
+def _entry(prev_hash: str, i: int) -> dict:
+    payload = {"i": i, "text": "ä–"}
+    payload_hash = compute_payload_hash(payload)
+    ts = f"2025-01-01T00:00:{i:02d}+00:00"
+    return {
+        "chain_hash": compute_chain_hash(prev_hash, ts, "TEST", payload_hash),
+        "event_type": "TEST",
+        "payload": payload,
+        "payload_hash": payload_hash,
+        "prev_hash": prev_hash,
+        "timestamp": ts,
+    }
+
+
+def _write(path, n: int, start_hash: str = GENESIS_PREV_HASH, mode: str = "w") -> str:
+    prev = start_hash
+    with path.open(mode, encoding="utf-8") as f:
+        for i in range(n):
+            e = _entry(prev, i)
+            f.write(json.dumps(e, sort_keys=True, ensure_ascii=False) + "\n")
+            prev = e["chain_hash"]
+    return prev
+
+
+def test_repo_chain_log_links_verify(tmp_path):
+    result = verify_chain_stream(chain.CHAIN_LOG_PATH)
+    assert result.ok is True and result.errors == []
+    assert result.checkpoint.entries == 2
+    assert result.checkpoint.offset == chain.CHAIN_LOG_PATH.stat().st_size
+
+    copy = tmp_path / "chain.txt"
+    shutil.copy(chain.CHAIN_LOG_PATH, copy)
+    copy.write_text(copy.read_text(encoding="utf-8").replace("First Guardian", "Second Guardian", 1), encoding="utf-8")
+    assert verify_chain(copy) == (True, [])  # note is not covered by the link
+
+    copy.write_text(copy.read_text(encoding="utf-8").replace("0, 1, 2", "0, 9, 2", 1), encoding="utf-8")
+    assert verify_chain(copy) == (False, ["chain_payload_hash_mismatch:entry=1"])
+
+
+@pytest.mark.parametrize(
+    "mutate, error",
+    [
+        (lambda e: e.update(prev_hash="0" * 64), "chain_prev_hash_mismatch:entry=3"),
+        (lambda e: e.update(timestamp="later"), "chain_hash_mismatch:entry=3"),
+        (lambda e: e.pop("payload_hash"), "chain_entry_incomplete:entry=3"),
+    ],
+)
+def test_broken_link_stops_at_last_good_entry(tmp_path, mutate, error):
+    path = tmp_path / "chain.txt"
+    _write(path, 5)
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    bad = json.loads(lines[2])
+    mutate(bad)
+    lines[2] = json.dumps(bad, sort_keys=True, ensure_ascii=False) + "\n"
+    path.write_text("".join(lines), encoding="utf-8")
+
+    result = verify_chain_stream(path)
+    assert result.ok is False
+    assert result.errors == [error]
+    assert result.checkpoint.entries == 2
+    assert result.checkpoint.offset == len("".join(lines[:2]).encode("utf-8"))
+
+
+def test_resume_from_checkpoint_reads_only_the_tail(tmp_path, monkeypatch):
+    path = tmp_path / "chain.txt"
+    last = _write(path, 50)
+    first = verify_chain_stream(path)
+    assert first.ok and first.checkpoint.entries == 50 and first.checkpoint.last_hash == last
+
+    _write(path, 3, start_hash=last, mode="a")
+    checked = []
+    real = chain._check_entry
+    monkeypatch.setattr(chain, "_check_entry", lambda raw, prev, i: checked.append(i) or real(raw, prev, i))
+
+    second = verify_chain_stream(path, checkpoint=first.checkpoint)
+    assert second.ok and second.errors == []
+    assert checked == [51, 52, 53]
+    assert second.checkpoint.entries == 53
+    assert second.checkpoint.offset == path.stat().st_size
+
+    # resuming at the end is a no-op that keeps the checkpoint
+    assert verify_chain_stream(path, checkpoint=second.checkpoint).checkpoint == second.checkpoint
+
+
+def test_checkpoint_that_no_longer_matches_fails_closed(tmp_path):
+    path = tmp_path / "chain.txt"
+    _write(path, 4)
+    cp = verify_chain_stream(path).checkpoint
+
+    _write(path, 4)  # same length, same content: still valid
+    assert verify_chain_stream(path, checkpoint=cp).ok is True
+
+    _write(path, 2)  # truncated
+    assert verify_chain(path, checkpoint=cp) == (False, ["chain_checkpoint_mismatch"])
+
+    forged = ChainCheckpoint(offset=cp.offset, entries=cp.entries, last_hash="f" * 64, last_line_start=cp.last_line_start)
+    _write(path, 4)
+    assert verify_chain(path, checkpoint=forged) == (False, ["chain_checkpoint_mismatch"])
+
+
+def test_torn_tail_is_left_for_the_next_run(tmp_path):
+    path = tmp_path / "chain.txt"
+    last = _write(path, 2)
+    size = path.stat().st_size
+    nxt = json.dumps(_entry(last, 2), sort_keys=True, ensure_ascii=False)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(nxt[:20])
+
+    result = verify_chain_stream(path)
+    assert result.ok is True
+    assert result.errors == ["chain_tail_incomplete"]
+    assert result.checkpoint.offset == size
+
+    with path.open("a", encoding="utf-8") as f:
+        f.write(nxt[20:] + "\n")
+    resumed = verify_chain_stream(path, checkpoint=result.checkpoint)
+    assert resumed.ok and resumed.errors == [] and resumed.checkpoint.entries == 3
+
+
+def test_incremental_records_checkpoint(tmp_path):
+    path, cp_path = tmp_path / "chain.txt", tmp_path / "cp.json"
+    last = _write(path, 3)
+    assert verify_chain_incremental(path, cp_path).ok
+    assert load_chain_checkpoint(cp_path).entries == 3
+
+    _write(path, 2, start_hash=last, mode="a")
+    assert verify_chain_incremental(path, cp_path).checkpoint.entries == 5
+
+    _write(path, 1)  # log replaced: falls back to a full pass
+    result = verify_chain_incremental(path, cp_path)
+    assert result.ok and result.checkpoint.entries == 1
+    assert load_chain_checkpoint(cp_path) == result.checkpoint
+
+
+def test_blank_lines_do_not_break_resume(tmp_path):
+    path = tmp_path / "chain.txt"
+    last = _write(path, 2)
+    with path.open("a", encoding="utf-8") as f:
+        f.write("\n\n")
+    cp = verify_chain_stream(path).checkpoint
+    _write(path, 1, start_hash=last, mode="a")
+    assert verify_chain_stream(path, checkpoint=cp).checkpoint.entries == 3
+
+
+def test_missing_and_empty_logs_stay_ok_in_skeleton_mode(tmp_path):
+    assert verify_chain(tmp_path / "nope.txt") == (True, ["chain_log_missing"])
+    (tmp_path / "empty.txt").write_text("\n\n", encoding="utf-8")
+    assert verify_chain(tmp_path / "empty.txt") == (True, ["chain_empty"])
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+
+import pytest
+
+from layer1_integrity_core.chain import genesis_spine_stub as gs
+from pas.pas_seal_engine_stub import mint_phase2_continuity_seal
+
+
+def _age(path) -> None:
+    """Move mtime out of the racy window so the hash may be memoized."""
+    old = path.stat().st_mtime_ns - 10 * gs._RACY_WINDOW_NS
+    os.utime(path, ns=(old, old))
+
+
+@pytest.fixture
+def manifests(tmp_path, monkeypatch):
+    layers = {}
+    for layer_id, src in gs.LAYER_MANIFESTS.items():
+        dst = tmp_path / src.relative_to(gs.PROJECT_ROOT)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(src, dst)
+        _age(dst)
+        layers[layer_id] = dst
+    monkeypatch.setattr(gs, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(gs, "LAYER_MANIFESTS", layers)
+    gs.clear_genesis_spine_cache()
+
+    loads = []
+    real = gs._load_manifest
+    monkeypatch.setattr(gs, "_load_manifest", lambda layer_id: loads.append(layer_id) or real(layer_id))
+    yield layers, loads
+    gs.clear_genesis_spine_cache()
+
+
+def _uncached_spine():
+    gs.clear_genesis_spine_cache()
+    return gs.compute_l0_l1_l2_spine()
+
+
+def test_repeat_calls_do_not_reread_manifests(manifests):
+    _, loads = manifests
+    first = gs.compute_l0_l1_l2_spine()
+    assert loads == ["L0", "L1", "L2"]
+
+    loads.clear()
+    assert gs.compute_l0_l1_l2_spine() == first
+    assert gs.get_genesis_hash() == first[-1]["chain_hash"]
+    mint_phase2_continuity_seal()
+    assert loads == []
+
+
+def test_changed_layer_recomputes_only_that_layer_and_its_suffix(manifests, monkeypatch):
+    layers, loads = manifests
+    before = gs.compute_l0_l1_l2_spine()
+
+    data = json.loads(layers["L1"].read_text(encoding="utf-8"))
+    data["__test_marker"] = True
+    layers["L1"].write_text(json.dumps(data), encoding="utf-8")
+    _age(layers["L1"])
+
+    chained = []
+    real_chain = gs._compute_chain_hash
+    monkeypatch.setattr(gs, "_compute_chain_hash", lambda lid, m, p: chained.append(lid) or real_chain(lid, m, p))
+
+    loads.clear()
+    after = gs.compute_l0_l1_l2_spine()
+    assert loads == ["L1"]
+    assert chained == ["L1", "L2"]
+    assert after[0] == before[0]
+    assert after[1]["manifest_hash"] != before[1]["manifest_hash"]
+    assert after == _uncached_spine()
+
+
+def test_recently_modified_manifest_is_not_memoized(manifests):
+    layers, loads = manifests
+    gs.compute_l0_l1_l2_spine()
+    layers["L2"].write_text(layers["L2"].read_text(encoding="utf-8"), encoding="utf-8")  # fresh mtime
+
+    loads.clear()
+    gs.compute_l0_l1_l2_spine()
+    gs.compute_l0_l1_l2_spine()
+    assert loads == ["L2", "L2"]
+
+
+def test_overrides_bypass_loading_and_share_the_prefix(manifests, monkeypatch):
+    _, loads = manifests
+    base = gs.compute_l0_l1_l2_spine()
+    loads.clear()
+
+    overridden = gs.compute_l0_l1_l2_spine({"L1": "a" * 64})
+    assert loads == []
+    assert overridden[0] == base[0]
+    assert overridden[1]["manifest_hash"] == "a" * 64
+    assert gs.compute_l0_l1_l2_spine() == base
+
+
+def test_returned_spine_is_a_copy(manifests):
+    spine = gs.compute_l0_l1_l2_spine()
+    spine[2]["chain_hash"] = "tampered"
+    assert gs.get_genesis_hash() != "tampered"
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+import layer1_integrity_core.L1_integrity_core_stub as l1
+from layer1_integrity_core.L1_git_index import clean_tracked_blobs
+from layer1_integrity_core.L1_integrity_core_stub import run_integrity_check, verify_integrity
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not available")
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True).stdout
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    root = tmp_path / "repo"
+    (root / "pkg").mkdir(parents=True)
+    _git(root, "init", "-q")
+    _git(root, "config", "user.email", "t@example.invalid")
+    _git(root, "config", "user.name", "t")
+    _git(root, "config", "core.autocrlf", "false")
+    files = {"pkg/a.py": b"a = 1\r\n", "pkg/b.py": b"b = 2\n", "c.txt": b"\xff\xfe raw"}
+    for rel, data in files.items():
+        (root / rel).write_bytes(data)
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "init")
+
+    manifest = root / "manifest.json"
+    manifest.write_text(
+        json.dumps({"files": [{"path": rel, "sha256": l1._hash_file(root / rel)} for rel in files]}),
+        encoding="utf-8",
+    )
+    monkeypatch.chdir(root)
+    monkeypatch.setattr(l1, "L1_MANIFEST_PATH", Path("manifest.json"))
+    monkeypatch.setattr(l1, "L1_HASH_CACHE_PATH", tmp_path / "cache.json")
+
+    calls: Counter = Counter()
+    real_hash = l1._hash_file
+
+    def counting_hash(p: Path, *tee) -> str:
+        calls[Path(p).as_posix()] += 1
+        return real_hash(p, *tee)
+
+    monkeypatch.setattr(l1, "_hash_file", counting_hash)
+    return root, calls
+
+
+def test_clean_tracked_blobs_reports_only_clean_tracked_files(repo):
+    root, _ = repo
+    blobs = clean_tracked_blobs(["pkg/a.py", "pkg/b.py", "c.txt", "untracked.txt", "../outside.txt"])
+    assert set(blobs) == {"pkg/a.py", "pkg/b.py", "c.txt"}
+    assert blobs["pkg/b.py"] == _git(root, "rev-parse", "HEAD:pkg/b.py").strip()
+
+    (root / "pkg/a.py").write_bytes(b"a = 3\n")  # worktree dirty
+    (root / "c.txt").write_bytes(b"staged")
+    _git(root, "add", "c.txt")  # index differs from HEAD
+    (root / "untracked.txt").write_text("u", encoding="utf-8")
+    assert set(clean_tracked_blobs(["pkg/a.py", "pkg/b.py", "c.txt", "untracked.txt"])) == {"pkg/b.py"}
+
+
+def test_clean_files_are_not_read_once_blob_digests_are_recorded(repo):
+    root, calls = repo
+    assert verify_integrity(use_git_index=True) == (True, [])
+    assert sum(calls.values()) == 3
+
+    # Touch every file: the stat cache misses, but the blob ids are unchanged.
+    for rel in ("pkg/a.py", "pkg/b.py", "c.txt"):
+        (root / rel).write_bytes((root / rel).read_bytes())
+    calls.clear()
+    status = run_integrity_check(use_git_index=True)
+    assert status.overall_ok is True
+    assert calls == Counter()
+
+    # Without the fast path (and racy mtimes defeating the stat cache) files are read.
+    assert verify_integrity() == (True, [])
+    assert sum(calls.values()) == 3
+
+
+def test_dirty_files_are_hashed_and_detected(repo):
+    root, calls = repo
+    verify_integrity(use_git_index=True)
+    (root / "pkg/b.py").write_bytes(b"b = 999\n")
+    calls.clear()
+
+    ok, issues = verify_integrity(use_git_index=True)
+    assert ok is False
+    assert [i.path for i in issues] == ["pkg/b.py"]
+    assert calls == Counter({"pkg/b.py": 1})
+
+
+def test_strict_mode_ignores_git_index(repo):
+    _, calls = repo
+    verify_integrity(use_git_index=True)
+    calls.clear()
+    assert verify_integrity(strict=True, use_git_index=True) == (True, [])
+    assert sum(calls.values()) == 3
+
+
+def test_outside_a_work_tree_everything_is_hashed(tmp_path, monkeypatch):
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+    plain = tmp_path / "plain"
+    plain.mkdir()
+    (plain / "f.txt").write_text("x", encoding="utf-8")
+    assert clean_tracked_blobs(["f.txt"], cwd=plain) == {}
+
+
+@pytest.mark.parametrize("flag", ["--assume-unchanged", "--skip-worktree"])
+def test_flagged_files_are_never_trusted_from_the_index(repo, flag):
+    root, calls = repo
+    assert verify_integrity(use_git_index=True) == (True, [])
+    _git(root, "update-index", flag, "pkg/b.py")
+    assert set(clean_tracked_blobs(["pkg/a.py", "pkg/b.py", "c.txt"])) == {"pkg/a.py", "c.txt"}
+
+    (root / "pkg/b.py").write_bytes(b"b = 9\n")  # git status no longer reports this edit
+    assert "pkg/b.py" not in _git(root, "status", "--porcelain")
+    calls.clear()
+    ok, issues = verify_integrity(use_git_index=True)
+    assert ok is False
+    assert [i.path for i in issues] == ["pkg/b.py"]
+    assert calls == Counter({"pkg/b.py": 1})
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+import layer1_integrity_core.L1_integrity_core_stub as l1
+from layer1_integrity_core.L1_integrity_core_stub import run_integrity_check, verify_integrity
+
+
+def _age(p: Path, seconds: int = 60) -> None:
+    past = time.time_ns() - seconds * 1_000_000_000
+    os.utime(p, ns=(past, past))
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    files = []
+    for i in range(3):
+        f = tmp_path / f"f{i}.txt"
+        f.write_bytes(f"line-{i}\r\n".encode("utf-8"))
+        _age(f)
+        files.append(f)
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        json.dumps({"files": [{"path": str(f), "sha256": l1._hash_file(f)} for f in files]}),
+        encoding="utf-8",
+    )
+    cache_path = tmp_path / "cache" / "L1_hash_cache.json"
+    monkeypatch.setattr(l1, "L1_MANIFEST_PATH", manifest)
+    monkeypatch.setattr(l1, "L1_HASH_CACHE_PATH", cache_path)
+
+    calls: Counter = Counter()
+    real_hash = l1._hash_file
+
+    def counting_hash(p: Path) -> str:
+        calls[p.name] += 1
+        return real_hash(p)
+
+    monkeypatch.setattr(l1, "_hash_file", counting_hash)
+    return files, cache_path, calls
+
+
+def test_unchanged_files_are_served_from_cache(repo):
+    files, cache_path, calls = repo
+
+    assert verify_integrity() == (True, [])
+    assert sum(calls.values()) == 3
+    cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    assert cached["version"] == l1.L1_HASH_CACHE_VERSION
+    assert sorted(Path(k).name for k in cached["entries"]) == ["f0.txt", "f1.txt", "f2.txt"]
+
+    calls.clear()
+    assert verify_integrity() == (True, [])
+    status = run_integrity_check()
+    assert calls == Counter()
+    assert all(f.ok and f.actual_hash for f in status.files)
+
+
+def test_changed_signature_is_rehashed_and_detected(repo):
+    files, _, calls = repo
+    verify_integrity()
+    calls.clear()
+
+    files[1].write_bytes(b"tampered-content\n")
+    _age(files[1])
+    ok, issues = verify_integrity()
+    assert calls == Counter({"f1.txt": 1})
+    assert ok is False
+    assert [Path(i.path).name for i in issues] == ["f1.txt"]
+
+
+def test_strict_mode_bypasses_cache(repo):
+    files, cache_path, calls = repo
+    verify_integrity()
+    before = cache_path.read_bytes()
+    calls.clear()
+
+    # Same size and mtime: only a strict run can notice this rewrite.
+    st = files[0].stat()
+    files[0].write_bytes(b"LINE-0\r\n")
+    os.utime(files[0], ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert verify_integrity() == (True, [])
+    assert calls == Counter()
+
+    ok, issues = verify_integrity(strict=True)
+    assert calls == Counter({"f0.txt": 1, "f1.txt": 1, "f2.txt": 1})
+    assert ok is False and Path(issues[0].path).name == "f0.txt"
+    assert cache_path.read_bytes() == before
+
+
+def test_recently_modified_files_are_not_cached(repo):
+    files, cache_path, calls = repo
+    files[2].write_bytes(b"line-2\r\n")  # same content, fresh mtime
+    verify_integrity()
+    verify_integrity()
+    assert calls["f2.txt"] == 2
+    entries = json.loads(cache_path.read_text(encoding="utf-8"))["entries"]
+    assert sorted(Path(k).name for k in entries) == ["f0.txt", "f1.txt"]
+
+
+def test_corrupt_cache_is_ignored(repo):
+    _, cache_path, calls = repo
+    cache_path.parent.mkdir(parents=True)
+    cache_path.write_text("{not json", encoding="utf-8")
+    assert verify_integrity() == (True, [])
+    assert sum(calls.values()) == 3
+    assert json.loads(cache_path.read_text(encoding="utf-8"))["entries"]
+
+
+def test_cached_digest_matches_normalized_hash(repo):
+    files, cache_path, _ = repo
+    verify_integrity()
+    entries = json.loads(cache_path.read_text(encoding="utf-8"))["entries"]
+    digest = entries[os.path.abspath(files[0])]["sha256"]
+    assert digest == hashlib.sha256(b"line-0\n").hexdigest()
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import layer1_integrity_core.L1_hash_spine_stub as spine
+from layer1_integrity_core.chain.gus_chain_v4_stub import append_chain_event, verify_chain_stream
+from layer1_integrity_core.L1_hash_spine_stub import (
+    ChainAppender,
+    ChainLogCorruptError,
+    ChainLogLockedError,
+    ChainLogTornTailError,
+    ChainReader,
+    get_chain_index_path,
+)
+
+
+class _Ticker:
+    def __init__(self):
+        self.n = 0
+
+    def __call__(self) -> str:
+        self.n += 1
+        return f"2025-01-01T{self.n // 3600:02d}:{self.n // 60 % 60:02d}:{self.n % 60:02d}.000000+00:00"
+
+
+def _fill(path, n, **kw):
+    clock = _Ticker()
+    with ChainAppender(path, clock_utc=clock, **kw) as app:
+        for i in range(n):
+            app.append("TICK", {"i": i})
+    return clock
+
+
+def test_appended_log_verifies_and_index_is_sparse(tmp_path):
+    path = tmp_path / "chain.jsonl"
+    _fill(path, 100, index_stride=10, fsync_every=7)
+
+    result = verify_chain_stream(path)
+    assert result.ok and result.errors == [] and result.checkpoint.entries == 100
+
+    index = [json.loads(line) for line in get_chain_index_path(path).read_text(encoding="utf-8").splitlines()]
+    assert [r["entry"] for r in index] == list(range(1, 101, 10))
+    raw = path.read_bytes()
+    for r in index:
+        line = raw[r["offset"] :].split(b"\n", 1)[0]
+        assert json.loads(line)["event_id"] == f"GUSv4-L1-{r['entry']}"
+
+
+def test_fsync_batching(tmp_path, monkeypatch):
+    synced = []
+    real = spine.os.fsync
+    monkeypatch.setattr(spine.os, "fsync", lambda fd: synced.append(fd) or real(fd))
+    path = tmp_path / "chain.jsonl"
+    with ChainAppender(path, fsync_every=8, clock_utc=_Ticker()) as app:
+        for i in range(20):
+            app.append("TICK", {"i": i})
+        assert len(synced) == 2
+    assert len(synced) == 3  # close() flushes the remaining 4
+
+
+def test_reopen_continues_the_chain(tmp_path):
+    path = tmp_path / "chain.jsonl"
+    _fill(path, 25, index_stride=4)
+    with ChainAppender(path, index_stride=4) as app:
+        assert app.entries == 25
+        entry = app.append("TICK", {"i": 25})
+    assert entry["event_id"] == "GUSv4-L1-26"
+    assert entry["timestamp"] >= ChainReader(path).get(25)["timestamp"]
+    assert verify_chain_stream(path).checkpoint.entries == 26
+
+
+def test_torn_tail_and_lost_index_are_recovered(tmp_path):
+    path = tmp_path / "chain.jsonl"
+    _fill(path, 30, index_stride=8)
+    good = path.read_bytes()
+    with path.open("ab") as f:
+        f.write(b'{"chain_hash": "half')
+    get_chain_index_path(path).unlink()
+    torn = path.read_bytes()
+
+    with pytest.raises(ChainLogTornTailError):
+        ChainAppender(path, index_stride=8)
+    assert path.read_bytes() == torn  # fail closed: nothing truncated
+
+    with ChainAppender(path, index_stride=8, repair=True) as app:
+        assert app.entries == 30
+        assert path.read_bytes() == good
+        app.append("TICK", {"i": 30})
+    assert verify_chain_stream(path).ok
+    assert [r.entry for r in spine._load_index(get_chain_index_path(path))] == [1, 9, 17, 25]
+
+
+def test_reader_seeks_by_entry_and_timestamp(tmp_path, monkeypatch):
+    path = tmp_path / "chain.jsonl"
+    _fill(path, 500, index_stride=32)
+    reader = ChainReader(path)
+
+    parsed = []
+    real = json.loads
+    monkeypatch.setattr(spine.json, "loads", lambda s, *a, **k: parsed.append(1) or real(s, *a, **k))
+
+    assert reader.get(1)["payload"] == {"i": 0}
+    parsed.clear()
+    assert reader.get(437)["payload"] == {"i": 436}
+    assert len(parsed) <= 32 + 1 + 16  # one stride of lines + the index
+    assert reader.get(501) is None
+    with pytest.raises(ValueError):
+        reader.get(0)
+
+    ts = reader.get(300)["timestamp"]
+    parsed.clear()
+    since = reader.iter_since(ts)
+    assert [e["payload"]["i"] for e in (next(since), next(since))] == [299, 300]
+    assert len(parsed) <= 32 + 2 + 16
+    assert list(reader.iter_since("2100")) == []
+    assert sum(1 for _ in reader) == 500
+
+
+def test_stale_index_is_detected_and_rebuilt(tmp_path):
+    path = tmp_path / "chain.jsonl"
+    _fill(path, 40, index_stride=5)
+    stale = get_chain_index_path(path).read_bytes()
+
+    # the log is replaced (e.g. by a git checkout) but the untracked index stays behind
+    path.unlink()
+    get_chain_index_path(path).unlink()
+    clock = _Ticker()
+    clock.n = 1000
+    with ChainAppender(path, clock_utc=clock, index_stride=5) as app:
+        for i in range(30):
+            app.append("TICK", {"i": i, "pad": "x" * (i % 7)})
+    get_chain_index_path(path).write_bytes(stale)
+
+    reader = ChainReader(path)
+    assert reader.get(17)["event_id"] == "GUSv4-L1-17"
+    assert [e["payload"]["i"] for e in reader.iter_since(reader.get(26)["timestamp"])] == [25, 26, 27, 28, 29]
+
+    with ChainAppender(path, clock_utc=clock, index_stride=5) as app:
+        assert app.entries == 30
+        app.append("TICK", {"i": 30})
+    assert verify_chain_stream(path).ok
+    index = [json.loads(line) for line in get_chain_index_path(path).read_text(encoding="utf-8").splitlines()]
+    assert [r["entry"] for r in index] == list(range(1, 32, 5))
+    assert ChainReader(path).get(26)["event_id"] == "GUSv4-L1-26"
+
+
+def test_malformed_line_before_the_tail_is_a_named_error(tmp_path):
+    path = tmp_path / "chain.jsonl"
+    _fill(path, 10, index_stride=4)
+    lines = path.read_bytes().splitlines(keepends=True)
+    lines[5] = b"not json\n"
+    path.write_bytes(b"".join(lines))
+
+    for repair in (False, True):
+        with pytest.raises(ChainLogCorruptError, match="not a chain entry"):
+            ChainAppender(path, repair=repair)
+    with pytest.raises(ChainLogCorruptError):
+        ChainReader(path).get(8)
+    assert ChainReader(path).get(3)["payload"] == {"i": 2}
+
+
+def test_reader_follows_a_live_appender(tmp_path):
+    path = tmp_path / "chain.jsonl"
+    reader = ChainReader(path)
+    with ChainAppender(path, fsync_every=1000, index_stride=2, clock_utc=_Ticker()) as app:
+        app.append("TICK", {"i": 0})
+        assert reader.get(1) is None  # not flushed yet
+        app.flush()
+        assert reader.get(1)["payload"] == {"i": 0}
+        for i in range(1, 6):
+            app.append("TICK", {"i": i})
+        app.flush()
+        assert reader.get(6)["payload"] == {"i": 5}
+
+
+def test_append_chain_event_wrapper(tmp_path):
+    path = tmp_path / "chain.jsonl"
+    entry = append_chain_event("GENESIS_CORE_ONLINE", {"a": "–"}, note="n", path=path)
+    assert entry["prev_hash"] == "GENESIS-0" and entry["note"] == "n"
+    assert json.loads(path.read_text(encoding="utf-8")) == entry
+    assert verify_chain_stream(path).ok
+
+
+def test_second_appender_on_the_same_log_fails_fast(tmp_path):
+    path = tmp_path / "chain.jsonl"
+    with ChainAppender(path, clock_utc=_Ticker()) as app:
+        app.append("TICK", {"i": 0})
+        with pytest.raises(ChainLogLockedError):
+            ChainAppender(path)
+        with pytest.raises(ChainLogLockedError):
+            append_chain_event("TICK", {"i": 1}, path=path)
+        app.append("TICK", {"i": 1})
+    # lock released on close
+    append_chain_event("TICK", {"i": 2}, path=path)
+    result = verify_chain_stream(path)
+    assert result.ok and result.checkpoint.entries == 3
+
+
+def test_lock_is_exclusive_across_processes(tmp_path):
+    import subprocess
+    import sys
+
+    path = tmp_path / "chain.jsonl"
+    code = (
+        "import sys\n"
+        "from layer1_integrity_core.L1_hash_spine_stub import ChainAppender, ChainLogLockedError\n"
+        "try:\n"
+        "    ChainAppender(sys.argv[1])\n"
+        "except ChainLogLockedError:\n"
+        "    sys.exit(3)\n"
+    )
+    with ChainAppender(path):
+        cp = subprocess.run([sys.executable, "-c", code, str(path)], cwd=spine.BASE_DIR.parent)
+    assert cp.returncode == 3
+    cp = subprocess.run([sys.executable, "-c", code, str(path)], cwd=spine.BASE_DIR.parent)
+    assert cp.returncode == 0
+
+
+def test_append_chain_event_stub_is_side_effect_free(tmp_path, monkeypatch):
+    log = tmp_path / "tracked_log.txt"
+    log.write_text("", encoding="utf-8")
+    monkeypatch.setattr(spine, "CHAIN_LOG_FILE", log)
+    assert spine.append_chain_event_stub("hello") == log
+    assert log.read_text(encoding="utf-8") == ""
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["tracked_log.txt"]
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+import layer1_integrity_core.L1_integrity_core_stub as l1
+from layer1_integrity_core.L1_integrity_core_stub import load_integrity_status
+from layer1_integrity_core.L1_integrity_watcher import IntegrityWatcher
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    files = []
+    for i in range(3):
+        f = tmp_path / "src" / f"f{i}.txt"
+        f.parent.mkdir(exist_ok=True)
+        f.write_text(f"v{i}\n", encoding="utf-8")
+        files.append(f)
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(
+        json.dumps({"files": [{"path": str(f), "sha256": hashlib.sha256(f.read_bytes()).hexdigest()} for f in files]}),
+        encoding="utf-8",
+    )
+    status_path = tmp_path / "status.json"
+    monkeypatch.setattr(l1, "L1_MANIFEST_PATH", manifest)
+    monkeypatch.setattr(l1, "L1_STATUS_PATH", status_path)
+    monkeypatch.setattr(l1, "L1_HASH_CACHE_PATH", tmp_path / "cache.json")
+    return files, manifest, status_path
+
+
+def _step_until(watcher: IntegrityWatcher, pred, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        watcher.step(timeout=0.05)
+        if pred():
+            return
+    raise AssertionError("watcher did not observe the change in time")
+
+
+def _rewrite(p: Path, text: str) -> None:
+    p.write_text(text, encoding="utf-8")
+
+
+@pytest.mark.parametrize("use_inotify", [False, True])
+def test_watcher_rehashes_only_changed_files(tree, monkeypatch, use_inotify):
+    if use_inotify and not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux-only")
+    files, _, status_path = tree
+    events = []
+    watcher = IntegrityWatcher(on_change=events.append, poll_interval=0.02, use_inotify=use_inotify)
+    try:
+        if use_inotify:
+            assert watcher.backend_name == "inotify"
+        assert watcher.status().overall_ok is True
+        assert json.loads(status_path.read_text(encoding="utf-8"))["overall_ok"] is True
+
+        hashed = []
+        real_check = l1._check_entry
+        monkeypatch.setattr(l1, "_check_entry", lambda e, *a: hashed.append(Path(e["path"]).name) or real_check(e, *a))
+
+        _rewrite(files[1], "tampered\n")
+        _step_until(watcher, lambda: events)
+        assert set(hashed) == {"f1.txt"}
+        assert events[0].overall_ok_before is True and events[0].overall_ok is False
+        assert [Path(r.path).name for r in events[0].changed] == ["f1.txt"]
+        snap = json.loads(status_path.read_text(encoding="utf-8"))
+        assert snap["overall_ok"] is False
+        assert [f["ok"] for f in snap["files"]] == [True, False, True]
+
+        _rewrite(files[1], "v1\n")
+        _step_until(watcher, lambda: len(events) == 2)
+        assert events[1].overall_ok is True
+        assert watcher.status().overall_ok is True
+    finally:
+        watcher.stop()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_inotify_sees_truncate_and_unclosed_writes(tree):
+    files, _, _ = tree
+    events = []
+    watcher = IntegrityWatcher(on_change=events.append, poll_interval=0.02, use_inotify=True)
+    try:
+        assert watcher.backend_name == "inotify"
+        os.truncate(files[0], 0)
+        _step_until(watcher, lambda: events)
+        assert [Path(r.path).name for r in events[-1].changed] == ["f0.txt"]
+
+        with files[2].open("r+b") as f:  # no close before the check: no IN_CLOSE_WRITE
+            f.write(b"X")
+            f.flush()
+            _step_until(watcher, lambda: len(events) == 2)
+        assert [Path(r.path).name for r in events[-1].changed] == ["f2.txt"]
+        assert watcher.status().overall_ok is False
+    finally:
+        watcher.stop()
+
+
+def test_unchanged_content_rewrite_emits_no_event(tree):
+    files, _, _ = tree
+    events = []
+    watcher = IntegrityWatcher(on_change=events.append, poll_interval=0.02, use_inotify=False)
+    try:
+        time.sleep(0.01)
+        _rewrite(files[0], "v0\n")
+        for _ in range(5):
+            watcher.step(timeout=0.02)
+        assert events == []
+    finally:
+        watcher.stop()
+
+
+def test_manifest_change_triggers_full_recheck(tree):
+    files, manifest, _ = tree
+    events = []
+    watcher = IntegrityWatcher(on_change=events.append, poll_interval=0.02, use_inotify=False)
+    try:
+        data = json.loads(manifest.read_text(encoding="utf-8"))
+        data["files"] = data["files"][:2]
+        manifest.write_text(json.dumps(data), encoding="utf-8")
+        _step_until(watcher, lambda: len(watcher.status().files) == 2)
+        assert events and events[-1].overall_ok is True
+    finally:
+        watcher.stop()
+
+
+def test_load_integrity_status_is_live_while_started(tree):
+    files, _, status_path = tree
+    with IntegrityWatcher(poll_interval=0.02, use_inotify=False) as watcher:
+        status_path.write_text(json.dumps({"overall_ok": False, "files": []}), encoding="utf-8")  # stale snapshot
+        assert load_integrity_status() == watcher.status()
+        _rewrite(files[2], "changed\n")
+        deadline = time.monotonic() + 5
+        while load_integrity_status().overall_ok and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert load_integrity_status().overall_ok is False
+    assert l1._LIVE_STATUS_PROVIDER is None
+    assert load_integrity_status().overall_ok is False  # persisted by the watcher
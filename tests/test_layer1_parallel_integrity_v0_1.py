@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+
+import layer1_integrity_core.L1_integrity_core_stub as l1
+from layer1_integrity_core.L1_integrity_core_stub import verify_integrity
+
+
+def _write_manifest(tmp_path: Path, n: int, *, corrupt=(), missing=()) -> Path:
+    entries = []
+    for i in range(n):
+        f = tmp_path / f"f{i:03d}.txt"
+        f.write_text(f"file-{i}\n", encoding="utf-8")
+        digest = hashlib.sha256(f.read_bytes()).hexdigest()
+        if i in corrupt:
+            f.write_text("tampered\n", encoding="utf-8")
+        if i in missing:
+            f.unlink()
+        entries.append({"path": str(f), "sha256": digest})
+    entries.append({"path": str(tmp_path / "no_hash.txt")})
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({"files": entries}), encoding="utf-8")
+    return manifest
+
+
+def test_parallel_issues_are_in_manifest_order(tmp_path, monkeypatch):
+    manifest = _write_manifest(tmp_path, 40, corrupt={3, 17, 31}, missing={5, 22})
+    monkeypatch.setattr(l1, "L1_MANIFEST_PATH", manifest)
+
+    real_hash = l1._hash_file
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def slow_hash(p: Path) -> str:
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        # earlier files finish later, so completion order is reversed
+        time.sleep((40 - int(p.stem[1:])) * 0.0005)
+        try:
+            return real_hash(p)
+        finally:
+            with lock:
+                active["now"] -= 1
+
+    monkeypatch.setattr(l1, "_hash_file", slow_hash)
+
+    serial = verify_integrity(max_workers=1)
+    active["peak"] = 0
+    parallel = verify_integrity(max_workers=4)
+
+    assert parallel == serial
+    ok, issues = parallel
+    assert ok is False
+    assert [Path(i.path).name for i in issues] == [
+        "f003.txt",
+        "f005.txt",
+        "f017.txt",
+        "f022.txt",
+        "f031.txt",
+        "no_hash.txt",
+    ]
+    assert [i.reason.split(" ")[0] for i in issues] == ["hash", "missing", "hash", "missing", "hash", "manifest"]
+    assert 1 < active["peak"] <= 4
+
+
+def test_parallel_clean_manifest_verifies_ok(tmp_path, monkeypatch):
+    manifest = _write_manifest(tmp_path, 12)
+    data = json.loads(manifest.read_text(encoding="utf-8"))
+    data["files"] = data["files"][:-1]
+    manifest.write_text(json.dumps(data), encoding="utf-8")
+    monkeypatch.setattr(l1, "L1_MANIFEST_PATH", manifest)
+
+    assert verify_integrity() == (True, [])
+    assert verify_integrity(max_workers=1) == (True, [])
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import layer1_integrity_core.L1_integrity_core_stub as l1
+from layer1_integrity_core.L1_rebaseline import rebaseline, rebaseline_manifest
+from utils.canonical_json import canonical_json_line
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    for name in ("a.txt", "b.txt", "c.txt", "new.txt"):
+        (tmp_path / name).write_bytes(f"{name}\r\n".encode("utf-8"))
+    manifest = {
+        "files": [
+            {"path": "a.txt", "sha256": l1._hash_file(tmp_path / "a.txt")},
+            {"path": "b.txt", "sha256": "0" * 64},
+            {"path": "c.txt", "sha256": l1._hash_file(tmp_path / "c.txt")},
+        ],
+        "generated_at": "DETERMINISTIC",
+    }
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    monkeypatch.setattr(l1, "L1_MANIFEST_PATH", path)
+    return tmp_path, path, manifest
+
+
+def test_rebaseline_reports_changed_added_removed(tree):
+    root, _, manifest = tree
+    new, diff = rebaseline_manifest(manifest, add=["new.txt"], remove=["c.txt"], max_workers=4)
+
+    assert [e["path"] for e in new["files"]] == ["a.txt", "b.txt", "new.txt"]
+    assert new["generated_at"] == "DETERMINISTIC"
+    assert all(e["sha256"] == l1._hash_file(root / e["path"]) for e in new["files"])
+    assert diff.changed == [("b.txt", "0" * 64, l1._hash_file(root / "b.txt"))]
+    assert diff.added == [("new.txt", l1._hash_file(root / "new.txt"))]
+    assert [p for p, _ in diff.removed] == ["c.txt"]
+    assert [line[0] for line in diff.lines()] == ["~", "+", "-"]
+
+
+def test_rebaseline_writes_canonical_manifest_that_verifies(tree):
+    _, path, _ = tree
+    assert l1.verify_integrity(strict=True)[0] is False
+
+    diff = rebaseline(dry_run=True)
+    assert not diff.empty
+    assert json.loads(path.read_text(encoding="utf-8"))["files"][1]["sha256"] == "0" * 64
+
+    rebaseline()
+    raw = path.read_text(encoding="utf-8")
+    assert raw == canonical_json_line(json.loads(raw))
+    assert l1.verify_integrity(strict=True) == (True, [])
+    assert rebaseline().empty
+
+
+def test_rebaseline_fails_closed(tree):
+    root, path, manifest = tree
+    before = path.read_bytes()
+    (root / "a.txt").unlink()
+    with pytest.raises(FileNotFoundError, match="a.txt"):
+        rebaseline()
+    with pytest.raises(ValueError, match="zzz.txt"):
+        rebaseline_manifest(manifest, remove=["zzz.txt"])
+    assert path.read_bytes() == before
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import Counter
+from pathlib import Path
+
+import layer1_integrity_core.L1_integrity_core_stub as l1
+from layer1_integrity_core.L1_integrity_core_stub import run_integrity_check, verify_integrity
+
+
+def _setup(tmp_path: Path, monkeypatch) -> dict:
+    good = tmp_path / "good.txt"
+    good.write_text("good\n", encoding="utf-8")
+    bad = tmp_path / "bad.txt"
+    bad.write_text("bad\n", encoding="utf-8")
+    gone = tmp_path / "gone.txt"
+    manifest = tmp_path / "manifest.json"
+    hashes = {
+        "good": hashlib.sha256(b"good\n").hexdigest(),
+        "bad": hashlib.sha256(b"expected\n").hexdigest(),
+        "actual_bad": hashlib.sha256(b"bad\n").hexdigest(),
+    }
+    manifest.write_text(
+        json.dumps(
+            {
+                "files": [
+                    {"path": str(good), "sha256": hashes["good"]},
+                    {"path": str(bad), "sha256": hashes["bad"]},
+                    {"path": str(gone), "sha256": hashes["good"]},
+                    {"path": str(good)},
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(l1, "L1_MANIFEST_PATH", manifest)
+    return hashes
+
+
+def test_run_integrity_check_hashes_each_file_once(tmp_path, monkeypatch):
+    hashes = _setup(tmp_path, monkeypatch)
+
+    calls: Counter = Counter()
+    real_hash = l1._hash_file
+
+    def counting_hash(p: Path) -> str:
+        calls[p.name] += 1
+        return real_hash(p)
+
+    monkeypatch.setattr(l1, "_hash_file", counting_hash)
+
+    status = run_integrity_check(max_workers=1)
+    # good.txt appears in two manifest entries; bad.txt once; gone.txt never
+    assert calls == Counter({"good.txt": 2, "bad.txt": 1})
+
+    assert status.overall_ok is False
+    assert [(Path(f.path).name, f.ok, f.actual_hash) for f in status.files] == [
+        ("good.txt", True, hashes["good"]),
+        ("bad.txt", False, hashes["actual_bad"]),
+        ("gone.txt", False, None),
+        ("good.txt", False, hashes["good"]),
+    ]
+    assert [f.reason for f in status.files[2:]] == ["missing", "manifest entry missing path or sha256"]
+    assert status.files[1].reason == f"hash mismatch (expected={hashes['bad']}, actual={hashes['actual_bad']})"
+
+
+def test_verify_integrity_and_run_integrity_check_agree(tmp_path, monkeypatch):
+    _setup(tmp_path, monkeypatch)
+
+    ok, issues = verify_integrity()
+    status = run_integrity_check()
+    assert ok is status.overall_ok is False
+    assert [(i.path, i.reason) for i in issues] == [(f.path, f.reason) for f in status.files if not f.ok]
+
+
+def test_run_integrity_check_empty_manifest(tmp_path, monkeypatch):
+    monkeypatch.setattr(l1, "L1_MANIFEST_PATH", tmp_path / "none.json")
+    status = run_integrity_check()
+    assert status.overall_ok is False
+    assert status.files == []
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import hashlib
+import random
+from pathlib import Path
+
+import pytest
+
+import layer1_integrity_core.L1_integrity_core_stub as l1
+
+
+def _legacy_hash(data: bytes) -> str:
+    # Reference: the original whole-file implementation of _hash_file.
+    try:
+        txt = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return hashlib.sha256(data).hexdigest()
+    return hashlib.sha256(txt.replace("\r\n", "\n").encode("utf-8")).hexdigest()
+
+
+CASES = [
+    b"",
+    b"\r",
+    b"\n",
+    b"\r\n",
+    b"\r\r\n\n\r",
+    b"a\r\nb\rc\n",
+    "﻿BOM line\r\n".encode("utf-8"),
+    "é€😀\r\n".encode("utf-8") * 3,
+    "😀".encode("utf-8")[:3],  # truncated multi-byte at EOF -> binary
+    b"text\r\n\xff\xfe\r\n",  # invalid UTF-8 after CRLF -> binary (raw, not normalized)
+    "ok\r\n".encode("utf-8") + "\ud800".encode("utf-8", "surrogatepass"),  # encoded surrogate -> binary
+    bytes(range(256)),
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 1 << 20])
+@pytest.mark.parametrize("data", CASES)
+def test_streaming_hash_matches_legacy(tmp_path, monkeypatch, data, chunk_size):
+    monkeypatch.setattr(l1, "_HASH_CHUNK_SIZE", chunk_size)
+    p = tmp_path / "f.bin"
+    p.write_bytes(data)
+    assert l1._hash_file(p) == _legacy_hash(data)
+
+
+def test_streaming_hash_matches_legacy_randomized(tmp_path, monkeypatch):
+    rng = random.Random(4243)
+    alphabet = ["a", "\r", "\n", "\r\n", "é", "€", "😀", " "]
+    p = tmp_path / "f.txt"
+    for _ in range(200):
+        monkeypatch.setattr(l1, "_HASH_CHUNK_SIZE", rng.randint(1, 16))
+        data = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 64))).encode("utf-8")
+        if rng.random() < 0.2:
+            pos = rng.randint(0, len(data))
+            data = data[:pos] + bytes([rng.randint(0x80, 0xFF)]) + data[pos:]
+        p.write_bytes(data)
+        assert l1._hash_file(p) == _legacy_hash(data), data
+
+
+def test_repo_manifest_files_hash_identically(monkeypatch):
+    monkeypatch.setattr(l1, "_HASH_CHUNK_SIZE", 7)
+    for rel in ["layer1_integrity_core/L1_integrity_core_stub.py", "gus_engine_health.py"]:
+        p = Path(rel)
+        assert l1._hash_file(p) == _legacy_hash(p.read_bytes())
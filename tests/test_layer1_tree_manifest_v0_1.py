@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import copy
+import json
+import os
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+import layer1_integrity_core.L1_integrity_core_stub as l1
+import layer1_integrity_core.L1_tree_manifest as tm
+from layer1_integrity_core.chain import genesis_spine_stub as gs
+from layer1_integrity_core.L1_tree_manifest import (
+    build_tree,
+    check_tree_hashes,
+    diff_trees,
+    iter_tree_files,
+    tree_manifest_from_flat,
+    tree_root_hash_for_spine,
+    verify_tree_manifest,
+    write_tree_manifest,
+)
+
+H = {c: c * 64 for c in "abcdef"}
+
+
+@pytest.fixture(autouse=True)
+def _local_caches(tmp_path, monkeypatch):
+    monkeypatch.setattr(l1, "L1_HASH_CACHE_PATH", tmp_path / "cache.json")
+    monkeypatch.setattr(tm, "L1_TREE_STAT_CACHE_PATH", tmp_path / "tree_cache.json")
+
+
+def _age(path: Path) -> None:
+    old = path.stat().st_mtime_ns - 10 * l1._RACY_WINDOW_NS
+    os.utime(path, ns=(old, old))
+
+
+def _layout(tmp_path: Path) -> dict:
+    files = {
+        "a/x.txt": "x\r\n",
+        "a/b/y.txt": "y\n",
+        "a/b/c/z.txt": "z\n",
+        "d/w.txt": "w\n",
+        "top.txt": "t\n",
+    }
+    for rel, text in files.items():
+        p = tmp_path / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_bytes(text.encode("utf-8"))
+    flat = {"files": [{"path": rel, "sha256": l1._hash_file(tmp_path / rel)} for rel in files]}
+    return tree_manifest_from_flat(flat)
+
+
+def test_root_hash_is_order_independent_and_content_sensitive():
+    entries = [("a/x", H["a"]), ("a/b/y", H["b"]), ("z", H["c"])]
+    t1 = build_tree(entries)
+    t2 = build_tree(list(reversed(entries)))
+    assert t1 == t2
+    assert build_tree([("a/x", H["a"]), ("a/b/y", H["d"]), ("z", H["c"])])["hash"] != t1["hash"]
+    # moving a file changes the root even with identical digests
+    assert build_tree([("a/x", H["a"]), ("a/y", H["b"]), ("z", H["c"])])["hash"] != t1["hash"]
+    assert list(iter_tree_files(t1)) == [("z", H["c"]), ("a/x", H["a"]), ("a/b/y", H["b"])]
+
+
+@pytest.mark.parametrize("bad", ["/abs", "a/../b", "..", ""])
+def test_paths_must_be_relative_and_inside_the_tree(bad):
+    with pytest.raises(ValueError):
+        build_tree([(bad, H["a"])])
+
+
+def test_equivalent_path_spellings_share_a_leaf():
+    assert build_tree([("./a//b", H["a"])]) == build_tree([("a/b", H["a"])])
+
+
+def test_file_directory_conflicts_are_rejected():
+    with pytest.raises(ValueError):
+        build_tree([("a", H["a"]), ("a/b", H["b"])])
+    with pytest.raises(ValueError):
+        build_tree([("a", H["a"]), ("a", H["b"])])
+
+
+def test_diff_descends_only_into_changed_subtrees():
+    base = [(f"d{i}/s{j}/f{k}", H["a"]) for i in range(4) for j in range(4) for k in range(4)]
+    expected = build_tree(base)
+    changed = [(p, H["b"] if p == "d2/s1/f3" else h) for p, h in base]
+    diff = diff_trees(expected, build_tree(changed))
+    assert diff.changes == [("d2/s1/f3", H["a"], H["b"])]
+    assert diff.dirs_visited == 3  # root, d2, d2/s1
+    assert diff_trees(expected, expected).dirs_visited == 0
+
+
+def test_verify_tree_manifest(tmp_path):
+    tree = _layout(tmp_path)
+    write_tree_manifest(tmp_path / "tree.json", tree)
+    assert json.loads((tmp_path / "tree.json").read_text(encoding="utf-8")) == tree
+    assert check_tree_hashes(tree) == []
+
+    assert verify_tree_manifest(tree, base=tmp_path) == (True, [])
+
+    (tmp_path / "a/b/y.txt").write_text("tampered\n", encoding="utf-8")
+    (tmp_path / "d/w.txt").unlink()
+    ok, issues = verify_tree_manifest(tree, base=tmp_path, strict=True)
+    assert ok is False
+    assert [(i.path, i.reason.split(" ")[0]) for i in issues] == [("a/b/y.txt", "hash"), ("d/w.txt", "missing")]
+
+
+def test_verify_hashes_only_files_under_changed_directories(tmp_path, monkeypatch):
+    root = tmp_path / "w"
+    flat = []
+    for d in ("d0", "d1", "d2/sub", "d3"):
+        for k in range(5):
+            p = root / d / f"f{k}.txt"
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_text(f"{d} {k}\n", encoding="utf-8")
+            _age(p)
+            flat.append({"path": f"{d}/f{k}.txt", "sha256": l1._hash_file(p)})
+    tree = tree_manifest_from_flat({"files": flat})
+
+    hashed: Counter = Counter()
+    checked = []
+    real_hash, real_check = l1._hash_file, l1._check_entries
+    monkeypatch.setattr(l1, "_hash_file", lambda p, *tee: hashed.update([Path(p).relative_to(root).as_posix()]) or real_hash(p, *tee))
+    monkeypatch.setattr(l1, "_check_entries", lambda files, **kw: checked.extend(files) or real_check(files, **kw))
+
+    assert verify_tree_manifest(tree, base=root) == (True, [])
+    assert sum(hashed.values()) == 20
+
+    hashed.clear()
+    checked.clear()
+    assert verify_tree_manifest(tree, base=root) == (True, [])
+    assert hashed == Counter() and checked == []  # every subtree skipped on stat signatures
+
+    changed = root / "d2/sub/f3.txt"
+    changed.write_text("tampered!\n", encoding="utf-8")
+    _age(changed)
+    hashed.clear()
+    checked.clear()
+    ok, issues = verify_tree_manifest(tree, base=root)
+    assert ok is False and [i.path for i in issues] == ["d2/sub/f3.txt"]
+    assert hashed == Counter({"d2/sub/f3.txt": 1})
+    assert sorted(Path(e["path"]).relative_to(root).parent.as_posix() for e in checked) == ["d2/sub"] * 5
+
+    # a failing subtree is never cached as verified: it is re-checked every run
+    checked.clear()
+    assert verify_tree_manifest(tree, base=root)[0] is False
+    assert len(checked) == 5
+
+    hashed.clear()
+    assert verify_tree_manifest(tree, base=root, strict=True)[0] is False
+    assert sum(hashed.values()) == 20
+
+
+def test_partial_tree_verify_keeps_the_shared_hash_cache(tmp_path):
+    flat = []
+    for d in ("d0", "d1"):
+        for k in range(3):
+            p = tmp_path / d / f"f{k}.txt"
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_text(f"{d} {k}\n", encoding="utf-8")
+            _age(p)
+            flat.append({"path": f"{d}/f{k}.txt", "sha256": l1._hash_file(p)})
+    tree = tree_manifest_from_flat({"files": flat})
+    l1._check_entries([{"path": str(tmp_path / e["path"]), "sha256": e["sha256"]} for e in flat])
+
+    def cached() -> set:
+        return set(json.loads(l1.L1_HASH_CACHE_PATH.read_text(encoding="utf-8"))["entries"])
+
+    assert len(cached()) == 6
+    assert verify_tree_manifest(tree, base=tmp_path) == (True, [])
+    changed = tmp_path / "d1/f0.txt"
+    changed.write_text("tampered\n", encoding="utf-8")
+    _age(changed)
+    assert verify_tree_manifest(tree, base=tmp_path)[0] is False  # checks d1/ only
+    assert len(cached()) == 6
+
+
+def test_tampered_tree_manifest_fails_closed(tmp_path):
+    tree = _layout(tmp_path)
+    bad = copy.deepcopy(tree)
+    bad["root"]["dirs"]["a"]["files"]["x.txt"] = H["f"]
+    ok, issues = verify_tree_manifest(bad, base=tmp_path)
+    assert ok is False
+    assert [i.path for i in issues] == ["a/"]
+    assert all(i.reason == "tree manifest directory hash mismatch" for i in issues)
+
+
+def test_repo_baseline_tree_root_can_anchor_the_genesis_spine():
+    root_hash = tree_root_hash_for_spine(gs.LAYER_MANIFESTS["L1"])
+    flat = json.loads(gs.LAYER_MANIFESTS["L1"].read_text(encoding="utf-8"))
+    assert root_hash == tree_manifest_from_flat(flat)["root_hash"]
+
+    spine = gs.compute_l0_l1_l2_spine({"L1": root_hash})
+    assert spine[1]["manifest_hash"] == root_hash
+    assert spine[0] == gs.compute_l0_l1_l2_spine()[0]
+    assert gs.get_genesis_hash({"L1": root_hash}) == spine[-1]["chain_hash"] != gs.get_genesis_hash()
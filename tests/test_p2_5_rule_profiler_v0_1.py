@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import json
+
+from layer10_policy_verdict.policy_rules_v0_1 import RuleContext
+from layer10_policy_verdict.policy_verdict_engine_v0_1 import PolicyVerdictEngine
+from layer9_policy_verdict.src.policy_engine import evaluate_policy
+from layer9_policy_verdict.src.ruleset import apply_ruleset_v1
+from utils.rule_profiler import RuleProfiler
+
+
+def test_l10_profiler_counts_calls_and_hits_without_changing_verdict():
+    prof = RuleProfiler()
+    plain = PolicyVerdictEngine()
+    profiled = PolicyVerdictEngine(profiler=prof)
+
+    contexts = [
+        RuleContext(action_id="A", actor_id="X", inputs={}),
+        RuleContext(action_id="A", actor_id="X", inputs={"deny": True}),
+        RuleContext(action_id="A", actor_id="X", inputs={"action": "do", "target": "t"}),
+    ]
+    for ctx in contexts:
+        assert profiled.evaluate(ctx).to_dict() == plain.evaluate(ctx).to_dict()
+
+    abstain = prof.get(scope="L10", rule_id="PV-RULE-ABSTAIN-EMPTY")
+    deny = prof.get(scope="L10", rule_id="PV-RULE-DENY-EXPLICIT")
+    assert abstain is not None and abstain.calls == 3 and abstain.hits == 1
+    assert deny is not None and deny.calls == 3 and deny.hits == 1
+    assert deny.total_ns >= 0
+
+
+def test_l9_profiler_records_rules_and_exports_canonical_json():
+    prof = RuleProfiler()
+    action = {"type": "merge_pr", "target": "main"}
+    context = {"actor": "JHO", "checks": "green"}
+
+    assert apply_ruleset_v1(action=action, context=context, profiler=prof) == apply_ruleset_v1(
+        action=action, context=context
+    )
+    evaluate_policy(
+        action=action,
+        context=context,
+        policy={"policy_id": "P", "thresholds": {"allow": 9.7, "warn": 8.5}},
+        epoch_ref="e",
+        chain_head="h",
+        profiler=prof,
+    )
+
+    out = json.loads(prof.export_json())
+    l9 = out["scopes"]["L9"]
+    assert l9["R1_CHECKS_GREEN"]["calls"] == 2
+    assert l9["R1_CHECKS_GREEN"]["hits"] == 2
+    assert l9["R2_MAIN_TARGET_GUARD"]["hits"] == 0
+    assert prof.export_json() == json.dumps(out, sort_keys=True, separators=(",", ":"))
+
+    prof.reset()
+    assert prof.to_dict()["scopes"] == {}
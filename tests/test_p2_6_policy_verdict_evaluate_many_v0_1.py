@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from layer10_policy_verdict.policy_rules_v0_1 import RuleContext
+from layer10_policy_verdict.policy_verdict_engine_v0_1 import PolicyVerdictEngine
+from utils.rule_profiler import RuleProfiler
+
+
+def _contexts():
+    return [
+        RuleContext(action_id="A", actor_id="X", inputs={}),
+        RuleContext(action_id="A", actor_id="X", inputs={"deny": True}),
+        RuleContext(action_id="A", actor_id="X", inputs={"action": "do", "target": "t"}),
+        RuleContext(action_id="B", actor_id="Y", inputs={"deny": True}),
+        RuleContext(action_id="A", actor_id="X", inputs={"action": "do"}),
+        RuleContext(action_id="C", actor_id="Z", inputs={}),
+    ]
+
+
+def test_evaluate_many_matches_serial_evaluate_in_order():
+    eng = PolicyVerdictEngine()
+    ctxs = _contexts()
+    batch = eng.evaluate_many(ctxs)
+    assert [v.to_dict() for v in batch] == [eng.evaluate(c).to_dict() for c in ctxs]
+
+
+def test_evaluate_many_shares_identical_outcomes():
+    eng = PolicyVerdictEngine()
+    out = eng.evaluate_many(_contexts())
+    # same rule outcomes -> same combined verdict instance
+    assert out[1] is out[3]
+    assert out[0] is out[5]
+    assert out[0] is not out[1]
+    assert eng.evaluate_many([]) == []
+
+
+def test_evaluate_many_profiles_per_rule():
+    prof = RuleProfiler()
+    eng = PolicyVerdictEngine(profiler=prof)
+    eng.evaluate_many(_contexts())
+    st = prof.get(scope="L10", rule_id="PV-RULE-DENY-EXPLICIT")
+    assert st is not None and st.calls == 6 and st.hits == 2
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import pytest
+
+from layer10_policy_verdict.policy_rules_v0_1 import (
+    RuleAbstainOnEmptyInputs,
+    RuleContext,
+    RuleDenyExplicitFlag,
+    RuleWarnMissingRequiredKeys,
+)
+from layer10_policy_verdict.policy_verdict_engine_v0_1 import PolicyVerdictEngine
+
+
+def test_constant_outcomes_are_shared_and_read_only():
+    r = RuleDenyExplicitFlag()
+    v1 = r.evaluate(RuleContext(action_id="A", actor_id="X", inputs={"deny": True}))
+    v2 = r.evaluate(RuleContext(action_id="B", actor_id="Y", inputs={"deny": 1}))
+    assert v1 is v2
+    with pytest.raises(TypeError):
+        v1.metadata["deny_flag"] = False  # type: ignore[index]
+
+    a = RuleAbstainOnEmptyInputs()
+    assert a.evaluate(RuleContext(action_id="A", actor_id="X", inputs={})) is a.evaluate(
+        RuleContext(action_id="Z", actor_id="Z", inputs={})
+    )
+
+
+def test_flyweights_respect_rule_identity_and_wire_shape():
+    v_default = RuleDenyExplicitFlag().evaluate(RuleContext(action_id="A", actor_id="X", inputs={"deny": True}))
+    v_custom = RuleDenyExplicitFlag(rule_id="CUSTOM").evaluate(
+        RuleContext(action_id="A", actor_id="X", inputs={"deny": True})
+    )
+    assert v_custom is not v_default
+    assert v_custom.rule_hits[0].rule_id == "CUSTOM"
+
+    ctx = RuleContext(action_id="A", actor_id="X", inputs={"action": "do", "target": "t", "deny": True})
+    d = PolicyVerdictEngine().evaluate(ctx).to_dict()
+    assert type(d["metadata"]) is dict
+    assert d["metadata"] == {"deny_flag": True}
+
+
+def test_missing_keys_rule_hit_is_shared_but_metadata_is_fresh():
+    r = RuleWarnMissingRequiredKeys()
+    v1 = r.evaluate(RuleContext(action_id="A", actor_id="X", inputs={"action": "do"}))
+    v2 = r.evaluate(RuleContext(action_id="A", actor_id="X", inputs={"action": "do"}))
+    assert v1.rule_hits[0] is v2.rule_hits[0]
+    assert v1.metadata is not v2.metadata
+    assert v1.metadata["missing_keys"] == ["target"]
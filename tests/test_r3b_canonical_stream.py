@@ -0,0 +1,95 @@
+import hashlib
+
+import pytest
+
+from utils.canonical_json import (
+    canonical_json_bytes,
+    canonical_raw,
+    canonical_sha256_hex,
+    canonical_stream,
+)
+from layer8_execution.execution_record_v0_1 import ExecutionRequest
+from layer8_execution.execution_runtime_v0_1 import ExecutionRuntimeV0_1, _hash_str, _stable_json
+from layer10_policy_verdict.verdict_types_v0_1 import VerdictCode
+
+
+def _samples():
+    return [
+        {},
+        [],
+        {"b": 1, "a": [1.5, -0.0, 1e300, True, False, None, "é\n "], "c": {"z": (), "y": {}}},
+        ("x", {"k": VerdictCode.DENY}, [[[]]], 10**30),
+        {"big": ["x" * 70_000] * 3},
+        {1: "non-str key", 2: None},
+    ]
+
+
+@pytest.mark.parametrize("obj", _samples())
+def test_stream_bytes_identical_to_canonical_json_bytes(obj):
+    chunks = []
+    canonical_stream(obj, chunks.append)
+    assert b"".join(chunks) == canonical_json_bytes(obj)
+    assert canonical_sha256_hex(obj) == hashlib.sha256(canonical_json_bytes(obj)).hexdigest()
+
+
+def test_raw_fragments_are_spliced_verbatim():
+    inner = {"events": [{"seq": i, "payload": {"v": "é" * i}} for i in range(50)]}
+    raw = canonical_raw(inner)
+    assert raw.data == canonical_json_bytes(inner)
+    assert canonical_sha256_hex({"a": raw, "b": [raw]}) == canonical_sha256_hex({"a": inner, "b": [inner]})
+
+
+def test_stream_rejects_non_serializable_like_json():
+    with pytest.raises(TypeError):
+        canonical_sha256_hex({"x": object()})
+
+
+def test_record_hashes_match_reference_with_side_effect_events():
+    rt = ExecutionRuntimeV0_1()
+    req = ExecutionRequest(
+        decision_id="d1", verdict="ALLOW", authorized_action="NOOP", parameters={}, decision_hash="H1"
+    )
+    events = tuple(
+        {"seq": i, "timestamp_utc": "t", "channel": "log", "payload": {"m": "é" * i}, "action_id": "A", "run_id": "R"}
+        for i in range(1, 200)
+    )
+    pv = {"code": "ALLOW", "metadata": {"k": [1, 2]}}
+    rec = rt._record(
+        req, status="SUCCESS", note="n", side_effect_events=events, declared_channels=("log",), policy_verdict=pv
+    )
+
+    execution_hash = _hash_str(
+        _stable_json(
+            {
+                "decision_hash": "H1",
+                "status": "SUCCESS",
+                "action": "NOOP",
+                "timestamp_utc": rec.result.timestamp_utc,
+                "note": "n",
+                "side_effect_events": events,
+                "policy_verdict": pv,
+            }
+        )
+    )
+    assert rec.result.execution_hash == execution_hash
+    assert rec.execution_id == _hash_str(_stable_json({"decision_id": "d1", "execution_hash": execution_hash}))
+    assert rec.record_hash == _hash_str(
+        _stable_json(
+            {
+                "execution_id": rec.execution_id,
+                "decision_hash": "H1",
+                "result": {
+                    "status": "SUCCESS",
+                    "timestamp_utc": rec.result.timestamp_utc,
+                    "execution_hash": execution_hash,
+                    "note": "n",
+                    "declared_channels": ("log",),
+                    "emitted_channels": ("log",),
+                    "emitted_count": len(events),
+                },
+                "audit_trace": rec.audit_trace,
+                "side_effect_events": events,
+                "policy_verdict": pv,
+            }
+        )
+    )
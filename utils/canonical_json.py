@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import tempfile
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Callable, Dict, Iterable, Union
 
 
 # Canonical JSON rules (contract):
@@ -36,23 +38,122 @@ def canonical_json_line(obj: Any) -> str:
     return canonical_dumps(obj) + "\n"
 
 
-def write_canonical_json_file(path: Union[str, Path], obj: Any) -> None:
+# ---------------------------------------------------------------------------
+# Streaming canonical encoder
+#
+# Produces exactly the bytes of canonical_json_bytes(obj), but writes them
+# incrementally to a sink (e.g. hashlib's update) instead of building the full
+# string. Already-encoded fragments (CanonicalRaw) are spliced in verbatim, so
+# large sub-objects can be serialized once and reused across several hashes.
+# ---------------------------------------------------------------------------
+
+_SCALAR_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+_FLUSH_BYTES = 64 * 1024
+
+
+class CanonicalRaw:
+    """Pre-encoded canonical JSON fragment; spliced verbatim by the streaming encoder."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+class _CanonicalWriter:
+    __slots__ = ("_sink", "_buf")
+
+    def __init__(self, sink: Callable[[bytes], Any]) -> None:
+        self._sink = sink
+        self._buf = bytearray()
+
+    def text(self, s: str) -> None:
+        self._buf += s.encode("ascii")  # ensure_ascii=True output is pure ASCII
+        if len(self._buf) >= _FLUSH_BYTES:
+            self.flush()
+
+    def raw(self, data: bytes) -> None:
+        if len(data) >= _FLUSH_BYTES:
+            self.flush()
+            self._sink(data)
+        else:
+            self._buf += data
+
+    def flush(self) -> None:
+        if self._buf:
+            self._sink(bytes(self._buf))
+            self._buf.clear()
+
+    def value(self, obj: Any) -> None:
+        if isinstance(obj, CanonicalRaw):
+            self.raw(obj.data)
+        elif isinstance(obj, str):
+            self.text(encode_basestring_ascii(obj))
+        elif obj is None or isinstance(obj, (bool, int, float)):
+            self.text(_SCALAR_ENCODER.encode(obj))
+        elif isinstance(obj, dict) and all(isinstance(k, str) for k in obj):
+            self.text("{")
+            first = True
+            for k in sorted(obj):
+                if not first:
+                    self.text(",")
+                first = False
+                self.text(encode_basestring_ascii(k))
+                self.text(":")
+                self.value(obj[k])
+            self.text("}")
+        elif isinstance(obj, (list, tuple)):
+            self.text("[")
+            first = True
+            for item in obj:
+                if not first:
+                    self.text(",")
+                first = False
+                self.value(item)
+            self.text("]")
+        else:
+            # Non-str dict keys / unknown types: defer to json for exact semantics
+            # (including its TypeError for non-serializable objects).
+            self.text(canonical_dumps(obj))
+
+
+def canonical_stream(obj: Any, sink: Callable[[bytes], Any]) -> None:
+    """Write canonical_json_bytes(obj) to sink in chunks (no full-size string)."""
+    w = _CanonicalWriter(sink)
+    w.value(obj)
+    w.flush()
+
+
+def canonical_raw(obj: Any) -> CanonicalRaw:
+    """Encode obj once as a reusable canonical fragment."""
+    buf = bytearray()
+    canonical_stream(obj, buf.extend)
+    return CanonicalRaw(bytes(buf))
+
+
+def canonical_sha256_hex(obj: Any) -> str:
+    """sha256(canonical_json_bytes(obj)).hexdigest(), streamed into the hash."""
+    h = hashlib.sha256()
+    canonical_stream(obj, h.update)
+    return h.hexdigest()
+
+
+def _atomic_write_text(path: Union[str, Path], chunks: Iterable[str]) -> None:
     """
-    Deterministic on-disk JSON artifact:
-    - UTF-8
-    - newline normalization to LF
-    - atomic replace (same filesystem)
-    - EXACTLY one trailing newline
+    The single atomic writer for canonical artifacts: chunks are streamed to
+    a temp file in the target directory, fsynced, then os.replace()d in.
     """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    payload = canonical_json_line(obj)
-
     fd, tmp_name = tempfile.mkstemp(prefix=path.name + ".", dir=str(path.parent))
     try:
         with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
-            f.write(payload)
+            for chunk in chunks:
+                f.write(chunk)
             f.flush()
             os.fsync(f.fileno())
         os.replace(tmp_name, path)
@@ -65,6 +166,25 @@ def write_canonical_json_file(path: Union[str, Path], obj: Any) -> None:
             pass
 
 
+def write_canonical_json_file(path: Union[str, Path], obj: Any) -> None:
+    """
+    Deterministic on-disk JSON artifact:
+    - UTF-8
+    - newline normalization to LF
+    - atomic replace (same filesystem)
+    - EXACTLY one trailing newline
+    """
+    _atomic_write_text(path, (canonical_json_line(obj),))
+
+
+def write_canonical_jsonl_file(path: Union[str, Path], objs: Iterable[Any]) -> None:
+    """
+    Deterministic on-disk JSONL artifact: one canonical line per object,
+    streamed (objs may be a generator), same atomic-replace guarantees.
+    """
+    _atomic_write_text(path, (canonical_json_line(obj) for obj in objs))
+
+
 def to_jsonable_dict(obj: Any) -> Dict[str, Any]:
     """
     Fail-closed conversion:
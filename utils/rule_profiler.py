@@ -0,0 +1,82 @@
+"""
+GUS v4 – Rule Profiler (per-rule timing + hit-rate instrumentation)
+
+Optional, in-process registry used by the policy engines (L9 ruleset, L10
+PolicyVerdictEngine) to record, per rule:
+  - calls:    how many times the rule was evaluated
+  - hits:     how many times it fired (returned a result)
+  - total_ns: cumulative wall time spent inside the rule (perf_counter_ns)
+
+Design:
+- Observational only: profiling never changes verdicts or hashes.
+- Disabled by default: engines only pay for timing when a profiler is passed.
+- Export is canonical JSON (utils.canonical_json), keyed by scope -> rule_id.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
+from utils.canonical_json import canonical_dumps
+
+
+@dataclass
+class RuleStats:
+    calls: int = 0
+    hits: int = 0
+    total_ns: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "hits": self.hits,
+            "total_ns": self.total_ns,
+            "hit_rate": (self.hits / self.calls) if self.calls else 0.0,
+            "mean_ns": (self.total_ns // self.calls) if self.calls else 0,
+        }
+
+
+class RuleProfiler:
+    """
+    Thread-safe per-rule stats registry.
+
+    scope groups rules by engine (e.g. "L9", "L10") so rule ids from
+    different engines never collide.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], RuleStats] = {}
+
+    def record(self, *, scope: str, rule_id: str, hit: bool, elapsed_ns: int) -> None:
+        key = (scope, rule_id)
+        with self._lock:
+            st = self._stats.get(key)
+            if st is None:
+                st = self._stats[key] = RuleStats()
+            st.calls += 1
+            if hit:
+                st.hits += 1
+            st.total_ns += int(elapsed_ns)
+
+    def get(self, *, scope: str, rule_id: str) -> RuleStats | None:
+        with self._lock:
+            st = self._stats.get((scope, rule_id))
+            return None if st is None else RuleStats(st.calls, st.hits, st.total_ns)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        out: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for (scope, rule_id), st in self._stats.items():
+                out.setdefault(scope, {})[rule_id] = st.to_dict()
+        return {"profile_version": "0.1", "scopes": out}
+
+    def export_json(self) -> str:
+        """Canonical JSON export (sorted keys, minified, no trailing newline)."""
+        return canonical_dumps(self.to_dict())